@@ -6,6 +6,11 @@ Women Safety Platform
 import sys
 import traceback
 
+# Installed first so it sees every import below (PYRAKSHA_TRACE_STARTUP=1)
+from src.utils.startup_tracer import StartupTracer
+
+StartupTracer.install_from_env()
+
 try:
     from src.app import PyRakshaApp
 
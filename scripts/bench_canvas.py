@@ -0,0 +1,258 @@
+"""Count canvas instructions allocated by the custom widgets per layout pass.
+
+Compares the widgets as they are now (CanvasReuseMixin) with the code
+they replaced, which cleared ``canvas.before`` and built new instructions
+on every pos/size change and every press. Kivy's graphics classes are
+replaced by counting stand-ins (scripts/kivy_stub.py), so no window is
+needed; the numbers are instruction constructions, not frame times.
+
+Passes:
+  resize  the parent layout moves and resizes the widget (window resize)
+  scroll  only the position changes (list scroll)
+  press   on_press then on_release (buttons)
+  focus   focus in and out, then an edit (inputs)
+
+    python scripts/bench_canvas.py [--passes 1000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import kivy_stub  # noqa: E402
+
+kivy_stub.install()
+
+from kivy.core.text import Label as CoreLabel  # noqa: E402
+from kivy.graphics import Color, Ellipse, Line, Rectangle  # noqa: E402
+from kivy.graphics import RoundedRectangle  # noqa: E402
+from kivy.uix.boxlayout import BoxLayout  # noqa: E402
+from kivy.uix.button import Button  # noqa: E402
+from kivy.uix.textinput import TextInput  # noqa: E402
+
+from src.core.theme import Theme  # noqa: E402
+from src.ui.components.complaint_card import ComplaintCardView  # noqa: E402
+from src.ui.components.custom_button import CustomButton  # noqa: E402
+from src.ui.components.custom_input import CustomInput  # noqa: E402
+from src.ui.components.location_display import LocationDisplay  # noqa: E402
+from src.ui.components.sos_button import SOSButton  # noqa: E402
+
+
+# --- The canvas code as it was before CanvasReuseMixin ----------------------
+
+
+class LegacyButton(Button):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._bg_color = Theme.primary
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self._update_canvas()
+
+    def _update_canvas(self, *args):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            Color(*self._bg_color)
+            RoundedRectangle(
+                pos=self.pos, size=self.size, radius=[Theme.button_radius]
+            )
+
+    def on_press(self):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            darker = [c * 0.8 for c in self._bg_color[:3]] + [self._bg_color[3]]
+            Color(*darker)
+            RoundedRectangle(
+                pos=self.pos, size=self.size, radius=[Theme.button_radius]
+            )
+
+    def on_release(self):
+        self._update_canvas()
+
+
+class LegacySOSButton(Button):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self._update_canvas()
+
+    def _update_canvas(self, *args):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            Color(*Theme.danger)
+            Ellipse(pos=self.pos, size=self.size)
+
+    def on_press(self):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            darker = [c * 0.7 for c in Theme.danger[:3]] + [Theme.danger[3]]
+            Color(*darker)
+            Ellipse(pos=self.pos, size=self.size)
+
+    def on_release(self):
+        self._update_canvas()
+
+
+class LegacyPanel(BoxLayout):
+    """ComplaintCard and LocationDisplay drew the same background."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self._update_canvas()
+
+    def _update_canvas(self, *args):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            Color(*Theme.surface_elevated)
+            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
+
+
+class LegacyInput(TextInput):
+    def __init__(self, hint_text: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self.hint_text = hint_text
+        self.font_size = Theme.font_size_md
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self.bind(text=self._update_canvas)
+        self.bind(focus=self._update_canvas)
+        self._update_canvas()
+
+    def _update_canvas(self, *args):
+        self.canvas.before.clear()
+        self.canvas.after.clear()
+
+        with self.canvas.before:
+            Color(*Theme.surface_elevated)
+            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
+            if self.focus:
+                Color(*Theme.accent)
+                Line(
+                    rounded_rectangle=(
+                        self.x,
+                        self.y,
+                        self.width,
+                        self.height,
+                        Theme.card_radius,
+                    ),
+                    width=2,
+                )
+
+        if self.focus:
+            return
+        with self.canvas.after:
+            if self.text:
+                Color(*Theme.text_primary)
+                display_text = "*" * len(self.text) if self.password else self.text
+            else:
+                Color(*Theme.text_secondary)
+                display_text = self.hint_text
+            label = CoreLabel(text=display_text, font_size=self.font_size)
+            label.refresh()
+            texture = label.texture
+            Rectangle(
+                texture=texture,
+                size=texture.size,
+                pos=(
+                    self.x + Theme.spacing_md,
+                    self.y + (self.height - texture.height) / 2,
+                ),
+            )
+
+
+# --- Passes -------------------------------------------------------------------
+
+
+def _resize(widget, index: int) -> None:
+    widget.pos = (index % 7, index % 11)
+    widget.size = (300 + index % 5, 60 + index % 3)
+
+
+def _scroll(widget, index: int) -> None:
+    widget.pos = (widget.pos[0], index)
+
+
+def _press(widget, index: int) -> None:
+    widget.on_press()
+    widget.on_release()
+
+
+def _focus(widget, index: int) -> None:
+    widget.focus = True
+    widget.text = f"user{index}@example.com"
+    widget.focus = False
+
+
+Pass = Callable[[object, int], None]
+
+CASES: List[Tuple[str, Callable, Callable, Tuple[Tuple[str, Pass], ...]]] = [
+    (
+        "CustomButton",
+        LegacyButton,
+        lambda: CustomButton(text="Submit"),
+        (("resize", _resize), ("scroll", _scroll), ("press", _press)),
+    ),
+    (
+        "SOSButton",
+        LegacySOSButton,
+        SOSButton,
+        (("resize", _resize), ("press", _press)),
+    ),
+    (
+        "ComplaintCardView",
+        LegacyPanel,
+        ComplaintCardView,
+        (("resize", _resize), ("scroll", _scroll)),
+    ),
+    (
+        "LocationDisplay",
+        LegacyPanel,
+        LocationDisplay,
+        (("resize", _resize),),
+    ),
+    (
+        "CustomInput",
+        lambda: LegacyInput(hint_text="Email"),
+        lambda: CustomInput(hint_text="Email"),
+        (("resize", _resize), ("scroll", _scroll), ("focus", _focus)),
+    ),
+]
+
+_INSTRUCTIONS = ("Color", "Rectangle", "RoundedRectangle", "Ellipse", "Line")
+
+
+def count(factory: Callable, run: Pass, passes: int) -> Dict[str, int]:
+    """Instructions and textures allocated by ``passes`` runs, after setup."""
+    widget = factory()
+    kivy_stub.reset_counts()
+    for index in range(1, passes + 1):
+        run(widget, index)
+    allocated = kivy_stub.allocations
+    return {
+        "instructions": sum(allocated[name] for name in _INSTRUCTIONS),
+        "textures": allocated["Texture"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passes", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Allocations over {args.passes:,} passes (instructions / textures)")
+    print(f"{'widget':<19}{'pass':<8}{'before':>14}{'after':>14}")
+    for name, legacy, current, passes in CASES:
+        for pass_name, run in passes:
+            before = count(legacy, run, args.passes)
+            after = count(current, run, args.passes)
+            print(
+                f"{name:<19}{pass_name:<8}"
+                f"{before['instructions']:>8} / {before['textures']:<3}"
+                f"{after['instructions']:>8} / {after['textures']:<3}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Measure rendering the complaint list at 10 to 10,000 complaints.
+
+Compares ComplaintListScreen (RecycleView of ComplaintCardView) with the
+code it replaced, which built a full ComplaintCard per complaint on every
+screen enter. The Kivy view layer is replaced by the stand-ins in
+scripts/kivy_stub.py; their RecycleView builds views only for the rows in
+its viewport, like Kivy's. Stand-in widgets are far lighter than Kivy's,
+so the times and memory are lower bounds; the widget counts are exact.
+
+Columns:
+  data ms   building the RecycleView data dicts (complaint_card_data)
+  enter ms  the whole render step, ``_show_complaints`` (median)
+  KiB       memory still allocated after the render (tracemalloc)
+  widgets   widgets constructed by the render, then by scrolling to the end
+
+    python scripts/bench_complaint_list.py [--sizes 10 100 1000 10000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import kivy_stub  # noqa: E402
+
+kivy_stub.install()
+
+from kivy.graphics import Color, RoundedRectangle  # noqa: E402
+from kivy.uix.boxlayout import BoxLayout  # noqa: E402
+from kivy.uix.label import Label  # noqa: E402
+
+from src.config.constants import ComplaintStatus  # noqa: E402
+from src.core.theme import Theme  # noqa: E402
+from src.models.complaint import Complaint  # noqa: E402
+from src.ui.components.complaint_card import complaint_card_data  # noqa: E402
+from src.ui.screens.complaint_list_screen import ComplaintListScreen  # noqa: E402
+
+_VIEWPORT = (1080, 1500)
+_START = datetime(2026, 1, 1)
+
+
+# --- The list as it was before the RecycleView --------------------------------
+
+
+class LegacyComplaintCard(BoxLayout):
+    def __init__(self, complaint: Complaint, **kwargs):
+        super().__init__(**kwargs)
+        self.height = 150
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        self._update_canvas()
+
+        description = complaint.description[:100] + (
+            "..." if len(complaint.description) > 100 else ""
+        )
+        title_label = Label(text=complaint.title, height=32)
+        title_label.bind(size=title_label.setter("text_size"))
+        description_label = Label(text=description, height=48)
+        description_label.bind(size=description_label.setter("text_size"))
+
+        footer_layout = BoxLayout(height=24)
+        date_label = Label(text=complaint.get_formatted_date())
+        date_label.bind(size=date_label.setter("text_size"))
+        status_label = Label(text=complaint.get_status_display())
+        status_label.bind(size=status_label.setter("text_size"))
+        footer_layout.add_widget(date_label)
+        footer_layout.add_widget(status_label)
+
+        self.add_widget(title_label)
+        self.add_widget(description_label)
+        self.add_widget(footer_layout)
+
+    def _update_canvas(self, *args):
+        self.canvas.before.clear()
+        with self.canvas.before:
+            Color(*Theme.surface_elevated)
+            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
+
+
+class LegacyList:
+    def __init__(self):
+        self.complaints_layout = BoxLayout()
+
+    def _show_complaints(self, complaints: List[Complaint]) -> None:
+        self.complaints_layout.clear_widgets()
+        complaints.sort(key=lambda c: c.timestamp, reverse=True)
+        for complaint in complaints:
+            self.complaints_layout.add_widget(LegacyComplaintCard(complaint=complaint))
+
+    def scroll_to_end(self) -> None:
+        pass
+
+
+class RecycledList:
+    def __init__(self):
+        self.screen = ComplaintListScreen()
+        self.screen.recycle_view.size = _VIEWPORT
+
+    def _show_complaints(self, complaints: List[Complaint]) -> None:
+        self.screen._show_complaints(complaints)
+
+    def scroll_to_end(self) -> None:
+        recycle_view = self.screen.recycle_view
+        recycle_view.scroll_to_index(len(recycle_view.data) - 1)
+
+
+# --- Measurement --------------------------------------------------------------
+
+
+def _complaints(count: int) -> List[Complaint]:
+    statuses = list(ComplaintStatus)
+    return [
+        Complaint(
+            complaint_id=f"complaint-{index}",
+            user_id="user-1",
+            title=f"Complaint {index}",
+            description="Streetlight out near the bus stop " * 4,
+            timestamp=_START + timedelta(minutes=index),
+            status=statuses[index % len(statuses)],
+        )
+        for index in range(count)
+    ]
+
+
+def _widgets() -> int:
+    return sum(
+        value
+        for name, value in kivy_stub.allocations.items()
+        if name.startswith("widget:")
+    )
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Median milliseconds per call."""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def measure(
+    make_list: Callable, complaints: List[Complaint], repeat: int
+) -> Dict[str, float]:
+    # Screens are built up front; only the render itself is timed
+    views = [make_list() for _ in range(repeat)]
+    enter_ms = _time(lambda: views.pop()._show_complaints(list(complaints)), repeat)
+
+    # Memory on a fresh list, so tracing does not skew the timing above
+    view = make_list()
+    kivy_stub.reset_counts()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    view._show_complaints(list(complaints))
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    rendered = _widgets()
+    view.scroll_to_end()
+    return {
+        "enter_ms": enter_ms,
+        "kib": retained / 1024,
+        "widgets": rendered,
+        "scroll_widgets": _widgets() - rendered,
+    }
+
+
+def measure_data(complaints: List[Complaint], repeat: int) -> float:
+    return _time(lambda: [complaint_card_data(c) for c in complaints], repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Viewport {_VIEWPORT[0]}x{_VIEWPORT[1]}")
+    print(
+        f"{'complaints':>10}  {'list':<9}{'data ms':>9}{'enter ms':>10}"
+        f"{'KiB':>10}{'widgets':>9}{'+scroll':>9}"
+    )
+    for count in args.sizes:
+        complaints = _complaints(count)
+        data_ms = measure_data(complaints, args.repeat)
+        for name, make_list in (("before", LegacyList), ("after", RecycledList)):
+            result = measure(make_list, complaints, args.repeat)
+            data_text = f"{data_ms:.2f}" if name == "after" else "-"
+            print(
+                f"{count:>10,}  {name:<9}{data_text:>9}"
+                f"{result['enter_ms']:>10.2f}{result['kib']:>10.1f}"
+                f"{result['widgets']:>9,}{result['scroll_widgets']:>9,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Memory per N fixes: list of Location objects vs LocationTrack.
+
+Allocations are measured with tracemalloc while each container is built,
+so the figures include every per-fix object (dataclass, datetime, floats).
+
+    python scripts/bench_location_track.py [--fixes 10000]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.location_track import LocationTrack  # noqa: E402
+from tests.tracks import make_fix  # noqa: E402
+
+
+def allocated(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        kept = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixes", type=int, default=10_000)
+    args = parser.parse_args()
+    count = args.fixes
+
+    as_list = allocated(lambda: [make_fix(index) for index in range(count)])
+
+    # Fixes arrive one at a time and are dropped once appended
+    def build_track() -> LocationTrack:
+        track = LocationTrack()
+        for index in range(count):
+            track.append(make_fix(index))
+        return track
+
+    as_track = allocated(build_track)
+    nbytes = build_track().nbytes
+
+    print(f"{count:,} fixes")
+    print(f"  list[Location]  {as_list:>12,} bytes  {as_list / count:8.1f} B/fix")
+    print(f"  LocationTrack   {as_track:>12,} bytes  {as_track / count:8.1f} B/fix")
+    print(f"    column data   {nbytes:>12,} bytes")
+    print(f"  ratio           {as_list / as_track:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Compare the JSON and SQLite storage engines on the services' lookups.
+
+The JSON engine is measured the way the services use it: load the whole
+collection through StorageService, then scan it. Cold numbers clear the
+parse cache first; collections above STORAGE_CACHE_MAX_BYTES are never
+cached, so at 100k records cold and warm are the same.
+
+    python scripts/bench_storage.py [--sizes 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.app_config import AppConfig  # noqa: E402
+from src.config.constants import ComplaintStatus, SOSStatus  # noqa: E402
+from src.models.complaint import Complaint  # noqa: E402
+from src.models.location import Location  # noqa: E402
+from src.models.sos import SOS  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.services.sqlite_store import SQLiteStore  # noqa: E402
+from src.services.storage_service import StorageService  # noqa: E402
+
+_USERS_WITH_RECORDS = 1000
+_START = datetime(2026, 1, 1)
+
+
+def _records(count: int, rng: random.Random) -> Dict[str, List[dict]]:
+    statuses = list(ComplaintStatus)
+    users = [
+        User(
+            user_id=f"user-{index}",
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+            phone=f"+91{index:010d}",
+            created_at=_START,
+        ).to_dict()
+        for index in range(count)
+    ]
+    complaints = [
+        Complaint(
+            complaint_id=f"complaint-{index}",
+            user_id=f"user-{rng.randrange(_USERS_WITH_RECORDS)}",
+            title=f"Complaint {index}",
+            description="Streetlight out near the bus stop " * 3,
+            timestamp=_START + timedelta(minutes=index),
+            status=rng.choice(statuses),
+        ).to_dict()
+        for index in range(count)
+    ]
+    sos_events = [
+        SOS(
+            sos_id=f"sos-{index}",
+            user_id=f"user-{rng.randrange(_USERS_WITH_RECORDS)}",
+            status=SOSStatus.RESOLVED,
+            start_time=_START + timedelta(minutes=index),
+            end_time=_START + timedelta(minutes=index + 5),
+            location_history=[
+                Location(
+                    latitude=19.0 + step * 1e-4,
+                    longitude=72.8,
+                    timestamp=_START + timedelta(minutes=index, seconds=step * 10),
+                    accuracy=8.0,
+                )
+                for step in range(3)
+            ],
+        ).to_dict()
+        for index in range(count)
+    ]
+    return {"users": users, "complaints": complaints, "sos_events": sos_events}
+
+
+def _time(fn: Callable[[], object], repeat: int, before=None) -> float:
+    """Median milliseconds per call."""
+    samples = []
+    for _ in range(repeat):
+        if before:
+            before()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def bench(count: int, repeat: int) -> List[tuple]:
+    rng = random.Random(count)
+    data = _records(count, rng)
+    email = f"user{count // 2}@example.com"
+    complaint_id = f"complaint-{count // 2}"
+    user_id = f"user-{_USERS_WITH_RECORDS // 2}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        AppConfig.STORAGE_DIR = Path(tmp)
+        storage = StorageService()
+        store = SQLiteStore(Path(tmp) / "bench.db")
+
+        def write_json():
+            storage.save(AppConfig.USERS_FILE, data["users"])
+            storage.save(AppConfig.COMPLAINTS_FILE, data["complaints"])
+            storage.save(AppConfig.SOS_HISTORY_FILE, data["sos_events"])
+            storage.flush(timeout=None)
+
+        def write_sqlite():
+            for table, records in data.items():
+                store.replace_all(table, records)
+
+        def json_email():
+            users = storage.load(AppConfig.USERS_FILE)
+            return next(u for u in users if u["email"].lower() == email)
+
+        def json_complaint():
+            complaints = storage.load(AppConfig.COMPLAINTS_FILE)
+            return next(c for c in complaints if c["complaint_id"] == complaint_id)
+
+        def json_user_complaints():
+            complaints = storage.load(AppConfig.COMPLAINTS_FILE)
+            own = [c for c in complaints if c["user_id"] == user_id]
+            return sorted(own, key=lambda c: c["timestamp"], reverse=True)
+
+        def json_user_sos():
+            events = storage.load(AppConfig.SOS_HISTORY_FILE)
+            own = [s for s in events if s["user_id"] == user_id]
+            return sorted(own, key=lambda s: s["start_time"], reverse=True)
+
+        rows = [
+            (
+                "write all",
+                _time(write_json, 1),
+                None,
+                _time(write_sqlite, 1),
+            )
+        ]
+        queries = (
+            ("user by email", json_email, lambda: store.find_user_by_email(email)),
+            (
+                "complaint by id",
+                json_complaint,
+                lambda: store.get_complaint(complaint_id),
+            ),
+            (
+                "user complaints",
+                json_user_complaints,
+                lambda: store.complaints_for_user(user_id),
+            ),
+            ("user SOS history", json_user_sos, lambda: store.sos_for_user(user_id)),
+        )
+        for name, json_fn, sqlite_fn in queries:
+            cold = _time(json_fn, repeat, before=storage.clear_cache)
+            json_fn()
+            warm = _time(json_fn, repeat)
+            rows.append((name, cold, warm, _time(sqlite_fn, repeat)))
+
+        store.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        print(f"\n{count:,} records per collection (median ms)")
+        print(f"{'operation':<18}{'json cold':>12}{'json warm':>12}{'sqlite':>10}")
+        for name, cold, warm, sqlite in bench(count, args.repeat):
+            warm_text = "-" if warm is None else f"{warm:.2f}"
+            print(f"{name:<18}{cold:>12.2f}{warm_text:>12}{sqlite:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
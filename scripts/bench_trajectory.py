@@ -0,0 +1,51 @@
+"""Simplification ratio, error and time for TrajectorySimplifier.
+
+By default replays the synthetic track from tests/tracks.py: one hour at
+1 Hz along a slow curve with a five-minute stop and ~2 m of jitter. Pass
+--track to use a recorded one instead, e.g. the sos_raw_<id>.json file
+saved when SOS_KEEP_RAW_TRACK is on (a JSON list of location dicts).
+
+    python scripts/bench_trajectory.py [--tolerances 5 10 25] [--track PATH]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.location import Location  # noqa: E402
+from src.utils.trajectory import TrajectorySimplifier  # noqa: E402
+from tests.tracks import synthetic_track  # noqa: E402
+
+
+def load_track(path: str) -> List[Location]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [Location.from_dict(item) for item in json.load(f)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tolerances", type=float, nargs="+", default=[5, 10, 25])
+    parser.add_argument("--track", help="recorded track (JSON list of fixes)")
+    args = parser.parse_args()
+
+    track = load_track(args.track) if args.track else synthetic_track()
+    print(f"{len(track):,} fixes from {args.track or 'the synthetic track'}")
+    print(f"{'tolerance m':>12}{'kept':>8}{'ratio':>8}{'max error m':>13}{'ms':>8}")
+    for tolerance in args.tolerances:
+        started = time.perf_counter()
+        simplified = TrajectorySimplifier.simplify(track, tolerance)
+        elapsed = (time.perf_counter() - started) * 1000
+        error = TrajectorySimplifier.max_deviation(track, simplified)
+        print(
+            f"{tolerance:>12g}{len(simplified):>8}"
+            f"{len(simplified) / len(track):>8.3f}{error:>13.2f}{elapsed:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""Minimal stand-ins for the Kivy classes the UI benchmarks touch.
+
+Graphics instructions only count how many were constructed. Widgets
+support ``bind`` and fire the bound callbacks when an attribute changes,
+which is all the layout code under test relies on. ``RecycleView`` builds
+views for the rows inside its viewport and rebinds them as it scrolls,
+like Kivy's ``RecycleLayoutManager``.
+
+Call ``install()`` before importing anything from ``src.ui``; it replaces
+any real Kivy modules so the counts are comparable between runs.
+"""
+
+import math
+import sys
+import types
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+# Instruction and widget class name -> number constructed
+allocations: Counter = Counter()
+
+_MISSING = object()
+_active_groups: List["InstructionGroup"] = []
+
+
+def reset_counts() -> None:
+    allocations.clear()
+
+
+class InstructionGroup:
+    def __init__(self):
+        self.children: List["Instruction"] = []
+
+    def add(self, instruction: "Instruction") -> None:
+        self.children.append(instruction)
+
+    def clear(self) -> None:
+        self.children.clear()
+
+    def __enter__(self):
+        _active_groups.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _active_groups.pop()
+
+
+class Canvas(InstructionGroup):
+    def __init__(self):
+        super().__init__()
+        self.before = InstructionGroup()
+        self.after = InstructionGroup()
+
+
+class Instruction:
+    def __init__(self, **kwargs):
+        allocations[type(self).__name__] += 1
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+        if _active_groups:
+            _active_groups[-1].add(self)
+
+
+class Color(Instruction):
+    def __init__(self, *rgba, **kwargs):
+        super().__init__(**kwargs)
+        self.rgba = list(rgba)
+
+
+class Rectangle(Instruction):
+    pass
+
+
+class RoundedRectangle(Instruction):
+    pass
+
+
+class Ellipse(Instruction):
+    pass
+
+
+class Line(Instruction):
+    pass
+
+
+class Texture:
+    def __init__(self, size):
+        self.size = size
+        self.width, self.height = size
+
+
+class CoreLabel:
+    """Text rendering; every ``refresh`` rasterises a new texture."""
+
+    def __init__(self, text: str = "", font_size: float = 15, **kwargs):
+        self.text = text
+        self.font_size = font_size
+        self.texture = None
+
+    def refresh(self) -> None:
+        allocations["Texture"] += 1
+        width = len(self.text) * self.font_size * 0.5
+        self.texture = Texture((width, self.font_size))
+
+
+class EventDispatcher:
+    def __init__(self, **kwargs):
+        if "_bindings" not in self.__dict__:
+            object.__setattr__(self, "_bindings", {})
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        old = self.__dict__.get(name, _MISSING)
+        object.__setattr__(self, name, value)
+        if old is _MISSING or old != value:
+            for callback in self.__dict__.get("_bindings", {}).get(name, ()):
+                callback(self, value)
+
+    def bind(self, **callbacks: Callable) -> None:
+        for name, callback in callbacks.items():
+            self._bindings.setdefault(name, []).append(callback)
+
+    def dispatch(self, event: str, *args) -> None:
+        handler = getattr(self, event, None)
+        if handler:
+            handler(*args)
+        for callback in self._bindings.get(event, ()):
+            callback(self, *args)
+
+    def setter(self, name: str) -> Callable:
+        return lambda instance, value: setattr(self, name, value)
+
+
+def _property(default=None, **kwargs):
+    return default
+
+
+class Widget(EventDispatcher):
+    def __init__(self, **kwargs):
+        allocations[f"widget:{type(self).__name__}"] += 1
+        self.canvas = Canvas()
+        self.children: List["Widget"] = []
+        self.parent = None
+        self.pos = (0, 0)
+        self.size = (100, 100)
+        self.opacity = 1.0
+        super().__init__(**kwargs)
+
+    @property
+    def x(self) -> float:
+        return self.pos[0]
+
+    @property
+    def y(self) -> float:
+        return self.pos[1]
+
+    @property
+    def width(self) -> float:
+        return self.size[0]
+
+    @width.setter
+    def width(self, value: float) -> None:
+        self.size = (value, self.size[1])
+
+    @property
+    def height(self) -> float:
+        return self.size[1]
+
+    @height.setter
+    def height(self, value: float) -> None:
+        self.size = (self.size[0], value)
+
+    def add_widget(self, widget: "Widget") -> None:
+        widget.parent = self
+        self.children.append(widget)
+
+    def remove_widget(self, widget: "Widget") -> None:
+        self.children.remove(widget)
+        widget.parent = None
+
+    def clear_widgets(self) -> None:
+        for widget in list(self.children):
+            self.remove_widget(widget)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class Label(Widget):
+    pass
+
+
+class Button(Label):
+    def on_press(self):
+        pass
+
+    def on_release(self):
+        pass
+
+
+class BoxLayout(Widget):
+    pass
+
+
+class ScrollView(Widget):
+    pass
+
+
+class TextInput(Widget):
+    text = ""
+    hint_text = ""
+    password = False
+    focus = False
+    font_size = 15
+
+
+class Screen(Widget):
+    pass
+
+
+class ScreenManager(Widget):
+    current = ""
+
+
+class SlideTransition:
+    def __init__(self, **kwargs):
+        self.direction = kwargs.get("direction")
+
+
+class RecycleBoxLayout(BoxLayout):
+    minimum_height = 0
+
+
+class RecycleDataViewBehavior:
+    def refresh_view_attrs(self, rv, index, data):
+        for name, value in data.items():
+            setattr(self, name, value)
+
+
+class RecycleView(ScrollView):
+    """Keeps one view per row inside the viewport and rebinds them."""
+
+    def __init__(self, viewclass=None, **kwargs):
+        self.viewclass = viewclass
+        self.scroll_y = 0.0
+        self._data: List[Dict] = []
+        self.views: List[Widget] = []
+        super().__init__(**kwargs)
+        self.bind(size=lambda *args: self.refresh_from_data())
+
+    @property
+    def data(self) -> List[Dict]:
+        return self._data
+
+    @data.setter
+    def data(self, value: List[Dict]) -> None:
+        self._data = value
+        self.refresh_from_data()
+
+    def _layout(self) -> RecycleBoxLayout:
+        return next(c for c in self.children if isinstance(c, RecycleBoxLayout))
+
+    def _row_height(self) -> float:
+        layout = self._layout()
+        return layout.default_size[1] + getattr(layout, "spacing", 0)
+
+    def scroll_to_index(self, index: int) -> None:
+        self.scroll_y = index * self._row_height()
+        self.refresh_from_data()
+
+    def refresh_from_data(self) -> None:
+        if not self.children:
+            return
+        row = self._row_height()
+        first = min(int(self.scroll_y // row), max(len(self._data) - 1, 0))
+        visible = min(len(self._data) - first, math.ceil(self.height / row) + 1)
+        while len(self.views) < visible:
+            self.views.append(self.viewclass())
+        for offset in range(max(visible, 0)):
+            index = first + offset
+            view = self.views[offset]
+            view.refresh_view_attrs(self, index, self._data[index])
+            view.pos = (0, self.height - (offset + 1) * row + self.scroll_y % row)
+
+
+class Animation:
+    def __init__(self, **kwargs):
+        self.properties = kwargs
+
+    def __add__(self, other: "Animation") -> "Animation":
+        return self
+
+    def start(self, widget) -> None:
+        pass
+
+    def stop(self, widget) -> None:
+        pass
+
+    @staticmethod
+    def cancel_all(widget, *names) -> None:
+        pass
+
+
+class _ClockEvent:
+    def cancel(self) -> None:
+        pass
+
+
+class Clock:
+    @staticmethod
+    def schedule_once(callback, timeout=0):
+        callback(0)
+        return _ClockEvent()
+
+    @staticmethod
+    def schedule_interval(callback, timeout):
+        return _ClockEvent()
+
+
+def install() -> None:
+    """Register the stand-ins as the ``kivy`` package."""
+    modules: Dict[str, Dict[str, Any]] = {
+        "kivy": {},
+        "kivy.animation": {"Animation": Animation},
+        "kivy.clock": {"Clock": Clock},
+        "kivy.core": {},
+        "kivy.core.text": {"Label": CoreLabel},
+        "kivy.event": {"EventDispatcher": EventDispatcher},
+        "kivy.graphics": {
+            "Color": Color,
+            "Rectangle": Rectangle,
+            "RoundedRectangle": RoundedRectangle,
+            "Ellipse": Ellipse,
+            "Line": Line,
+        },
+        "kivy.properties": {
+            "ObjectProperty": _property,
+            "BooleanProperty": _property,
+            "ListProperty": _property,
+        },
+        "kivy.uix": {},
+        "kivy.uix.widget": {"Widget": Widget},
+        "kivy.uix.label": {"Label": Label},
+        "kivy.uix.button": {"Button": Button},
+        "kivy.uix.boxlayout": {"BoxLayout": BoxLayout},
+        "kivy.uix.scrollview": {"ScrollView": ScrollView},
+        "kivy.uix.textinput": {"TextInput": TextInput},
+        "kivy.uix.screenmanager": {
+            "Screen": Screen,
+            "ScreenManager": ScreenManager,
+            "SlideTransition": SlideTransition,
+        },
+        "kivy.uix.recycleview": {"RecycleView": RecycleView},
+        "kivy.uix.recycleview.views": {
+            "RecycleDataViewBehavior": RecycleDataViewBehavior
+        },
+        "kivy.uix.recycleboxlayout": {"RecycleBoxLayout": RecycleBoxLayout},
+        "kivy.utils": {"platform": "linux"},
+    }
+    for name, attrs in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        if name in ("kivy", "kivy.core", "kivy.uix", "kivy.uix.recycleview"):
+            module.__path__ = []
+        sys.modules[name] = module
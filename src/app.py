@@ -5,25 +5,10 @@ import traceback
 
 from src.core.theme import Theme
 from src.core.navigation import NavigationManager
+from src.core.screen_registry import ScreenRegistry
 from src.state.app_state import AppState
 from src.config.constants import ScreenNames
-
-# Screens - with error handling
-try:
-    from src.ui.screens.splash_screen import SplashScreen
-    from src.ui.screens.login_screen import LoginScreen
-    from src.ui.screens.register_screen import RegisterScreen
-    from src.ui.screens.home_screen import HomeScreen
-    from src.ui.screens.sos_screen import SOSScreen
-    from src.ui.screens.complaint_screen import ComplaintScreen
-    from src.ui.screens.complaint_list_screen import ComplaintListScreen
-    from src.ui.screens.profile_screen import ProfileScreen
-
-    SCREENS_IMPORTED = True
-except Exception as e:
-    print(f"ERROR importing screens: {e}")
-    traceback.print_exc()
-    SCREENS_IMPORTED = False
+from src.config.app_config import AppConfig
 
 # Services - with error handling
 try:
@@ -52,7 +37,9 @@ except Exception as e:
 
 try:
     from src.services.sos_service import SOSService
-    from src.services.location_service import LocationService
+    from src.services.outbox_service import OutboxService
+    from src.services.storage_service import StorageService
+    from src.core.startup import StartupOrchestrator
 
     CORE_SERVICES_AVAILABLE = True
 except Exception as e:
@@ -82,72 +69,20 @@ class PyRakshaApp(App):
             # Initialize screen manager
             self._screen_manager = ScreenManager()
 
-            if not SCREENS_IMPORTED:
-                print("CRITICAL: Screens not imported, cannot build app")
-                raise ImportError("Failed to import screens")
-
-            # Add screens with individual error handling
-            try:
-                self._screen_manager.add_widget(SplashScreen())
-                print("✓ Added SplashScreen")
-            except Exception as e:
-                print(f"✗ Failed to add SplashScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(LoginScreen())
-                print("✓ Added LoginScreen")
-            except Exception as e:
-                print(f"✗ Failed to add LoginScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(RegisterScreen())
-                print("✓ Added RegisterScreen")
-            except Exception as e:
-                print(f"✗ Failed to add RegisterScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(HomeScreen())
-                print("✓ Added HomeScreen")
-            except Exception as e:
-                print(f"✗ Failed to add HomeScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(SOSScreen())
-                print("✓ Added SOSScreen")
-            except Exception as e:
-                print(f"✗ Failed to add SOSScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(ComplaintScreen())
-                print("✓ Added ComplaintScreen")
-            except Exception as e:
-                print(f"✗ Failed to add ComplaintScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(ComplaintListScreen())
-                print("✓ Added ComplaintListScreen")
-            except Exception as e:
-                print(f"✗ Failed to add ComplaintListScreen: {e}")
-                traceback.print_exc()
-
-            try:
-                self._screen_manager.add_widget(ProfileScreen())
-                print("✓ Added ProfileScreen")
-            except Exception as e:
-                print(f"✗ Failed to add ProfileScreen: {e}")
-                traceback.print_exc()
+            # Only the splash is built up front; the registry builds every
+            # other screen on first navigation or while prewarming
+            registry = ScreenRegistry.initialize(self._screen_manager)
+            if not registry.ensure(ScreenNames.SPLASH):
+                print("CRITICAL: Splash screen unavailable, cannot build app")
+                raise ImportError("Failed to build splash screen")
 
             # Start at splash
             self._screen_manager.current = ScreenNames.SPLASH
 
             # Initialize navigation manager
-            self._nav_manager = NavigationManager.initialize(self._screen_manager)
+            self._nav_manager = NavigationManager.initialize(
+                self._screen_manager, registry
+            )
             print("✓ Navigation manager initialized")
 
             print("PyRaksha App built successfully!")
@@ -163,6 +98,19 @@ class PyRakshaApp(App):
         try:
             print("Starting PyRaksha services...")
 
+            # Session, services and token check run in parallel behind the
+            # splash; the orchestrator leaves the splash when they are done
+            if CORE_SERVICES_AVAILABLE:
+                try:
+                    StartupOrchestrator.get_instance().start()
+                    print("✓ Startup stages running")
+                except Exception as e:
+                    print(f"✗ Startup orchestration failed: {e}")
+                    self._nav_manager.navigate_to(ScreenNames.LOGIN)
+            else:
+                print("⊗ Core services not available")
+                self._nav_manager.navigate_to(ScreenNames.LOGIN)
+
             # Hardware SOS triggers (optional - may not work on all devices)
             if HARDWARE_TRIGGER_AVAILABLE:
                 try:
@@ -196,17 +144,18 @@ class PyRakshaApp(App):
             else:
                 print("⊗ Widget manager disabled")
 
-            # Location tracking (critical for SOS)
+            # Replay complaints and SOS updates queued while offline
             if CORE_SERVICES_AVAILABLE:
                 try:
-                    location_service = LocationService.get_instance()
-                    # Don't auto-start location tracking - only when SOS is triggered
-                    # This saves battery and avoids permission issues on startup
-                    print("✓ Location service ready (will start on SOS)")
+                    OutboxService.get_instance().start()
+                    print("✓ Outbox replay scheduled")
                 except Exception as e:
-                    print(f"✗ Location service failed: {e}")
-            else:
-                print("⊗ Core services not available")
+                    print(f"✗ Outbox replay failed: {e}")
+
+            # Likely next screens get built while the splash is showing
+            ScreenRegistry.get_instance().prewarm(
+                AppConfig.SCREEN_PREWARM, delay=AppConfig.SCREEN_PREWARM_DELAY
+            )
 
             print("PyRaksha initialized!")
 
@@ -232,7 +181,18 @@ class PyRakshaApp(App):
                 print("SOS already active")
                 return
 
-            success, message, sos = sos_service.trigger_sos(user.user_id)
+            sos_service.trigger_sos_async(
+                user.user_id, callback=self._on_emergency_trigger_result
+            )
+
+        except Exception as e:
+            print(f"ERROR in _on_emergency_trigger: {e}")
+            traceback.print_exc()
+
+    def _on_emergency_trigger_result(self, result):
+        """Finish a hardware SOS trigger once the backend call returns"""
+        try:
+            success, message, sos = result
             if success and sos:
                 self._app_state.set_sos(sos)
                 self._nav_manager.navigate_to(ScreenNames.SOS)
@@ -251,17 +211,28 @@ class PyRakshaApp(App):
                 print(f"SOS failed: {message}")
 
         except Exception as e:
-            print(f"ERROR in _on_emergency_trigger: {e}")
+            print(f"ERROR in _on_emergency_trigger_result: {e}")
             traceback.print_exc()
 
     def on_pause(self):
         """Handle app going to background"""
         print("App paused")
+        if CORE_SERVICES_AVAILABLE:
+            # Android may kill a paused app without calling on_stop
+            StorageService.get_instance().flush()
         return True  # Allow pause
 
+    def on_stop(self):
+        """Handle app shutdown"""
+        if CORE_SERVICES_AVAILABLE:
+            OutboxService.get_instance().stop()
+            StorageService.get_instance().flush()
+
     def on_resume(self):
         """Handle app coming from background"""
         print("App resumed")
+        if CORE_SERVICES_AVAILABLE:
+            OutboxService.get_instance().replay_async()
 
 
 if __name__ == "__main__":
@@ -6,16 +6,95 @@ class AppConfig:
     APP_VERSION = "1.0.0"
 
     API_BASE_URL = "https://web-production-49b1b.up.railway.app"
+    API_TIMEOUT = 10
+    API_POOL_MAX_PER_HOST = 2
+    API_POOL_IDLE_TIMEOUT = 30
+    REQUEST_WORKERS = 3
+    # Reserved for SOS calls so they never wait behind background syncs
+    REQUEST_URGENT_WORKERS = 1
+    API_MAX_RETRIES = 2
+    API_RETRY_BASE_DELAY = 0.5
+    API_RETRY_MAX_DELAY = 4.0
+    API_BREAKER_FAILURE_THRESHOLD = 3
+    API_BREAKER_RESET_TIMEOUT = 30
+    API_CONDITIONAL_CACHE_MAX_ENTRIES = 16
+    # Per-endpoint timeout budgets (seconds); anything else uses API_TIMEOUT
+    API_ENDPOINT_TIMEOUTS = {
+        "/api/sos/trigger": 4,
+        "/api/sos/update_location": 5,
+        "/api/sos/update_locations": 5,
+        "/api/sos/resolve": 5,
+        "/api/auth/login": 6,
+        "/api/auth/verify": 5,
+    }
     STORAGE_DIR = Path.home() / ".pyraksha"
     USERS_FILE = "users.json"
     COMPLAINTS_FILE = "complaints.json"
     SOS_HISTORY_FILE = "sos_history.json"
     SESSION_FILE = "session.json"
     ACTIVE_SOS_FILE = "active_sos.json"
+    ACTIVE_SOS_JOURNAL_FILE = "active_sos.jsonl"
+    SYNC_CURSORS_FILE = "sync_cursors.json"
+    OUTBOX_FILE = "outbox.json"
+    SQLITE_DB_FILE = "pyraksha.db"
+
+    # "json" keeps one file per collection; "sqlite" uses indexed tables
+    STORAGE_ENGINE = "json"
+    STORAGE_CACHE_MAX_ENTRIES = 16
+    STORAGE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+    # Saves are handed to a writer thread; repeats within the delay coalesce
+    STORAGE_WRITE_BEHIND = True
+    STORAGE_WRITE_DELAY = 0.25
+    STORAGE_FLUSH_TIMEOUT = 5
 
     SOS_LOCATION_UPDATE_INTERVAL = 10
+    # How often the SOS pipeline checks whether batched fixes are due
+    SOS_FLUSH_CHECK_INTERVAL = 1
+    # Recent GPS fixes kept in memory for LocationService.get_since
+    LOCATION_BUFFER_SIZE = 256
+    # Adaptive GPS sampling during an SOS (seconds between fixes)
+    GPS_MIN_INTERVAL = 1
+    GPS_MAX_INTERVAL = 30
+    GPS_BURST_SECONDS = 60
+    # Motion is judged from the displacement across this many seconds of fixes
+    GPS_MOTION_WINDOW = 30
+    # Minimum time between two interval changes
+    GPS_MIN_DWELL = 20
+    GPS_BAD_ACCURACY = 50
+    # Fixes that add nothing to the SOS track are neither stored nor sent
+    LOCATION_FILTER_MIN_GAP = 1
+    LOCATION_FILTER_MIN_DISTANCE = 5
+    LOCATION_FILTER_ACCURACY_FACTOR = 0.5
+    LOCATION_FILTER_MAX_ACCURACY = 500
+    LOCATION_FILTER_MAX_SPEED = 70
+    LOCATION_FILTER_HEARTBEAT = 30
+    SOS_LOCATION_BATCH_SIZE = 5
+    # "json" sends location batches as dicts; "compact" sends them through
+    # LocationCodec and falls back to JSON if the backend rejects it
+    SOS_LOCATION_ENCODING = "json"
+    SOS_JOURNAL_MIN_COMPACT = 64
+    # Archived SOS tracks are simplified to this error bound in metres (0 = off);
+    # the raw track can be kept separately in SOS_RAW_TRACK_FILE
+    SOS_TRACK_TOLERANCE_M = 10
+    SOS_KEEP_RAW_TRACK = False
+    SOS_RAW_TRACK_FILE = "sos_raw_{sos_id}.json"
+    OUTBOX_REPLAY_INTERVAL = 15
+    OUTBOX_BATCH_SIZE = 20
+    # Local complaints are served immediately; the backend is asked at most
+    # once per TTL, in the background
+    COMPLAINT_CACHE_TTL = 60
     SESSION_TIMEOUT_DAYS = 30
 
+    # Screens built during idle frames after startup (ScreenNames values)
+    SCREEN_PREWARM = ["home", "sos"]
+    SCREEN_PREWARM_DELAY = 0.5
+    # Shortest time the splash stays up, even if startup finishes sooner
+    SPLASH_MIN_DISPLAY = 0.8
+    STARTUP_PREFETCH_COMPLAINTS = True
+    # Also enabled by the PYRAKSHA_TRACE_STARTUP environment variable
+    TRACE_STARTUP = False
+    STARTUP_TRACE_FILE = "startup_trace.json"
+
     @classmethod
     def ensure_storage_dir(cls) -> None:
         cls.STORAGE_DIR.mkdir(parents=True, exist_ok=True)
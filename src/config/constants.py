@@ -23,3 +23,9 @@ class ScreenNames:
     COMPLAINT = "complaint"
     COMPLAINT_LIST = "complaint_list"
     PROFILE = "profile"
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
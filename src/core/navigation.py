@@ -1,18 +1,24 @@
 from typing import Optional
 from kivy.uix.screenmanager import ScreenManager, SlideTransition
+from src.core.screen_registry import ScreenRegistry
 
 
 class NavigationManager:
     _instance: Optional["NavigationManager"] = None
 
-    def __init__(self, screen_manager: ScreenManager):
+    def __init__(
+        self, screen_manager: ScreenManager, registry: Optional[ScreenRegistry] = None
+    ):
         self.screen_manager = screen_manager
+        self.registry = registry
         self._history: list[str] = []
 
     @classmethod
-    def initialize(cls, screen_manager: ScreenManager) -> "NavigationManager":
+    def initialize(
+        cls, screen_manager: ScreenManager, registry: Optional[ScreenRegistry] = None
+    ) -> "NavigationManager":
         if cls._instance is None:
-            cls._instance = cls(screen_manager)
+            cls._instance = cls(screen_manager, registry)
         return cls._instance
 
     @classmethod
@@ -23,6 +29,9 @@ class NavigationManager:
 
     def navigate_to(self, screen_name: str, direction: str = "left") -> None:
         if self.screen_manager.current != screen_name:
+            if self.registry and not self.registry.ensure(screen_name):
+                print(f"Cannot navigate to {screen_name}: screen unavailable")
+                return
             self._history.append(self.screen_manager.current)
             self.screen_manager.transition = SlideTransition(direction=direction)
             self.screen_manager.current = screen_name
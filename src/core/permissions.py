@@ -1,5 +1,8 @@
 from typing import Callable, Optional
 from kivy.utils import platform
+from src.utils.lazy_import import lazy_import
+
+android_permissions = lazy_import("android.permissions")
 
 
 class PermissionManager:
@@ -18,8 +21,7 @@ class PermissionManager:
         self, callback: Optional[Callable[[bool], None]] = None
     ) -> None:
         if platform == "android":
-            from android.permissions import request_permissions, Permission
-
+            Permission = android_permissions.Permission
             permissions = [
                 Permission.ACCESS_FINE_LOCATION,
                 Permission.ACCESS_COARSE_LOCATION,
@@ -30,14 +32,15 @@ class PermissionManager:
                 if callback:
                     callback(granted)
 
-            request_permissions(permissions, on_permission_result)
+            android_permissions.request_permissions(permissions, on_permission_result)
         else:
             if callback:
                 callback(True)
 
     def check_location_permission(self) -> bool:
         if platform == "android":
-            from android.permissions import check_permission, Permission
+            check_permission = android_permissions.check_permission
+            Permission = android_permissions.Permission
 
             return check_permission(
                 Permission.ACCESS_FINE_LOCATION
@@ -48,23 +51,20 @@ class PermissionManager:
         self, callback: Optional[Callable[[bool], None]] = None
     ) -> None:
         if platform == "android":
-            from android.permissions import request_permissions, Permission
-
-            permissions = [Permission.SEND_SMS]
+            permissions = [android_permissions.Permission.SEND_SMS]
 
             def on_permission_result(permissions_result, grant_results):
                 granted = all(grant_results)
                 if callback:
                     callback(granted)
 
-            request_permissions(permissions, on_permission_result)
+            android_permissions.request_permissions(permissions, on_permission_result)
         else:
             if callback:
                 callback(True)
 
     def check_sms_permission(self) -> bool:
         if platform == "android":
-            from android.permissions import check_permission, Permission
-
-            return check_permission(Permission.SEND_SMS)
+            Permission = android_permissions.Permission
+            return android_permissions.check_permission(Permission.SEND_SMS)
         return True
@@ -0,0 +1,93 @@
+import time
+import traceback
+from typing import Optional, Dict, List
+from kivy.clock import Clock
+from kivy.uix.screenmanager import ScreenManager, Screen
+from src.config.constants import ScreenNames
+from src.utils.startup_tracer import StartupTracer
+
+# Screen name -> "module:Class"; modules are imported on first use
+DEFAULT_SCREENS: Dict[str, str] = {
+    ScreenNames.SPLASH: "src.ui.screens.splash_screen:SplashScreen",
+    ScreenNames.LOGIN: "src.ui.screens.login_screen:LoginScreen",
+    ScreenNames.REGISTER: "src.ui.screens.register_screen:RegisterScreen",
+    ScreenNames.HOME: "src.ui.screens.home_screen:HomeScreen",
+    ScreenNames.SOS: "src.ui.screens.sos_screen:SOSScreen",
+    ScreenNames.COMPLAINT: "src.ui.screens.complaint_screen:ComplaintScreen",
+    ScreenNames.COMPLAINT_LIST: (
+        "src.ui.screens.complaint_list_screen:ComplaintListScreen"
+    ),
+    ScreenNames.PROFILE: "src.ui.screens.profile_screen:ProfileScreen",
+}
+
+
+class ScreenRegistry:
+    """Builds screens the first time they are needed."""
+
+    _instance: Optional["ScreenRegistry"] = None
+
+    def __init__(
+        self, screen_manager: ScreenManager, screens: Optional[Dict[str, str]] = None
+    ):
+        self.screen_manager = screen_manager
+        self._screens = dict(screens or DEFAULT_SCREENS)
+        self._prewarm_queue: List[str] = []
+
+    @classmethod
+    def initialize(cls, screen_manager: ScreenManager) -> "ScreenRegistry":
+        if cls._instance is None:
+            cls._instance = cls(screen_manager)
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> "ScreenRegistry":
+        if cls._instance is None:
+            raise RuntimeError("ScreenRegistry not initialized")
+        return cls._instance
+
+    def register(self, name: str, path: str) -> None:
+        self._screens[name] = path
+
+    def is_built(self, name: str) -> bool:
+        return self.screen_manager.has_screen(name)
+
+    def ensure(self, name: str) -> Optional[Screen]:
+        """Return the screen called ``name``, building it if necessary."""
+        if self.screen_manager.has_screen(name):
+            return self.screen_manager.get_screen(name)
+
+        path = self._screens.get(name)
+        if path is None:
+            print(f"✗ Unknown screen: {name}")
+            return None
+
+        started = time.perf_counter()
+        try:
+            module_name, class_name = path.split(":")
+            module = StartupTracer.get_instance().import_module(module_name)
+            screen_class = getattr(module, class_name)
+            screen = screen_class()
+            self.screen_manager.add_widget(screen)
+        except Exception as e:
+            print(f"✗ Failed to build {name} screen: {e}")
+            traceback.print_exc()
+            return None
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"✓ Built {screen_class.__name__} in {elapsed_ms:.1f} ms")
+        return screen
+
+    def prewarm(self, names: List[str], delay: float = 0) -> None:
+        """Build ``names`` in the background of the UI loop, one per frame."""
+        self._prewarm_queue.extend(n for n in names if n not in self._prewarm_queue)
+        Clock.schedule_once(self._prewarm_next, delay)
+
+    def _prewarm_next(self, dt) -> None:
+        while self._prewarm_queue:
+            name = self._prewarm_queue.pop(0)
+            if not self.is_built(name):
+                self.ensure(name)
+                # Leave the next frame free before building another screen
+                if self._prewarm_queue:
+                    Clock.schedule_once(self._prewarm_next, 0)
+                return
@@ -0,0 +1,197 @@
+import time
+from typing import Optional, Dict, Callable, Any
+from kivy.clock import Clock
+from src.config.app_config import AppConfig
+from src.config.constants import ScreenNames
+from src.core.navigation import NavigationManager
+from src.models.user import User
+from src.services.api_client import APIClient
+from src.services.auth_service import AuthService
+from src.services.complaint_service import ComplaintService
+from src.services.location_service import LocationService
+from src.services.request_executor import RequestExecutor
+from src.services.sos_service import SOSService
+from src.services.storage_service import StorageService
+from src.state.app_state import AppState
+from src.state.session_manager import SessionManager
+from src.utils.logger import Logger
+from src.utils.startup_tracer import StartupTracer
+
+
+class StartupOrchestrator:
+    """Runs the startup stages in parallel while the splash is showing.
+
+    ``session`` and ``services`` run on worker threads; once both are done the
+    app leaves the splash (no earlier than SPLASH_MIN_DISPLAY). Token
+    verification and the complaint prefetch then run in the background and
+    never hold up navigation.
+    """
+
+    _instance: Optional["StartupOrchestrator"] = None
+
+    def __init__(self):
+        self._started_at: Optional[float] = None
+        self._timings: Dict[str, float] = {}
+        self._running: Dict[str, bool] = {}
+        self._user: Optional[User] = None
+        self._navigated = False
+        self._reported = False
+
+    @classmethod
+    def get_instance(cls) -> "StartupOrchestrator":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_timings(self) -> Dict[str, float]:
+        """Stage durations and milestones, in milliseconds since start."""
+        return dict(self._timings)
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started_at) * 1000
+
+    def start(self) -> None:
+        if self._started_at is not None:
+            return
+        self._started_at = time.perf_counter()
+
+        # Shared by every stage, so they are created once here rather than
+        # raced for on the workers. Both are cheap.
+        tracer = StartupTracer.get_instance()
+        with tracer.span("service StorageService"):
+            StorageService.get_instance()
+        with tracer.span("service APIClient"):
+            APIClient.get_instance()
+        self._timings["core_ms"] = self._elapsed_ms()
+
+        self._run_stage("session", self._load_session, self._on_session_loaded)
+        self._run_stage("services", self._construct_services, self._on_services_ready)
+
+    def _run_stage(
+        self, name: str, fn: Callable[[], Any], on_done: Callable[[Any], None]
+    ) -> None:
+        def timed():
+            started = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                self._timings[f"{name}_ms"] = (time.perf_counter() - started) * 1000
+
+        def finished(result):
+            self._running[name] = False
+            on_done(result)
+            self._report_if_done()
+
+        def failed(error):
+            print(f"Startup stage {name} failed: {error}")
+            finished(None)
+
+        self._running[name] = True
+        RequestExecutor.get_instance().submit(
+            timed, on_result=finished, on_error=failed
+        )
+
+    def _load_session(self) -> Optional[User]:
+        return SessionManager.get_instance().load_session()
+
+    def _construct_services(self) -> bool:
+        # LocationService first so SOSService's span only covers its own work
+        tracer = StartupTracer.get_instance()
+        for service in (LocationService, SOSService, ComplaintService):
+            with tracer.span(f"service {service.__name__}"):
+                service.get_instance()
+        return True
+
+    def _on_session_loaded(self, user: Optional[User]) -> None:
+        self._user = user
+        self._timings["session_ready_ms"] = self._elapsed_ms()
+        self._maybe_navigate()
+
+    def _on_services_ready(self, result: Optional[bool]) -> None:
+        self._timings["services_ready_ms"] = self._elapsed_ms()
+        self._maybe_navigate()
+
+    def _maybe_navigate(self) -> None:
+        if "session_ready_ms" not in self._timings:
+            return
+        if "services_ready_ms" not in self._timings or self._navigated:
+            return
+        self._navigated = True
+
+        if getattr(self._user, "token", None):
+            # Sets the token first, so the outbox never replays without one
+            AuthService.get_instance().start_session(self._user)
+            self._run_stage(
+                "verify", APIClient.get_instance().verify_token, self._on_verified
+            )
+
+        if self._user and AppConfig.STARTUP_PREFETCH_COMPLAINTS:
+            self._start_prefetch()
+
+        remaining = AppConfig.SPLASH_MIN_DISPLAY - self._elapsed_ms() / 1000
+        Clock.schedule_once(lambda dt: self._navigate(), max(0, remaining))
+
+    def _navigate(self) -> None:
+        app_state = AppState.get_instance()
+        nav_manager = NavigationManager.get_instance()
+
+        if self._user:
+            app_state.set_user(self._user)
+            nav_manager.navigate_to(ScreenNames.HOME)
+        else:
+            nav_manager.navigate_to(ScreenNames.LOGIN)
+        self._timings["navigated_ms"] = self._elapsed_ms()
+        self._report_if_done()
+
+    def _on_verified(self, response: Optional[Dict[str, Any]]) -> None:
+        # Offline is fine; only a rejected token ends the session
+        if not (response and response.get("status_code") == 401):
+            return
+        print("Saved session token rejected by backend")
+
+        if SOSService.get_instance().get_active_sos():
+            # Never pull the user out of an emergency; fixes keep going to
+            # the outbox and replay after the next sign-in
+            AuthService.get_instance().end_session()
+            return
+
+        SessionManager.get_instance().clear_session()
+        AuthService.get_instance().end_session()
+        ComplaintService.get_instance().invalidate_cache()
+        AppState.get_instance().clear_all()
+        self._user = None
+        if "navigated_ms" in self._timings:
+            NavigationManager.get_instance().reset_to_login()
+
+    def _start_prefetch(self) -> None:
+        # The refresh already runs on a worker; waiting on it from another
+        # worker would tie one up and can deadlock a saturated pool
+        future = ComplaintService.get_instance().refresh_if_stale()
+        if future is None:
+            return
+
+        started = time.perf_counter()
+        self._running["prefetch"] = True
+
+        def done(_future):
+            self._timings["prefetch_ms"] = (time.perf_counter() - started) * 1000
+            Clock.schedule_once(lambda dt: self._on_prefetched(), 0)
+
+        future.add_done_callback(done)
+
+    def _on_prefetched(self) -> None:
+        self._running["prefetch"] = False
+        self._report_if_done()
+
+    def _report_if_done(self) -> None:
+        if self._reported or any(self._running.values()):
+            return
+        if "navigated_ms" not in self._timings:
+            return
+        self._reported = True
+
+        report = ", ".join(
+            f"{name} {value:.1f}" for name, value in sorted(self._timings.items())
+        )
+        Logger.log_info("Startup", f"Startup timings: {report}")
+        StartupTracer.get_instance().write_report()
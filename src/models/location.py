@@ -1,7 +1,10 @@
+import math
 from typing import Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 
+_EARTH_RADIUS_M = 6371000.0
+
 
 @dataclass
 class Location:
@@ -25,6 +28,17 @@ class Location:
             data["timestamp"] = datetime.fromisoformat(data["timestamp"])
         return cls(**data)
 
+    def distance_to(self, other: "Location") -> float:
+        """Great-circle distance in metres (haversine)."""
+        lat1, lat2 = math.radians(self.latitude), math.radians(other.latitude)
+        d_lat = lat2 - lat1
+        d_lon = math.radians(other.longitude - self.longitude)
+        a = (
+            math.sin(d_lat / 2) ** 2
+            + math.cos(lat1) * math.cos(lat2) * math.sin(d_lon / 2) ** 2
+        )
+        return 2 * _EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
     def get_coordinates_string(self) -> str:
         return f"{self.latitude:.6f}, {self.longitude:.6f}"
 
@@ -0,0 +1,196 @@
+import math
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union, overload
+from src.models.location import Location
+
+_NO_ACCURACY = float("nan")
+
+
+def _to_epoch_ms(timestamp: datetime) -> int:
+    return int(round(timestamp.timestamp() * 1000))
+
+
+class LocationView:
+    """Read-only view of one fix inside a ``LocationTrack``.
+
+    Quacks like ``Location`` for reading; call ``to_location()`` when a real
+    instance is needed.
+    """
+
+    __slots__ = ("_track", "_index")
+
+    def __init__(self, track: "LocationTrack", index: int):
+        self._track = track
+        self._index = index
+
+    @property
+    def latitude(self) -> float:
+        return self._track._latitudes[self._index]
+
+    @property
+    def longitude(self) -> float:
+        return self._track._longitudes[self._index]
+
+    @property
+    def accuracy(self) -> Optional[float]:
+        value = self._track._accuracies[self._index]
+        return None if math.isnan(value) else value
+
+    @property
+    def epoch_ms(self) -> int:
+        return self._track._epoch_ms[self._index]
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.epoch_ms / 1000)
+
+    def to_location(self) -> Location:
+        return Location(
+            latitude=self.latitude,
+            longitude=self.longitude,
+            timestamp=self.timestamp,
+            accuracy=self.accuracy,
+        )
+
+    def to_dict(self) -> dict:
+        return self.to_location().to_dict()
+
+    def distance_to(self, other) -> float:
+        return self.to_location().distance_to(other)
+
+    def get_coordinates_string(self) -> str:
+        return f"{self.latitude:.6f}, {self.longitude:.6f}"
+
+    def is_valid(self) -> bool:
+        return -90 <= self.latitude <= 90 and -180 <= self.longitude <= 180
+
+
+class LocationTrack:
+    """Columnar store for a sequence of fixes.
+
+    Latitude, longitude and accuracy live in ``array('d')`` columns and the
+    timestamp in an ``array('q')`` of epoch milliseconds (naive timestamps
+    are read as local time). A missing accuracy is stored as NaN. Indexing
+    returns a ``Location``; iteration yields ``LocationView`` objects.
+    """
+
+    __slots__ = ("_latitudes", "_longitudes", "_accuracies", "_epoch_ms")
+
+    def __init__(self, locations: Iterable = ()):
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        self._accuracies = array("d")
+        self._epoch_ms = array("q")
+        self.extend(locations)
+
+    @classmethod
+    def coerce(cls, value: Union["LocationTrack", Iterable, None]) -> "LocationTrack":
+        if isinstance(value, LocationTrack):
+            return value
+        return cls(value or ())
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> "LocationTrack":
+        return cls(Location.from_dict(item) for item in items)
+
+    def append(self, location) -> None:
+        """Add a ``Location`` (or ``LocationView``) to the end of the track."""
+        self._latitudes.append(location.latitude)
+        self._longitudes.append(location.longitude)
+        self._accuracies.append(
+            _NO_ACCURACY if location.accuracy is None else location.accuracy
+        )
+        if isinstance(location, LocationView):
+            self._epoch_ms.append(location.epoch_ms)
+        else:
+            self._epoch_ms.append(_to_epoch_ms(location.timestamp))
+
+    def extend(self, locations: Iterable) -> None:
+        if isinstance(locations, LocationTrack):
+            self._latitudes.extend(locations._latitudes)
+            self._longitudes.extend(locations._longitudes)
+            self._accuracies.extend(locations._accuracies)
+            self._epoch_ms.extend(locations._epoch_ms)
+            return
+        for location in locations:
+            self.append(location)
+
+    def __len__(self) -> int:
+        return len(self._epoch_ms)
+
+    def __bool__(self) -> bool:
+        return len(self._epoch_ms) > 0
+
+    @overload
+    def __getitem__(self, index: int) -> Location: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LocationTrack": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            sliced = LocationTrack()
+            sliced._latitudes = self._latitudes[index]
+            sliced._longitudes = self._longitudes[index]
+            sliced._accuracies = self._accuracies[index]
+            sliced._epoch_ms = self._epoch_ms[index]
+            return sliced
+        return self.view(index).to_location()
+
+    def view(self, index: int) -> LocationView:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("LocationTrack index out of range")
+        return LocationView(self, index)
+
+    def __iter__(self) -> Iterator[LocationView]:
+        for index in range(len(self)):
+            yield LocationView(self, index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LocationTrack):
+            return NotImplemented
+        # NaN never equals itself, so compare accuracies as raw bytes
+        return (
+            self._latitudes == other._latitudes
+            and self._longitudes == other._longitudes
+            and self._epoch_ms == other._epoch_ms
+            and self._accuracies.tobytes() == other._accuracies.tobytes()
+        )
+
+    def __repr__(self) -> str:
+        return f"LocationTrack({len(self)} fixes)"
+
+    def to_locations(self) -> List[Location]:
+        return [point.to_location() for point in self]
+
+    def to_dicts(self) -> List[dict]:
+        return [point.to_dict() for point in self]
+
+    def columns(self) -> Dict[str, memoryview]:
+        """Zero-copy views of the raw columns.
+
+        The track cannot grow while any of these views is alive.
+        """
+        return {
+            "latitude": memoryview(self._latitudes),
+            "longitude": memoryview(self._longitudes),
+            "accuracy": memoryview(self._accuracies),
+            "epoch_ms": memoryview(self._epoch_ms),
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._latitudes,
+                self._longitudes,
+                self._accuracies,
+                self._epoch_ms,
+            )
+        )
@@ -1,8 +1,9 @@
-from typing import Optional, List
+from typing import Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 from src.config.constants import SOSStatus
 from src.models.location import Location
+from src.models.location_track import LocationTrack
 
 
 @dataclass
@@ -12,7 +13,10 @@ class SOS:
     status: SOSStatus
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
-    location_history: List[Location] = field(default_factory=list)
+    location_history: LocationTrack = field(default_factory=LocationTrack)
+
+    def __post_init__(self):
+        self.location_history = LocationTrack.coerce(self.location_history)
 
     def activate(self) -> None:
         self.status = SOSStatus.ACTIVE
@@ -44,7 +48,7 @@ class SOS:
             "status": self.status.value,
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
-            "location_history": [loc.to_dict() for loc in self.location_history],
+            "location_history": self.location_history.to_dicts(),
         }
 
     @classmethod
@@ -56,7 +60,7 @@ class SOS:
         if data.get("end_time") and isinstance(data["end_time"], str):
             data["end_time"] = datetime.fromisoformat(data["end_time"])
         if "location_history" in data:
-            data["location_history"] = [
-                Location.from_dict(loc) for loc in data["location_history"]
-            ]
+            data["location_history"] = LocationTrack.from_dicts(
+                data["location_history"]
+            )
         return cls(**data)
@@ -1,8 +1,35 @@
 import json
-from typing import Optional, Dict, Any
-from urllib import request as urllib_request, error
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http import client as http_client
+from typing import Optional, Dict, Any, Callable, List
+from urllib.parse import urlsplit, urlencode, parse_qsl
 from src.utils.logger import Logger
+from src.utils.location_codec import LocationCodec, LocationCodecError
 from src.config.app_config import AppConfig
+from src.services.connection_pool import ConnectionPool
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.request_executor import RequestExecutor
+
+# Errors that mean a reused keep-alive socket was closed under us
+_STALE_CONNECTION_ERRORS = (
+    http_client.RemoteDisconnected,
+    http_client.BadStatusLine,
+    http_client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+# Methods that are safe to resend if the server may already have seen them
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def _failure_response(error: Exception) -> Dict[str, Any]:
+    return {"success": False, "message": str(error)}
 
 
 class APIClient:
@@ -11,6 +38,20 @@ class APIClient:
     def __init__(self, base_url: str = AppConfig.API_BASE_URL):
         self.base_url = base_url
         self._token: Optional[str] = None
+        self._batch_locations_supported = True
+        self._compact_locations_supported = True
+        # Conditional GET validators, least recently used first. Keyed by the
+        # endpoint without its sync cursor, so each collection keeps a single
+        # entry: {"endpoint", "etag", "last_modified", "body"}
+        self._conditional_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # One breaker per server: an unreachable host fails every route
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._pool = ConnectionPool(
+            max_per_host=AppConfig.API_POOL_MAX_PER_HOST,
+            idle_timeout=AppConfig.API_POOL_IDLE_TIMEOUT,
+            timeout=AppConfig.API_TIMEOUT,
+        )
 
     @classmethod
     def get_instance(cls, base_url: str = AppConfig.API_BASE_URL) -> "APIClient":
@@ -19,51 +60,291 @@ class APIClient:
         return cls._instance
 
     def set_token(self, token: str) -> None:
+        if token != self._token:
+            # Cached bodies belong to whoever the previous token was for
+            self.clear_conditional_cache()
         self._token = token
 
+    def has_token(self) -> bool:
+        return self._token is not None
+
     def clear_token(self) -> None:
         self._token = None
+        self.clear_conditional_cache()
+
+    def clear_conditional_cache(self, path: Optional[str] = None) -> None:
+        """Forget validators for ``path`` (any query string) or for everything."""
+        with self._cache_lock:
+            if path is None:
+                self._conditional_cache.clear()
+                return
+            for key in list(self._conditional_cache):
+                if key.split("?", 1)[0] == path:
+                    del self._conditional_cache[key]
+
+    @staticmethod
+    def _conditional_key(endpoint: str) -> str:
+        path, _, query = endpoint.partition("?")
+        params = [(name, value) for name, value in parse_qsl(query) if name != "since"]
+        return f"{path}?{urlencode(params)}" if params else path
+
+    def _conditional_entry(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Validators for exactly ``endpoint``; a newer cursor starts over."""
+        key = self._conditional_key(endpoint)
+        with self._cache_lock:
+            entry = self._conditional_cache.get(key)
+            if not entry or entry["endpoint"] != endpoint:
+                return None
+            self._conditional_cache.move_to_end(key)
+            return entry
+
+    def _conditional_headers(self, endpoint: str) -> Dict[str, str]:
+        entry = self._conditional_entry(endpoint)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _store_validators(
+        self, endpoint: str, response_headers: Dict[str, str], body: Dict[str, Any]
+    ) -> None:
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        key = self._conditional_key(endpoint)
+        with self._cache_lock:
+            # Replaces the entry for an older cursor of the same collection
+            self._conditional_cache.pop(key, None)
+            if not (etag or last_modified):
+                return
+            self._conditional_cache[key] = {
+                "endpoint": endpoint,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+            }
+            while (
+                len(self._conditional_cache)
+                > AppConfig.API_CONDITIONAL_CACHE_MAX_ENTRIES
+            ):
+                self._conditional_cache.popitem(last=False)
+
+    def _cached_body(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        entry = self._conditional_entry(endpoint)
+        if not entry:
+            return None
+        return dict(entry["body"], not_modified=True)
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        return self._pool.get_stats()
+
+    def close_connections(self) -> None:
+        self._pool.close_all()
+
+    def get_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        with self._cache_lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.snapshot() for host, breaker in breakers.items()}
+
+    def _breaker_for(self, host: str) -> CircuitBreaker:
+        with self._cache_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=AppConfig.API_BREAKER_FAILURE_THRESHOLD,
+                    reset_timeout=AppConfig.API_BREAKER_RESET_TIMEOUT,
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        # Full jitter keeps many clients from retrying in lockstep
+        ceiling = min(
+            AppConfig.API_RETRY_MAX_DELAY, AppConfig.API_RETRY_BASE_DELAY * 2**attempt
+        )
+        return random.uniform(0, ceiling)
+
+    def _send(
+        self,
+        url: str,
+        method: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> tuple[int, Dict[str, str], bytes]:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        # A POST may have reached the server before the socket died; only
+        # resend it when the server can deduplicate it by key
+        can_resend = method in _IDEMPOTENT_METHODS or "Idempotency-Key" in headers
+
+        while True:
+            pooled, reused = self._pool.acquire(url)
+            try:
+                pooled.conn.timeout = timeout
+                if pooled.conn.sock is not None:
+                    pooled.conn.sock.settimeout(timeout)
+                pooled.conn.request(method, target, body=body, headers=headers)
+                response = pooled.conn.getresponse()
+                payload = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                self._pool.discard(pooled)
+                if reused and can_resend:
+                    # The server dropped an idle socket; retry on a fresh one
+                    continue
+                raise
+            except Exception:
+                self._pool.discard(pooled)
+                raise
+
+            self._pool.release(url, pooled, reusable=not response.will_close)
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            return response.status, response_headers, payload
 
     def _make_request(
-        self, endpoint: str, method: str = "GET", data: Optional[Dict] = None
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        conditional: bool = False,
+        retries: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
+        path = endpoint.split("?", 1)[0]
+        host = urlsplit(self.base_url).netloc
+        breaker = self._breaker_for(host)
+
+        if not breaker.allow_request():
+            Logger.log_warning("APIClient", f"Circuit open for {host}, failing fast")
+            return {
+                "success": False,
+                "message": "Server unreachable (offline mode)",
+                "circuit_open": True,
+            }
+
+        if retries is None:
+            retries = AppConfig.API_MAX_RETRIES if method == "GET" else 0
+        timeout = AppConfig.API_ENDPOINT_TIMEOUTS.get(path, AppConfig.API_TIMEOUT)
+
+        attempt = 0
+        while True:
+            response, retryable = self._attempt_request(
+                endpoint, method, data, conditional, timeout, idempotency_key
+            )
+            if not retryable:
+                breaker.record_success()
+                return response
+
+            if attempt >= retries:
+                breaker.record_failure()
+                return response
+
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+    def _attempt_request(
+        self,
+        endpoint: str,
+        method: str,
+        data: Optional[Dict],
+        conditional: bool,
+        timeout: float,
+        idempotency_key: Optional[str] = None,
+    ) -> tuple[Dict[str, Any], bool]:
+        """Make one request; the flag says whether it failed in a retryable way."""
         url = f"{self.base_url}{endpoint}"
         headers = {
             "Content-Type": "application/json",
+            "Accept": "application/json",
         }
 
         if self._token:
             headers["Authorization"] = f"Bearer {self._token}"
 
+        if idempotency_key:
+            # Lets the backend drop duplicates when an outbox entry is replayed
+            headers["Idempotency-Key"] = idempotency_key
+
+        conditional = conditional and method == "GET"
+        if conditional:
+            headers.update(self._conditional_headers(endpoint))
+
         try:
-            if data:
-                data_bytes = json.dumps(data).encode("utf-8")
-                req = urllib_request.Request(
-                    url, data=data_bytes, headers=headers, method=method
-                )
-            else:
-                req = urllib_request.Request(url, headers=headers, method=method)
-
-            with urllib_request.urlopen(req, timeout=10) as response:
-                response_data = json.loads(response.read().decode("utf-8"))
-                return response_data
-
-        except error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            Logger.log_error(
-                "APIClient",
-                f"HTTP Error {e.code}: {error_body}",
-                e,
+            data_bytes = json.dumps(data).encode("utf-8") if data else None
+            status, response_headers, payload = self._send(
+                url, method, data_bytes, headers, timeout
             )
-            try:
-                error_json = json.loads(error_body)
-                return error_json
-            except:
-                return {"success": False, "message": f"HTTP Error {e.code}"}
+
+            if status == 304 and conditional:
+                cached = self._cached_body(endpoint)
+                if cached is not None:
+                    return cached, False
+                # Validators were dropped meanwhile; ask again unconditionally
+                return self._attempt_request(endpoint, method, data, False, timeout)
+
+            body = payload.decode("utf-8")
+
+            if status >= 400:
+                Logger.log_error("APIClient", f"HTTP Error {status}: {body}")
+                try:
+                    error_json = json.loads(body)
+                except:
+                    error_json = {"success": False, "message": f"HTTP Error {status}"}
+                if isinstance(error_json, dict):
+                    error_json.setdefault("status_code", status)
+                return error_json, status >= 500
+
+            response_data = json.loads(body)
+            if conditional and isinstance(response_data, dict):
+                self._store_validators(endpoint, response_headers, response_data)
+            return response_data, False
+
+        except (OSError, http_client.HTTPException) as e:
+            Logger.log_error("APIClient", "Request failed", e)
+            return {"success": False, "message": str(e)}, True
 
         except Exception as e:
             Logger.log_error("APIClient", "Request failed", e)
-            return {"success": False, "message": str(e)}
+            return {"success": False, "message": str(e)}, False
+
+    def request_async(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self._make_request,
+            endpoint,
+            method,
+            data,
+            on_result=callback,
+            on_error=RequestExecutor.report_failure(callback, _failure_response),
+        )
+
+    def call_async(
+        self,
+        name: str,
+        *args,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **kwargs,
+    ) -> Future:
+        """Run an endpoint method such as ``"get_complaints"`` off the UI thread."""
+        return RequestExecutor.get_instance().submit(
+            getattr(self, name),
+            *args,
+            on_result=callback,
+            on_error=RequestExecutor.report_failure(callback, _failure_response),
+            **kwargs,
+        )
 
     def login(self, email: str, password: str) -> Dict[str, Any]:
         response = self._make_request(
@@ -99,25 +380,103 @@ class APIClient:
         if initial_location:
             data["location"] = initial_location
 
-        return self._make_request("/api/sos/trigger", "POST", data)
+        return self._make_request(
+            "/api/sos/trigger", "POST", data, idempotency_key=f"sos-trigger:{sos_id}"
+        )
 
     def update_sos_location(self, sos_id: str, location: Dict) -> Dict[str, Any]:
         return self._make_request(
             "/api/sos/update_location", "POST", {"sos_id": sos_id, "location": location}
         )
 
+    def update_sos_locations(
+        self, sos_id: str, locations: List[Dict]
+    ) -> Dict[str, Any]:
+        if not locations:
+            return {"success": True, "accepted": 0}
+
+        if self._batch_locations_supported:
+            first_fix = locations[0].get("timestamp")
+            idempotency_key = f"sos-locations:{sos_id}:{first_fix}:{len(locations)}"
+            response = None
+
+            if (
+                AppConfig.SOS_LOCATION_ENCODING == "compact"
+                and self._compact_locations_supported
+            ):
+                response = self._send_compact_locations(
+                    sos_id, locations, idempotency_key
+                )
+
+            if response is None:
+                response = self._make_request(
+                    "/api/sos/update_locations",
+                    "POST",
+                    {"sos_id": sos_id, "locations": locations},
+                    idempotency_key=idempotency_key,
+                )
+            if response.get("status_code") not in (404, 405):
+                return response
+
+            Logger.log_warning(
+                "APIClient", "Batched location endpoint missing, sending fixes singly"
+            )
+            self._batch_locations_supported = False
+
+        response: Dict[str, Any] = {"success": True}
+        for location in locations:
+            response = self.update_sos_location(sos_id, location)
+            if not response.get("success"):
+                break
+        return response
+
+    def _send_compact_locations(
+        self, sos_id: str, locations: List[Dict], idempotency_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Send a compact batch; None means the caller should send JSON."""
+        try:
+            data = LocationCodec.encode_b64(locations)
+        except LocationCodecError as e:
+            # Only this batch goes as JSON, so a bad fix cannot wedge replay
+            Logger.log_warning("APIClient", f"Cannot encode location batch: {e}")
+            return None
+
+        response = self._make_request(
+            "/api/sos/update_locations",
+            "POST",
+            {
+                "sos_id": sos_id,
+                "encoding": LocationCodec.ENCODING,
+                "count": len(locations),
+                "data": data,
+            },
+            idempotency_key=idempotency_key,
+        )
+        if response.get("status_code") in (400, 415, 422):
+            Logger.log_warning(
+                "APIClient", "Compact location batches rejected, using JSON"
+            )
+            self._compact_locations_supported = False
+            return None
+        return response
+
     def resolve_sos(self, sos_id: str, notes: Optional[str] = None) -> Dict[str, Any]:
         data = {"sos_id": sos_id}
         if notes:
             data["notes"] = notes
 
-        return self._make_request("/api/sos/resolve", "POST", data)
+        return self._make_request(
+            "/api/sos/resolve", "POST", data, idempotency_key=f"sos-resolve:{sos_id}"
+        )
 
     def get_active_sos(self) -> Dict[str, Any]:
         return self._make_request("/api/sos/active", "GET")
 
-    def get_sos_history(self) -> Dict[str, Any]:
-        return self._make_request("/api/sos/history", "GET")
+    def get_sos_history(self, since: Optional[str] = None) -> Dict[str, Any]:
+        endpoint = "/api/sos/history"
+        if since:
+            endpoint += f"?{urlencode({'since': since})}"
+        return self._make_request(endpoint, "GET", conditional=True)
 
     def file_complaint(
         self,
@@ -138,13 +497,25 @@ class APIClient:
         if user_id:
             payload["user_id"] = user_id  # send user_id to backend
 
-        return self._make_request("/api/complaints/file", "POST", payload)
+        return self._make_request(
+            "/api/complaints/file",
+            "POST",
+            payload,
+            idempotency_key=f"complaint:{complaint_id}",
+        )
 
-    def get_complaints(self, status: Optional[str] = None) -> Dict[str, Any]:
+    def get_complaints(
+        self, status: Optional[str] = None, since: Optional[str] = None
+    ) -> Dict[str, Any]:
         endpoint = "/api/complaints/list"
+        params = {}
         if status:
-            endpoint += f"?status={status}"
-        return self._make_request(endpoint, "GET")
+            params["status"] = status
+        if since:
+            params["since"] = since
+        if params:
+            endpoint += f"?{urlencode(params)}"
+        return self._make_request(endpoint, "GET", conditional=True)
 
     def get_complaint(self, complaint_id: str) -> Dict[str, Any]:
         return self._make_request(f"/api/complaints/{complaint_id}", "GET")
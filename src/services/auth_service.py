@@ -1,12 +1,19 @@
 import hashlib
 import uuid
-from typing import Optional, List
+from concurrent.futures import Future
+from typing import Optional, List, Callable
 from src.models.user import User
 from src.services.storage_service import StorageService
 from src.services.api_client import APIClient
+from src.services.outbox_service import OutboxService
+from src.services.request_executor import RequestExecutor
 from src.config.app_config import AppConfig
 
 
+def _failed(error: Exception) -> tuple:
+    return False, f"Request failed: {error}", None
+
+
 class AuthService:
     _instance: Optional["AuthService"] = None
 
@@ -20,20 +27,43 @@ class AuthService:
             cls._instance = cls()
         return cls._instance
 
+    def start_session(self, user: User) -> None:
+        """Use ``user``'s token and replay whatever they queued offline."""
+        token = getattr(user, "token", None)
+        if token:
+            self._api_client.set_token(token)
+            OutboxService.get_instance().activate(user.user_id)
+
+    def end_session(self) -> None:
+        self._api_client.clear_token()
+        OutboxService.get_instance().deactivate()
+
     def _hash_password(self, password: str) -> str:
         return hashlib.sha256(password.encode()).hexdigest()
 
     def _load_users(self) -> List[User]:
-        data = self._storage.load(AppConfig.USERS_FILE)
+        store = self._storage.get_record_store()
+        if store:
+            data = store.load_all("users")
+        else:
+            data = self._storage.load(AppConfig.USERS_FILE)
         if not data:
             return []
         return [User.from_dict(user_data) for user_data in data]
 
     def _save_users(self, users: List[User]) -> bool:
         data = [user.to_dict() for user in users]
+        store = self._storage.get_record_store()
+        if store:
+            return store.replace_all("users", data)
         return self._storage.save(AppConfig.USERS_FILE, data)
 
     def _find_user_by_email(self, email: str) -> Optional[User]:
+        store = self._storage.get_record_store()
+        if store:
+            user_data = store.find_user_by_email(email)
+            return User.from_dict(user_data) if user_data else None
+
         users = self._load_users()
         for user in users:
             if user.email.lower() == email.lower():
@@ -56,10 +86,12 @@ class AuthService:
             if user_data:
                 user = User.from_dict(user_data)
                 user.password_hash = self._hash_password(password)
+                user.token = response.get("token")
 
                 users = self._load_users()
                 users.append(user)
                 self._save_users(users)
+                self.start_session(user)
 
                 return True, "Registration successful", user
 
@@ -108,8 +140,7 @@ class AuthService:
                     users.append(user)
 
                 self._save_users(users)
-                if token:
-                    self._api_client.set_token(token)
+                self.start_session(user)
 
                 return True, "Login successful", user
 
@@ -123,6 +154,40 @@ class AuthService:
 
         return True, "Login successful (offline)", user
 
+    def register_async(
+        self,
+        name: str,
+        email: str,
+        phone: str,
+        password: str,
+        callback: Optional[Callable[[tuple], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.register,
+            name,
+            email,
+            phone,
+            password,
+            on_result=callback,
+            on_error=on_error or RequestExecutor.report_failure(callback, _failed),
+        )
+
+    def login_async(
+        self,
+        email: str,
+        password: str,
+        callback: Optional[Callable[[tuple], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.login,
+            email,
+            password,
+            on_result=callback,
+            on_error=on_error or RequestExecutor.report_failure(callback, _failed),
+        )
+
     def is_authenticated(self) -> bool:
         from src.state.app_state import AppState
 
@@ -1,19 +1,31 @@
+import threading
+import time
 import uuid
-from typing import Optional, List
+from concurrent.futures import Future
+from typing import Optional, List, Callable
 from src.models.complaint import Complaint
 from src.services.storage_service import StorageService
 from src.services.api_client import APIClient
+from src.services.request_executor import RequestExecutor
 from src.config.app_config import AppConfig
 from src.config.constants import ComplaintStatus
+from src.utils.sync_helper import SyncHelper
 from datetime import datetime
 
 
 class ComplaintService:
     _instance: Optional["ComplaintService"] = None
 
+    SYNC_COLLECTION = "complaints"
+
     def __init__(self):
         self._storage = StorageService.get_instance()
         self._api_client = APIClient.get_instance()
+        self._refresh_lock = threading.Lock()
+        self._refresh_future: Optional[Future] = None
+        self._last_refresh: Optional[float] = None
+        self._data_version = 0
+        self._refresh_listeners: List[Callable[[], None]] = []
 
     @classmethod
     def get_instance(cls) -> "ComplaintService":
@@ -21,22 +33,23 @@ class ComplaintService:
             cls._instance = cls()
         return cls._instance
 
+    def _parse_stored(self, data: Optional[List[dict]]) -> List[Complaint]:
+        complaints = []
+        for complaint_data in data or []:
+            try:
+                complaint = Complaint.from_dict(complaint_data)
+                complaints.append(complaint)
+            except Exception as e:
+                print(f"Error loading complaint: {e}")
+                continue
+        return complaints
+
     def _load_complaints(self) -> List[Complaint]:
         try:
-            data = self._storage.load(AppConfig.COMPLAINTS_FILE)
-            if not data:
-                return []
-
-            complaints = []
-            for complaint_data in data:
-                try:
-                    complaint = Complaint.from_dict(complaint_data)
-                    complaints.append(complaint)
-                except Exception as e:
-                    print(f"Error loading complaint: {e}")
-                    continue
-
-            return complaints
+            store = self._storage.get_record_store()
+            if store:
+                return self._parse_stored(store.load_all("complaints"))
+            return self._parse_stored(self._storage.load(AppConfig.COMPLAINTS_FILE))
         except Exception as e:
             print(f"Error loading complaints file: {e}")
             return []
@@ -44,15 +57,97 @@ class ComplaintService:
     def _save_complaints(self, complaints: List[Complaint]) -> bool:
         try:
             data = [complaint.to_dict() for complaint in complaints]
+            store = self._storage.get_record_store()
+            if store:
+                return store.replace_all("complaints", data)
             return self._storage.save(AppConfig.COMPLAINTS_FILE, data)
         except Exception as e:
             print(f"Error saving complaints: {e}")
             return False
 
+    def _add_complaint(self, complaint: Complaint) -> bool:
+        store = self._storage.get_record_store()
+        if store:
+            return store.upsert("complaints", [complaint.to_dict()])
+
+        complaints = self._load_complaints()
+        complaints.append(complaint)
+        return self._save_complaints(complaints)
+
+    def _merge_complaints(
+        self, backend_complaints: List[Complaint], deleted_ids: List[str]
+    ) -> bool:
+        store = self._storage.get_record_store()
+        if store:
+            return store.upsert(
+                "complaints", [c.to_dict() for c in backend_complaints]
+            ) and store.delete("complaints", deleted_ids)
+
+        # Merge by id so complaints only known locally survive the sync
+        merged = SyncHelper.merge_by_id(
+            self._load_complaints(),
+            backend_complaints,
+            key=lambda c: c.complaint_id,
+            deleted_ids=deleted_ids,
+        )
+        return self._save_complaints(merged)
+
+    def _query_user_complaints(
+        self, user_id: str, status: Optional[ComplaintStatus] = None
+    ) -> List[Complaint]:
+        store = self._storage.get_record_store()
+        if store:
+            return self._parse_stored(
+                store.complaints_for_user(user_id, status.value if status else None)
+            )
+
+        user_complaints = [
+            c
+            for c in self._load_complaints()
+            if c.user_id == user_id and (status is None or c.status == status)
+        ]
+        return sorted(user_complaints, key=lambda x: x.timestamp, reverse=True)
+
+    def _parse_backend_complaint(self, complaint_data: dict) -> Complaint:
+        status_str = complaint_data.get("status", "pending")
+
+        if isinstance(status_str, str):
+            try:
+                status = ComplaintStatus(status_str)
+            except ValueError:
+                print(f"Unknown status '{status_str}', using PENDING")
+                status = ComplaintStatus.PENDING
+        else:
+            status = ComplaintStatus.PENDING
+
+        timestamp_str = complaint_data.get("timestamp")
+        if timestamp_str:
+            try:
+                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+            except:
+                timestamp = datetime.now()
+        else:
+            timestamp = datetime.now()
+
+        complaint = Complaint(
+            complaint_id=complaint_data["complaint_id"],
+            user_id=str(complaint_data["user_id"]),
+            title=complaint_data["title"],
+            description=complaint_data["description"],
+            status=status,
+            timestamp=timestamp,
+        )
+
+        if "resolution_notes" in complaint_data and complaint_data["resolution_notes"]:
+            complaint.resolution_notes = complaint_data["resolution_notes"]
+
+        return complaint
+
     def sync_from_backend(self) -> bool:
         try:
-            print("Syncing complaints from backend...")
-            response = self._api_client.get_complaints()
+            since = self._storage.get_sync_cursor(self.SYNC_COLLECTION)
+            print(f"Syncing complaints from backend (since={since})...")
+            response = self._api_client.get_complaints(since=since)
 
             if not response:
                 print("No response from backend")
@@ -62,53 +157,18 @@ class ComplaintService:
                 print(f"Backend error: {response.get('message')}")
                 return False
 
-            backend_complaints_data = response.get("complaints", [])
-            print(f"Received {len(backend_complaints_data)} complaints from backend")
-
-            if not backend_complaints_data:
-                print("No complaints from backend")
+            if response.get("not_modified"):
+                print("Complaints unchanged on backend, keeping local copy")
                 return True
 
+            backend_complaints_data = response.get("complaints", [])
+            deleted_ids = response.get("deleted_ids") or []
+            print(f"Received {len(backend_complaints_data)} changed complaints")
+
             backend_complaints = []
             for complaint_data in backend_complaints_data:
                 try:
-                    status_str = complaint_data.get("status", "pending")
-
-                    if isinstance(status_str, str):
-                        try:
-                            status = ComplaintStatus(status_str)
-                        except ValueError:
-                            print(f"Unknown status '{status_str}', using PENDING")
-                            status = ComplaintStatus.PENDING
-                    else:
-                        status = ComplaintStatus.PENDING
-
-                    timestamp_str = complaint_data.get("timestamp")
-                    if timestamp_str:
-                        try:
-                            timestamp = datetime.fromisoformat(
-                                timestamp_str.replace("Z", "+00:00")
-                            )
-                        except:
-                            timestamp = datetime.now()
-                    else:
-                        timestamp = datetime.now()
-
-                    complaint = Complaint(
-                        complaint_id=complaint_data["complaint_id"],
-                        user_id=str(complaint_data["user_id"]),
-                        title=complaint_data["title"],
-                        description=complaint_data["description"],
-                        status=status,
-                        timestamp=timestamp,
-                    )
-
-                    if (
-                        "resolution_notes" in complaint_data
-                        and complaint_data["resolution_notes"]
-                    ):
-                        complaint.resolution_notes = complaint_data["resolution_notes"]
-
+                    complaint = self._parse_backend_complaint(complaint_data)
                     backend_complaints.append(complaint)
                     print(
                         f"Parsed: {complaint.title} - Status: {complaint.status.value}"
@@ -124,17 +184,26 @@ class ComplaintService:
                     traceback.print_exc()
                     continue
 
-            if backend_complaints:
-                saved = self._save_complaints(backend_complaints)
-                if saved:
-                    print(f"Saved {len(backend_complaints)} complaints locally")
-                    return True
-                else:
+            if backend_complaints_data and not backend_complaints:
+                print("No valid complaints parsed")
+                self._api_client.clear_conditional_cache("/api/complaints/list")
+                return False
+
+            if backend_complaints or deleted_ids:
+                if not self._merge_complaints(backend_complaints, deleted_ids):
                     print("Failed to save complaints locally")
+                    self._api_client.clear_conditional_cache("/api/complaints/list")
                     return False
+                self._data_version += 1
+                print(f"Merged {len(backend_complaints)} complaints locally")
             else:
-                print("No valid complaints parsed")
-                return False
+                print("No complaint changes from backend")
+
+            self._storage.set_sync_cursor(
+                self.SYNC_COLLECTION,
+                SyncHelper.next_cursor(response, backend_complaints_data, since),
+            )
+            return True
 
         except Exception as e:
             print(f"Sync failed with exception: {e}")
@@ -170,9 +239,7 @@ class ComplaintService:
 
             if response and response.get("success"):
                 print("Complaint filed to backend successfully")
-                complaints = self._load_complaints()
-                complaints.append(new_complaint)
-                self._save_complaints(complaints)
+                self._add_complaint(new_complaint)
                 return True, "Complaint filed successfully", new_complaint
             else:
                 error_msg = (
@@ -181,42 +248,130 @@ class ComplaintService:
                     else "No response"
                 )
                 print(f"Backend filing failed: {error_msg}, saving locally")
-                complaints = self._load_complaints()
-                complaints.append(new_complaint)
-                self._save_complaints(complaints)
+                self._add_complaint(new_complaint)
+                self._queue_for_sync(new_complaint)
                 return True, f"Saved locally (will sync later)", new_complaint
 
         except Exception as e:
             print(f"Error filing complaint: {e}")
-            complaints = self._load_complaints()
-            complaints.append(new_complaint)
-            self._save_complaints(complaints)
+            self._add_complaint(new_complaint)
+            self._queue_for_sync(new_complaint)
             return True, "Saved locally (offline mode)", new_complaint
 
-    def get_user_complaints(self, user_id: str) -> List[Complaint]:
-        print(f"Getting complaints for user: {user_id}")
+    def _queue_for_sync(self, complaint: Complaint) -> None:
+        self._storage.enqueue_outbox(
+            "complaint",
+            complaint.complaint_id,
+            {
+                "complaint_id": complaint.complaint_id,
+                "title": complaint.title,
+                "description": complaint.description,
+                "user_id": complaint.user_id,
+            },
+            owner=complaint.user_id,
+        )
 
-        synced = self.sync_from_backend()
-        if synced:
-            print("Sync successful, loading from local storage")
-        else:
-            print("Sync failed, using cached data")
+    def file_complaint_async(
+        self,
+        user_id: str,
+        title: str,
+        description: str,
+        callback: Optional[Callable[[tuple], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.file_complaint,
+            user_id,
+            title,
+            description,
+            on_result=callback,
+            on_error=on_error
+            or RequestExecutor.report_failure(
+                callback, lambda e: (False, f"Request failed: {e}", None)
+            ),
+        )
 
-        all_complaints = self._load_complaints()
-        user_complaints = [c for c in all_complaints if c.user_id == user_id]
+    def add_refresh_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` on the UI thread when a refresh changes local data."""
+        if callback not in self._refresh_listeners:
+            self._refresh_listeners.append(callback)
 
-        sorted_complaints = sorted(
-            user_complaints, key=lambda x: x.timestamp, reverse=True
+    def remove_refresh_listener(self, callback: Callable[[], None]) -> None:
+        if callback in self._refresh_listeners:
+            self._refresh_listeners.remove(callback)
+
+    def is_stale(self) -> bool:
+        return (
+            self._last_refresh is None
+            or time.monotonic() - self._last_refresh > AppConfig.COMPLAINT_CACHE_TTL
         )
-        print(f"Found {len(sorted_complaints)} complaints for user")
 
-        for complaint in sorted_complaints:
-            print(f"  - {complaint.title}: {complaint.status.value}")
+    def invalidate_cache(self) -> None:
+        """Make the next read trigger a refresh, e.g. after logout."""
+        self._last_refresh = None
+
+    def refresh_if_stale(self, force: bool = False) -> Optional[Future]:
+        """Start a background sync unless one ran within the TTL or is running."""
+        with self._refresh_lock:
+            if self._refresh_future and not self._refresh_future.done():
+                return self._refresh_future
+            if not force and not self.is_stale():
+                return None
+
+            # Counted from the attempt, so an unreachable backend is not
+            # retried on every read
+            self._last_refresh = time.monotonic()
+            self._refresh_future = RequestExecutor.get_instance().submit(
+                self._refresh, on_result=self._on_refreshed
+            )
+            return self._refresh_future
+
+    def _refresh(self) -> bool:
+        version = self._data_version
+        if not self.sync_from_backend():
+            print("Background complaint refresh failed, keeping cached data")
+        return self._data_version != version
+
+    def _on_refreshed(self, changed: bool) -> None:
+        if not changed:
+            return
+        for callback in list(self._refresh_listeners):
+            callback()
+
+    def get_user_complaints(self, user_id: str) -> List[Complaint]:
+        """Local complaints for ``user_id``; never waits on the network."""
+        self.refresh_if_stale()
 
+        sorted_complaints = self._query_user_complaints(user_id)
+        print(f"Found {len(sorted_complaints)} complaints for user {user_id}")
         return sorted_complaints
 
+    def get_user_complaints_async(
+        self,
+        user_id: str,
+        callback: Optional[Callable[[List[Complaint]], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.get_user_complaints,
+            user_id,
+            on_result=callback,
+            on_error=on_error or RequestExecutor.report_failure(callback, lambda e: []),
+        )
+
+    def get_user_complaints_by_status(
+        self, user_id: str, status: ComplaintStatus
+    ) -> List[Complaint]:
+        return self._query_user_complaints(user_id, status)
+
     def get_complaint_by_id(self, complaint_id: str) -> Optional[Complaint]:
-        self.sync_from_backend()
+        self.refresh_if_stale()
+
+        store = self._storage.get_record_store()
+        if store:
+            complaint_data = store.get_complaint(complaint_id)
+            return Complaint.from_dict(complaint_data) if complaint_data else None
+
         complaints = self._load_complaints()
         for complaint in complaints:
             if complaint.complaint_id == complaint_id:
@@ -224,5 +379,5 @@ class ComplaintService:
         return None
 
     def get_all_complaints(self) -> List[Complaint]:
-        self.sync_from_backend()
+        self.refresh_if_stale()
         return self._load_complaints()
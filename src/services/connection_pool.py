@@ -0,0 +1,128 @@
+import select
+import threading
+import time
+from collections import deque
+from http import client as http_client
+from typing import Dict, Tuple, Deque
+from urllib.parse import urlsplit
+
+
+PoolKey = Tuple[str, str, int]
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "last_used", "requests")
+
+    def __init__(self, conn: http_client.HTTPConnection):
+        self.conn = conn
+        self.last_used = time.monotonic()
+        self.requests = 0
+
+
+class ConnectionPool:
+    """Keeps a few HTTP/1.1 keep-alive connections open per host."""
+
+    def __init__(
+        self, max_per_host: int = 2, idle_timeout: float = 30.0, timeout: float = 10.0
+    ):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Dict[PoolKey, Deque[_PooledConnection]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "stale": 0, "closed": 0}
+
+    @staticmethod
+    def key_for(url: str) -> PoolKey:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        return scheme, parts.hostname or "", port
+
+    def _new_connection(self, key: PoolKey) -> _PooledConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http_client.HTTPSConnection(host, port, timeout=self.timeout)
+        else:
+            conn = http_client.HTTPConnection(host, port, timeout=self.timeout)
+        with self._lock:
+            self._stats["created"] += 1
+        return _PooledConnection(conn)
+
+    def _is_stale(self, pooled: _PooledConnection) -> bool:
+        if time.monotonic() - pooled.last_used > self.idle_timeout:
+            return True
+
+        sock = pooled.conn.sock
+        if sock is None:
+            return True
+
+        # An idle keep-alive socket should have nothing to read. If it is
+        # readable the server either closed it (EOF) or sent garbage.
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def acquire(self, url: str) -> Tuple[_PooledConnection, bool]:
+        """Return a connection for ``url`` and whether it was reused."""
+        key = self.key_for(url)
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+
+            if pooled is None:
+                return self._new_connection(key), False
+
+            if self._is_stale(pooled):
+                self._close(pooled, stale=True)
+                continue
+
+            with self._lock:
+                self._stats["reused"] += 1
+            return pooled, True
+
+    def release(self, url: str, pooled: _PooledConnection, reusable: bool) -> None:
+        if not reusable or pooled.conn.sock is None:
+            self._close(pooled)
+            return
+
+        pooled.last_used = time.monotonic()
+        pooled.requests += 1
+        key = self.key_for(url)
+
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_per_host:
+                idle.append(pooled)
+                return
+
+        self._close(pooled)
+
+    def discard(self, pooled: _PooledConnection) -> None:
+        self._close(pooled, stale=True)
+
+    def _close(self, pooled: _PooledConnection, stale: bool = False) -> None:
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._stats["stale" if stale else "closed"] += 1
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_lists:
+            for pooled in idle:
+                self._close(pooled)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(idle) for idle in self._idle.values())
+        return stats
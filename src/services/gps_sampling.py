@@ -0,0 +1,149 @@
+import time
+from collections import deque
+from typing import Optional, List, Dict, Any, Deque, Tuple
+from src.config.app_config import AppConfig
+from src.models.location import Location
+
+# Floor for a fix's error radius when the provider reports none (or 0)
+_MIN_ACCURACY_M = 5.0
+# Consecutive fixes that must disagree with the current motion state
+_MOTION_CONFIRM_FIXES = 2
+
+
+class AdaptiveSamplingController:
+    """Chooses the GPS update interval from the SOS phase and recent motion.
+
+    Full rate for GPS_BURST_SECONDS after tracking starts. Motion is judged
+    from the displacement across the last GPS_MOTION_WINDOW seconds of fixes
+    compared with their combined accuracy, with a dead band and a
+    confirmation count so GPS noise cannot toggle it. While still, the
+    interval doubles (up to GPS_MAX_INTERVAL); while moving, or while fixes
+    are worse than GPS_BAD_ACCURACY, it returns to GPS_MIN_INTERVAL. Either
+    change waits at least GPS_MIN_DWELL seconds after the previous one.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = AppConfig.GPS_MIN_INTERVAL,
+        max_interval: float = AppConfig.GPS_MAX_INTERVAL,
+        burst_seconds: float = AppConfig.GPS_BURST_SECONDS,
+        motion_window: float = AppConfig.GPS_MOTION_WINDOW,
+        min_dwell: float = AppConfig.GPS_MIN_DWELL,
+        bad_accuracy: float = AppConfig.GPS_BAD_ACCURACY,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.burst_seconds = burst_seconds
+        self.motion_window = motion_window
+        self.min_dwell = min_dwell
+        self.bad_accuracy = bad_accuracy
+        self.reset()
+
+    def reset(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self.interval = self.min_interval
+        self.moving = True
+        self._started_at = now
+        self._changed_at = now
+        self._state_since = now
+        self._disagreements = 0
+        self._window: Deque[Tuple[float, Location]] = deque()
+
+    @staticmethod
+    def _radius(location: Location) -> float:
+        return max(location.accuracy or 0.0, _MIN_ACCURACY_M)
+
+    def _classify(self) -> bool:
+        """Raw motion verdict for the current window."""
+        if len(self._window) < 2:
+            return self.moving
+
+        first = self._window[0][1]
+        last = self._window[-1][1]
+        noise = self._radius(first) + self._radius(last)
+        displacement = first.distance_to(last)
+
+        if displacement > noise:
+            return True
+        if displacement < noise / 2:
+            return False
+        # Dead band: not enough evidence either way
+        return self.moving
+
+    def _update_motion(self, location: Location, now: float) -> None:
+        self._window.append((now, location))
+        # Keep one fix at or beyond the window edge as the baseline
+        while len(self._window) > 2 and self._window[1][0] <= now - self.motion_window:
+            self._window.popleft()
+
+        if self._classify() == self.moving:
+            self._disagreements = 0
+            return
+
+        self._disagreements += 1
+        if self._disagreements >= _MOTION_CONFIRM_FIXES:
+            self.moving = not self.moving
+            self._state_since = now
+            self._disagreements = 0
+
+    def on_fix(
+        self, location: Location, now: Optional[float] = None
+    ) -> Optional[float]:
+        """Feed a fix; returns the new interval if it changed, else None."""
+        now = time.monotonic() if now is None else now
+
+        # A poor fix says nothing about motion, but more fixes are needed
+        # until a good one arrives
+        poor = location.accuracy is not None and location.accuracy > self.bad_accuracy
+        if not poor:
+            self._update_motion(location, now)
+
+        if poor or self.moving or now - self._started_at < self.burst_seconds:
+            target = self.min_interval
+        elif now - self._state_since >= self.min_dwell:
+            target = min(self.interval * 2, self.max_interval)
+        else:
+            target = self.interval
+
+        if target == self.interval or now - self._changed_at < self.min_dwell:
+            return None
+        self.interval = target
+        self._changed_at = now
+        return self.interval
+
+
+def simulate(
+    trace: List[Location], controller: Optional[AdaptiveSamplingController] = None
+) -> Dict[str, Any]:
+    """Replay a full-rate recorded trace through the controller.
+
+    A fix is taken only once the current interval has elapsed since the last
+    one. Energy is estimated as proportional to the number of fixes, so the
+    ratio is relative to sampling the whole trace at full rate.
+    """
+    controller = controller or AdaptiveSamplingController()
+    if not trace:
+        return {"fixes": 0, "full_rate_fixes": 0, "estimated_energy_ratio": 0.0}
+
+    start = trace[0].timestamp
+    controller.reset(now=0.0)
+    taken = 0
+    last_taken: Optional[float] = None
+    reconfigurations = 0
+
+    for location in trace:
+        t = (location.timestamp - start).total_seconds()
+        if last_taken is not None and t - last_taken < controller.interval:
+            continue
+        last_taken = t
+        taken += 1
+        if controller.on_fix(location, now=t) is not None:
+            reconfigurations += 1
+
+    return {
+        "fixes": taken,
+        "full_rate_fixes": len(trace),
+        "reconfigurations": reconfigurations,
+        "final_interval": controller.interval,
+        "estimated_energy_ratio": taken / len(trace),
+    }
@@ -3,6 +3,9 @@ from kivy.clock import Clock
 from kivy.utils import platform
 from datetime import datetime
 from typing import Optional, Callable
+from src.utils.lazy_import import lazy_import
+
+jnius = lazy_import("jnius")
 
 
 class HardwareTriggerService:
@@ -125,11 +128,9 @@ class HardwareTriggerService:
         """Vibrate phone to confirm SOS trigger"""
         if platform == "android":
             try:
-                from jnius import autoclass
-
-                PythonActivity = autoclass("org.kivy.android.PythonActivity")
-                Context = autoclass("android.content.Context")
-                Vibrator = autoclass("android.os.Vibrator")
+                PythonActivity = jnius.autoclass("org.kivy.android.PythonActivity")
+                Context = jnius.autoclass("android.content.Context")
+                Vibrator = jnius.autoclass("android.os.Vibrator")
 
                 activity = PythonActivity.mActivity
                 vibrator = activity.getSystemService(Context.VIBRATOR_SERVICE)
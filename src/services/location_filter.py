@@ -0,0 +1,85 @@
+from typing import Optional, Dict, Tuple
+from src.config.app_config import AppConfig
+from src.models.location import Location
+
+
+class LocationFilter:
+    """Drops fixes that add no information to an SOS track.
+
+    Each fix is compared with the last accepted one. Repeats, fixes too close
+    in time, fixes inside the accuracy radius and physically impossible
+    jumps are rejected. A fix is always let through after
+    LOCATION_FILTER_HEARTBEAT seconds so a stationary SOS keeps reporting.
+    """
+
+    def __init__(self):
+        self._last: Optional[Location] = None
+        self._last_seen: Optional[Location] = None
+        self._stats: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self, last_accepted: Optional[Location] = None) -> None:
+        self._last = last_accepted
+        self._last_seen = last_accepted
+        self._stats = {
+            "seen": 0,
+            "accepted": 0,
+            "duplicate": 0,
+            "too_soon": 0,
+            "inaccurate": 0,
+            "outlier": 0,
+            "stationary": 0,
+        }
+
+    def accept(self, location: Location) -> bool:
+        self._stats["seen"] += 1
+        accepted, reason = self._check(location)
+        self._last_seen = location
+        if accepted:
+            self._last = location
+            self._stats["accepted"] += 1
+        else:
+            self._stats[reason] += 1
+        return accepted
+
+    def _check(self, location: Location) -> Tuple[bool, str]:
+        accuracy = location.accuracy or 0.0
+        if (
+            not location.is_valid()
+            or accuracy > AppConfig.LOCATION_FILTER_MAX_ACCURACY
+        ):
+            return False, "inaccurate"
+
+        # The same fix read twice, whether or not it was kept the first time
+        if self._last_seen and location.timestamp == self._last_seen.timestamp:
+            return False, "duplicate"
+
+        last = self._last
+        if last is None:
+            return True, ""
+
+        elapsed = (location.timestamp - last.timestamp).total_seconds()
+        if elapsed < AppConfig.LOCATION_FILTER_MIN_GAP:
+            return False, "too_soon"
+
+        distance = last.distance_to(location)
+        # Distance the two accuracy circles can't explain
+        uncertainty = accuracy + (last.accuracy or 0.0)
+        if (distance - uncertainty) / elapsed > AppConfig.LOCATION_FILTER_MAX_SPEED:
+            return False, "outlier"
+
+        threshold = max(
+            AppConfig.LOCATION_FILTER_MIN_DISTANCE,
+            AppConfig.LOCATION_FILTER_ACCURACY_FACTOR * accuracy,
+        )
+        if distance < threshold and elapsed < AppConfig.LOCATION_FILTER_HEARTBEAT:
+            return False, "stationary"
+
+        return True, ""
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = dict(self._stats)
+        dropped = stats["seen"] - stats["accepted"]
+        stats["dropped"] = dropped
+        stats["drop_rate"] = dropped / stats["seen"] if stats["seen"] else 0.0
+        return stats
@@ -1,7 +1,15 @@
-from typing import Optional, Callable
+import threading
+from collections import deque
+from typing import Optional, Callable, List, Tuple, Deque
+from kivy.clock import Clock
 from kivy.utils import platform
+from src.config.app_config import AppConfig
 from src.models.location import Location
 from src.core.permissions import PermissionManager
+from src.services.gps_sampling import AdaptiveSamplingController
+from src.utils.lazy_import import lazy_import
+
+plyer = lazy_import("plyer")
 
 
 class LocationService:
@@ -11,12 +19,20 @@ class LocationService:
         self._current_location: Optional[Location] = None
         self._is_tracking = False
         self._permission_manager = PermissionManager.get_instance()
+        # plyer is imported on the first start_tracking, not at construction
         self._gps = None
-
-        if platform == "android":
-            from plyer import gps
-
-            self._gps = gps
+        # Fixes arrive on the GPS thread; (seq, fix) pairs, oldest first
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffer: Deque[Tuple[int, Location]] = deque(
+            maxlen=AppConfig.LOCATION_BUFFER_SIZE
+        )
+        self._subscribers: List[Tuple[Callable[[Location], None], bool]] = []
+        self._sampling = AdaptiveSamplingController()
+        # Serializes provider start/stop across the Kivy and SOS threads; the
+        # generation lets a queued reconfiguration notice it is stale
+        self._provider_lock = threading.Lock()
+        self._generation = 0
 
     @classmethod
     def get_instance(cls) -> "LocationService":
@@ -38,10 +54,67 @@ class LocationService:
         accuracy = kwargs.get("accuracy")
 
         if latitude is not None and longitude is not None:
-            self._current_location = Location(
-                latitude=latitude, longitude=longitude, accuracy=accuracy
+            self.publish(
+                Location(latitude=latitude, longitude=longitude, accuracy=accuracy)
+            )
+
+    def publish(self, location: Location) -> int:
+        """Record a new fix and hand it to every subscriber once."""
+        with self._lock:
+            self._seq += 1
+            self._buffer.append((self._seq, location))
+            self._current_location = location
+            seq = self._seq
+            subscribers = list(self._subscribers)
+            new_interval = None
+            generation = self._generation
+            if self._is_tracking:
+                new_interval = self._sampling.on_fix(location)
+
+        if new_interval is not None:
+            # Provider calls belong on the Kivy thread, not the GPS callback
+            Clock.schedule_once(
+                lambda dt: self._apply_interval(new_interval, generation), 0
             )
 
+        for callback, main_thread in subscribers:
+            if main_thread:
+                Clock.schedule_once(lambda dt, cb=callback: cb(location), 0)
+            else:
+                try:
+                    callback(location)
+                except Exception as e:
+                    print(f"Location subscriber failed: {e}")
+        return seq
+
+    def subscribe(
+        self, callback: Callable[[Location], None], main_thread: bool = True
+    ) -> None:
+        """Call ``callback`` with each new fix, on the Kivy thread by default.
+
+        With ``main_thread=False`` it runs on the GPS thread and must not block.
+        """
+        with self._lock:
+            if all(cb != callback for cb, _ in self._subscribers):
+                self._subscribers.append((callback, main_thread))
+
+    def unsubscribe(self, callback: Callable[[Location], None]) -> None:
+        with self._lock:
+            self._subscribers = [
+                (cb, main) for cb, main in self._subscribers if cb != callback
+            ]
+
+    def get_cursor(self) -> int:
+        """Sequence number of the newest fix; pass it to ``get_since`` later."""
+        with self._lock:
+            return self._seq
+
+    def get_since(self, cursor: int) -> Tuple[List[Location], int]:
+        """Fixes newer than ``cursor`` still in the buffer, and the new cursor."""
+        with self._lock:
+            fixes = [location for seq, location in self._buffer if seq > cursor]
+            return fixes, self._seq
+
     def _on_status(self, stype, status) -> None:
         if stype == "provider-enabled":
             print("GPS provider enabled")
@@ -53,29 +126,69 @@ class LocationService:
     ) -> None:
         self._permission_manager.request_location_permission(callback)
 
+    def _get_gps(self):
+        if self._gps is None and platform == "android":
+            try:
+                self._gps = plyer.gps
+            except ImportError as e:
+                print(f"GPS not available: {e}")
+        return self._gps
+
     def start_tracking(self) -> bool:
         if not self._permission_manager.check_location_permission():
             return False
 
-        if self._gps and not self._is_tracking:
+        if not self._get_gps():
+            return False
+
+        with self._provider_lock:
+            if self._is_tracking:
+                return False
             try:
                 self._gps.configure(
                     on_location=self._on_location_update, on_status=self._on_status
                 )
-                self._gps.start(minTime=1000, minDistance=0)
-                self._is_tracking = True
+                with self._lock:
+                    # Every SOS starts at full rate; the controller backs off later
+                    self._sampling.reset()
+                    self._generation += 1
+                    self._is_tracking = True
+                self._gps.start(
+                    minTime=int(self._sampling.interval * 1000), minDistance=0
+                )
                 return True
             except Exception as e:
+                with self._lock:
+                    self._is_tracking = False
                 print(f"Failed to start GPS tracking: {e}")
                 return False
 
-        return False
+    def _apply_interval(self, interval: float, generation: int) -> None:
+        with self._provider_lock:
+            # Tracking stopped (or restarted) since this was scheduled
+            if not (self._gps and self._is_tracking):
+                return
+            if generation != self._generation:
+                return
+            try:
+                self._gps.stop()
+                self._gps.start(minTime=int(interval * 1000), minDistance=0)
+                print(f"GPS interval set to {interval:g}s")
+            except Exception as e:
+                print(f"Failed to reconfigure GPS: {e}")
+
+    def get_sampling_interval(self) -> float:
+        return self._sampling.interval
 
     def stop_tracking(self) -> None:
-        if self._gps and self._is_tracking:
+        with self._provider_lock:
+            if not (self._gps and self._is_tracking):
+                return
+            with self._lock:
+                self._is_tracking = False
+                self._generation += 1
             try:
                 self._gps.stop()
-                self._is_tracking = False
             except Exception as e:
                 print(f"Failed to stop GPS tracking: {e}")
 
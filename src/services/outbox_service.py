@@ -0,0 +1,172 @@
+import threading
+import time
+from typing import Optional, Dict, Any
+from kivy.clock import Clock
+from src.services.storage_service import StorageService
+from src.services.api_client import APIClient
+from src.services.request_executor import RequestExecutor
+from src.config.app_config import AppConfig
+
+# Client errors that will never succeed on replay; 409 means already applied
+_PERMANENT_FAILURES = {400, 404, 409, 410, 422}
+# The entry is fine but the session is not; wait for the next sign-in
+_AUTH_FAILURES = {401, 403}
+
+
+class OutboxService:
+    """Replays mutations queued while offline, oldest first."""
+
+    _instance: Optional["OutboxService"] = None
+
+    def __init__(self):
+        self._storage = StorageService.get_instance()
+        self._api_client = APIClient.get_instance()
+        self._replay_lock = threading.Lock()
+        self._replay_event = None
+        # Replay only runs for a signed-in user with a token, and only sends
+        # that user's entries
+        self._user_id: Optional[str] = None
+        self._auth_blocked = False
+        self._metrics: Dict[str, Any] = {
+            "replayed": 0,
+            "dropped": 0,
+            "failed_passes": 0,
+            "auth_pauses": 0,
+            "last_replay_at": None,
+            "last_replay_seconds": None,
+            "last_delivery_delay": None,
+            "max_delivery_delay": 0.0,
+        }
+
+    @classmethod
+    def get_instance(cls) -> "OutboxService":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def start(self, interval: float = AppConfig.OUTBOX_REPLAY_INTERVAL) -> None:
+        if self._replay_event is None:
+            self._replay_event = Clock.schedule_interval(
+                lambda dt: self.replay_async(), interval
+            )
+        self.replay_async()
+
+    def stop(self) -> None:
+        if self._replay_event:
+            self._replay_event.cancel()
+            self._replay_event = None
+
+    def activate(self, user_id: str) -> None:
+        """Resume replay for ``user_id``; call once their token is set."""
+        self._user_id = user_id
+        self._auth_blocked = False
+        self.replay_async()
+
+    def deactivate(self) -> None:
+        self._user_id = None
+
+    def _can_replay(self) -> bool:
+        return (
+            self._user_id is not None
+            and not self._auth_blocked
+            and self._api_client.has_token()
+        )
+
+    def replay_async(self) -> None:
+        if not self._can_replay():
+            return
+        if self._storage.peek_outbox(limit=1, owner=self._user_id):
+            RequestExecutor.get_instance().submit(self.replay)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        outbox = self._storage.peek_outbox()
+        metrics = dict(self._metrics)
+        metrics["depth"] = len(outbox)
+        metrics["oldest_age"] = (
+            time.time() - outbox[0]["created_at"] if outbox else None
+        )
+        return metrics
+
+    def replay(self, max_entries: int = AppConfig.OUTBOX_BATCH_SIZE) -> int:
+        """Send up to ``max_entries`` queued entries; stops at the first failure."""
+        if not self._replay_lock.acquire(blocking=False):
+            return 0
+
+        started = time.monotonic()
+        delivered = 0
+        try:
+            if not self._can_replay():
+                return 0
+            entries = self._storage.peek_outbox(
+                limit=max_entries, owner=self._user_id
+            )
+            if not entries:
+                return 0
+
+            print(f"Replaying {len(entries)} outbox entries...")
+            for entry in entries:
+                response = self._dispatch(entry)
+
+                if response.get("success"):
+                    self._record_delivery(entry)
+                    delivered += 1
+                elif response.get("status_code") in _PERMANENT_FAILURES:
+                    print(
+                        f"Dropping outbox entry {entry['kind']}:{entry['key']}: "
+                        f"{response.get('message')}"
+                    )
+                    self._metrics["dropped"] += 1
+                elif response.get("status_code") in _AUTH_FAILURES:
+                    # Nothing is dropped; replay resumes on the next activate()
+                    self._auth_blocked = True
+                    self._metrics["auth_pauses"] += 1
+                    print("Outbox replay paused until the user signs in again")
+                    break
+                else:
+                    # Keep ordering: nothing later may overtake this entry
+                    self._metrics["failed_passes"] += 1
+                    print(f"Outbox replay paused: {response.get('message')}")
+                    break
+
+                self._storage.complete_outbox(entry)
+
+            return delivered
+        except Exception as e:
+            print(f"Outbox replay failed: {e}")
+            return delivered
+        finally:
+            self._metrics["last_replay_at"] = time.time()
+            self._metrics["last_replay_seconds"] = time.monotonic() - started
+            self._replay_lock.release()
+
+    def _record_delivery(self, entry: dict) -> None:
+        delay = time.time() - entry["created_at"]
+        self._metrics["replayed"] += 1
+        self._metrics["last_delivery_delay"] = delay
+        self._metrics["max_delivery_delay"] = max(
+            self._metrics["max_delivery_delay"], delay
+        )
+
+    def _dispatch(self, entry: dict) -> Dict[str, Any]:
+        kind = entry["kind"]
+        payload = entry["payload"]
+
+        if kind == "complaint":
+            return self._api_client.file_complaint(
+                payload["complaint_id"],
+                payload["title"],
+                payload["description"],
+                user_id=payload.get("user_id"),
+            )
+        if kind == "sos_trigger":
+            return self._api_client.trigger_sos(
+                payload["sos_id"], payload.get("location")
+            )
+        if kind == "sos_locations":
+            return self._api_client.update_sos_locations(
+                payload["sos_id"], payload["locations"]
+            )
+        if kind == "sos_resolve":
+            return self._api_client.resolve_sos(payload["sos_id"], payload.get("notes"))
+
+        return {"success": False, "status_code": 400, "message": f"Unknown {kind}"}
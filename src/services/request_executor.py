@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Callable, Any
+from kivy.clock import Clock
+from src.config.app_config import AppConfig
+
+
+class RequestExecutor:
+    """Runs blocking calls on worker threads and reports back on the Kivy thread."""
+
+    _instance: Optional["RequestExecutor"] = None
+
+    def __init__(self, max_workers: int = AppConfig.REQUEST_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyraksha-io"
+        )
+        self._urgent_executor = ThreadPoolExecutor(
+            max_workers=AppConfig.REQUEST_URGENT_WORKERS,
+            thread_name_prefix="pyraksha-sos",
+        )
+
+    @classmethod
+    def get_instance(cls) -> "RequestExecutor":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        urgent: bool = False,
+        **kwargs,
+    ) -> Future:
+        """Run ``fn`` on a worker; ``urgent`` work has its own thread."""
+        executor = self._urgent_executor if urgent else self._executor
+        future = executor.submit(fn, *args, **kwargs)
+
+        if on_result or on_error:
+            future.add_done_callback(
+                lambda f: self._deliver(f, on_result, on_error)
+            )
+
+        return future
+
+    @staticmethod
+    def report_failure(
+        callback: Optional[Callable[[Any], None]],
+        make_result: Callable[[Exception], Any],
+    ) -> Optional[Callable[[Exception], None]]:
+        """``on_error`` handler that passes ``make_result(error)`` to ``callback``.
+
+        Lets ``*_async`` callers that only supply a result callback hear
+        about failures in the shape they already handle.
+        """
+        if callback is None:
+            return None
+        return lambda error: callback(make_result(error))
+
+    def _deliver(
+        self,
+        future: Future,
+        on_result: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]],
+    ) -> None:
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            print(f"Background request failed: {error}")
+            if on_error:
+                Clock.schedule_once(lambda dt: on_error(error), 0)
+            return
+
+        if on_result:
+            result = future.result()
+            Clock.schedule_once(lambda dt: on_result(result), 0)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+        self._urgent_executor.shutdown(wait=wait)
@@ -0,0 +1,150 @@
+import queue
+import threading
+import time
+from typing import Optional, Callable, Any, Dict
+from kivy.clock import Clock
+from src.config.app_config import AppConfig
+from src.models.location import Location
+from src.services.location_service import LocationService
+from src.services.sos_service import SOSService
+
+
+class SOSPipeline:
+    """Single worker thread that uploads and persists SOS work in order.
+
+    The SOS screen hands fixes over without waiting; the thread feeds them to
+    SOSService one at a time, so a stalled request delays later fixes but
+    never the UI. ``get_snapshot`` is safe to read from the UI thread.
+    """
+
+    _instance: Optional["SOSPipeline"] = None
+
+    def __init__(self):
+        self._sos_service = SOSService.get_instance()
+        self._location_service = LocationService.get_instance()
+        self._cursor = 0
+        self._attached = False
+        self._drain_queued = False
+        self._flush_queued = False
+        self._flush_event = None
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot_lock = threading.Lock()
+        # Replaced wholesale, never mutated, so readers need no lock
+        self._snapshot: Dict[str, Any] = {
+            "latest_location": None,
+            "processed": 0,
+            "backlog": 0,
+            "last_processed_at": None,
+        }
+
+    @classmethod
+    def get_instance(cls) -> "SOSPipeline":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="pyraksha-sos", daemon=True
+            )
+            self._thread.start()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        callback: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Run ``fn`` after everything queued before it; result goes to callback."""
+        self._ensure_thread()
+        self._queue.put((fn, args, callback))
+        self._update_snapshot(backlog=self._queue.qsize())
+
+    def submit_location(self, location: Location) -> None:
+        self._update_snapshot(latest_location=location)
+        self.submit(self._sos_service.update_location, location)
+
+    def attach(self) -> None:
+        """Start feeding new GPS fixes to the active SOS."""
+        if self._attached:
+            return
+        self._attached = True
+        # Fixes from before the SOS are not part of its track
+        self._cursor = self._location_service.get_cursor()
+        self._location_service.subscribe(self._on_fix, main_thread=False)
+        # Batched fixes must go out by age even when no new fix is accepted
+        self._flush_event = Clock.schedule_interval(
+            lambda dt: self._queue_flush(), AppConfig.SOS_FLUSH_CHECK_INTERVAL
+        )
+
+    def detach(self) -> None:
+        if self._attached:
+            self._attached = False
+            self._location_service.unsubscribe(self._on_fix)
+        if self._flush_event:
+            self._flush_event.cancel()
+            self._flush_event = None
+
+    def _queue_flush(self) -> None:
+        if not self._flush_queued:
+            self._flush_queued = True
+            self.submit(self._flush_due)
+
+    def _flush_due(self) -> bool:
+        self._flush_queued = False
+        return self._sos_service.flush_if_due()
+
+    def _on_fix(self, location: Location) -> None:
+        # GPS thread: record and wake the worker, never block here
+        self._update_snapshot(latest_location=location)
+        if not self._drain_queued:
+            self._drain_queued = True
+            self.submit(self._drain_fixes)
+
+    def _drain_fixes(self) -> int:
+        # Clear the flag first so a fix arriving mid-drain queues another pass
+        self._drain_queued = False
+        fixes, self._cursor = self._location_service.get_since(self._cursor)
+        for location in fixes:
+            self._sos_service.update_location(location)
+        return len(fixes)
+
+    def resolve(self, callback: Optional[Callable[[tuple], None]] = None) -> None:
+        # Queued behind pending fixes so none arrive after the resolve
+        self.submit(self._resolve, callback=callback)
+
+    def _resolve(self) -> tuple:
+        self._drain_fixes()
+        result = self._sos_service.resolve_sos()
+        if result[0]:
+            self.detach()
+        return result
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        return self._snapshot
+
+    def _update_snapshot(self, **changes) -> None:
+        # Writers are the GPS thread, the worker and the UI thread
+        with self._snapshot_lock:
+            snapshot = dict(self._snapshot)
+            snapshot.update(changes)
+            self._snapshot = snapshot
+
+    def _run(self) -> None:
+        while True:
+            fn, args, callback = self._queue.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                print(f"SOS pipeline job failed: {e}")
+                result = None
+
+            self._update_snapshot(
+                processed=self._snapshot["processed"] + 1,
+                backlog=self._queue.qsize(),
+                last_processed_at=time.time(),
+            )
+            if callback:
+                Clock.schedule_once(lambda dt, r=result: callback(r), 0)
@@ -1,23 +1,41 @@
+import dataclasses
+import threading
+import time
 import uuid
-from typing import Optional, List
+from concurrent.futures import Future
+from typing import Optional, List, Callable
 from datetime import datetime
 from src.models.sos import SOS
 from src.models.location import Location
 from src.config.constants import SOSStatus
 from src.services.storage_service import StorageService
 from src.services.location_service import LocationService
+from src.services.location_filter import LocationFilter
 from src.services.api_client import APIClient
+from src.services.request_executor import RequestExecutor
 from src.config.app_config import AppConfig
+from src.utils.sync_helper import SyncHelper
+from src.utils.trajectory import TrajectorySimplifier
 
 
 class SOSService:
     _instance: Optional["SOSService"] = None
 
+    SYNC_COLLECTION = "sos_history"
+
     def __init__(self):
         self._storage = StorageService.get_instance()
         self._location_service = LocationService.get_instance()
         self._api_client = APIClient.get_instance()
         self._active_sos: Optional[SOS] = None
+        self._lock = threading.RLock()
+        self._pending_locations: List[dict] = []
+        self._last_flush: Optional[float] = None
+        self._snapshot_length = 0
+        self._journal_length = 0
+        # Fixes 1..n of the active SOS reached the backend or the outbox
+        self._uploaded_seq = 0
+        self._location_filter = LocationFilter()
         self._load_active_sos()
 
     @classmethod
@@ -30,30 +48,114 @@ class SOSService:
     def active_sos(self) -> Optional[SOS]:
         return self._active_sos
 
+    def get_active_sos(self) -> Optional[SOS]:
+        return self._active_sos
+
     def _load_active_sos(self) -> None:
         try:
             data = self._storage.load(AppConfig.ACTIVE_SOS_FILE)
             if data:
+                snapshot_seq = data.pop("journal_seq", len(data["location_history"]))
+                # Older snapshots did not record uploads; assume they covered it
+                uploaded_seq = data.pop("uploaded_seq", snapshot_seq)
                 sos = SOS.from_dict(data)
                 if sos.status == SOSStatus.ACTIVE:
+                    # Replay fixes journaled after the snapshot was written
+                    journal = self._storage.load_records(
+                        AppConfig.ACTIVE_SOS_JOURNAL_FILE
+                    )
+                    for record in journal:
+                        if "ack" in record:
+                            uploaded_seq = max(uploaded_seq, record["ack"])
+                        elif record.get("seq", 0) > snapshot_seq:
+                            sos.location_history.append(
+                                Location.from_dict(record["location"])
+                            )
                     self._active_sos = sos
+                    if sos.location_history:
+                        self._location_filter.reset(sos.location_history[-1])
+                    self._snapshot_length = snapshot_seq
+                    self._journal_length = len(journal)
+                    self._requeue_unsent(uploaded_seq)
         except Exception as e:
             print(f"Error loading active SOS: {e}")
 
     def _save_active_sos(self) -> bool:
+        """Write a full snapshot of the active SOS and restart its journal."""
         try:
             if self._active_sos:
-                return self._storage.save(
-                    AppConfig.ACTIVE_SOS_FILE, self._active_sos.to_dict()
-                )
+                data = self._active_sos.to_dict()
+                data["journal_seq"] = len(self._active_sos.location_history)
+                data["uploaded_seq"] = self._uploaded_seq
+                if not self._storage.save(AppConfig.ACTIVE_SOS_FILE, data):
+                    return False
+                self._snapshot_length = data["journal_seq"]
+                self._journal_length = 0
+                return self._storage.delete(AppConfig.ACTIVE_SOS_JOURNAL_FILE)
             else:
+                self._storage.delete(AppConfig.ACTIVE_SOS_JOURNAL_FILE)
                 return self._storage.delete(AppConfig.ACTIVE_SOS_FILE)
         except Exception as e:
             print(f"Error saving active SOS: {e}")
             return False
 
+    def _requeue_unsent(self, uploaded_seq: int) -> None:
+        """Queue recovered fixes that never reached the backend or outbox."""
+        history = self._active_sos.location_history
+        self._uploaded_seq = min(uploaded_seq, len(history))
+        self._pending_locations = history[self._uploaded_seq :].to_dicts()
+        # Due immediately: they are already late
+        self._last_flush = None
+        if self._pending_locations:
+            print(f"Re-queued {len(self._pending_locations)} unsent SOS fixes")
+
+    def _mark_uploaded(self) -> None:
+        self._uploaded_seq = len(self._active_sos.location_history)
+        if self._storage.append_record(
+            AppConfig.ACTIVE_SOS_JOURNAL_FILE, {"ack": self._uploaded_seq}
+        ):
+            self._journal_length += 1
+
+    def _journal_location(self, location: Location) -> bool:
+        record = {
+            "seq": len(self._active_sos.location_history),
+            "location": location.to_dict(),
+        }
+        if not self._storage.append_record(AppConfig.ACTIVE_SOS_JOURNAL_FILE, record):
+            return False
+        self._journal_length += 1
+
+        # Compact once the journal outgrows the snapshot. Snapshot sizes double,
+        # so the rewrite cost amortizes to O(1) per fix.
+        threshold = max(AppConfig.SOS_JOURNAL_MIN_COMPACT, self._snapshot_length)
+        if self._journal_length >= threshold:
+            return self._save_active_sos()
+        return True
+
+    def _compress_track(self, sos: SOS) -> SOS:
+        """Copy of ``sos`` with its track simplified for the archive."""
+        raw = sos.location_history
+        tolerance = AppConfig.SOS_TRACK_TOLERANCE_M
+        if tolerance <= 0 or len(raw) <= 2:
+            return sos
+
+        if AppConfig.SOS_KEEP_RAW_TRACK:
+            self._storage.save(
+                AppConfig.SOS_RAW_TRACK_FILE.format(sos_id=sos.sos_id),
+                [location.to_dict() for location in raw],
+            )
+
+        simplified = TrajectorySimplifier.simplify(raw, tolerance)
+        print(f"Archived SOS track: kept {len(simplified)} of {len(raw)} fixes")
+        return dataclasses.replace(sos, location_history=simplified)
+
     def _save_to_history(self, sos: SOS) -> bool:
         try:
+            sos = self._compress_track(sos)
+            store = self._storage.get_record_store()
+            if store:
+                return store.upsert("sos_events", [sos.to_dict()])
+
             history_data = self._storage.load(AppConfig.SOS_HISTORY_FILE) or []
             history_data.append(sos.to_dict())
             return self._storage.save(AppConfig.SOS_HISTORY_FILE, history_data)
@@ -61,10 +163,79 @@ class SOSService:
             print(f"Error saving to history: {e}")
             return False
 
+    def _parse_backend_sos(self, sos_data: dict) -> SOS:
+        status_str = sos_data.get("status", "active")
+
+        try:
+            status = SOSStatus[status_str.upper()]
+        except (KeyError, AttributeError):
+            print(f"Unknown SOS status '{status_str}', using ACTIVE")
+            status = SOSStatus.ACTIVE
+
+        sos = SOS(
+            sos_id=sos_data["sos_id"],
+            user_id=str(sos_data["user_id"]),
+            status=status,
+        )
+
+        if "start_time" in sos_data and sos_data["start_time"]:
+            try:
+                sos.start_time = datetime.fromisoformat(
+                    sos_data["start_time"].replace("Z", "+00:00")
+                )
+            except:
+                sos.start_time = datetime.now()
+
+        if "end_time" in sos_data and sos_data["end_time"]:
+            try:
+                sos.end_time = datetime.fromisoformat(
+                    sos_data["end_time"].replace("Z", "+00:00")
+                )
+            except:
+                pass
+
+        return sos
+
+    def _merge_history(
+        self, backend_sos_list: List[SOS], deleted_ids: List[str]
+    ) -> bool:
+        store = self._storage.get_record_store()
+        if store:
+            local_by_id = {}
+            for sos in backend_sos_list:
+                local_data = store.get_sos(sos.sos_id)
+                if local_data:
+                    local_by_id[sos.sos_id] = SOS.from_dict(local_data)
+        else:
+            history_data = self._storage.load(AppConfig.SOS_HISTORY_FILE) or []
+            local_sos = [SOS.from_dict(data) for data in history_data]
+            local_by_id = {sos.sos_id: sos for sos in local_sos}
+
+        # The backend list carries no track; keep the one recorded here
+        for sos in backend_sos_list:
+            local = local_by_id.get(sos.sos_id)
+            if local and not sos.location_history:
+                sos.location_history = local.location_history
+
+        if store:
+            return store.upsert(
+                "sos_events", [sos.to_dict() for sos in backend_sos_list]
+            ) and store.delete("sos_events", deleted_ids)
+
+        merged = SyncHelper.merge_by_id(
+            local_sos,
+            backend_sos_list,
+            key=lambda sos: sos.sos_id,
+            deleted_ids=deleted_ids,
+        )
+        history_data = [sos.to_dict() for sos in merged]
+        return self._storage.save(AppConfig.SOS_HISTORY_FILE, history_data)
+
     def sync_from_backend(self) -> bool:
         try:
-            print("Syncing SOS events from backend...")
-            response = self._api_client.get_sos_history()
+            since = self._storage.get_sync_cursor(self.SYNC_COLLECTION)
+            print(f"Syncing SOS events from backend (since={since})...")
+            response = self._api_client.get_sos_history(since=since)
 
             if not response:
                 print("No response from backend")
@@ -74,46 +245,18 @@ class SOSService:
                 print(f"Backend error: {response.get('message')}")
                 return False
 
-            backend_sos_data = response.get("sos_events", [])
-            print(f"Received {len(backend_sos_data)} SOS events from backend")
-
-            if not backend_sos_data:
-                print("ℹNo SOS events from backend")
+            if response.get("not_modified"):
+                print("SOS events unchanged on backend, keeping local copy")
                 return True
 
+            backend_sos_data = response.get("sos_events", [])
+            deleted_ids = response.get("deleted_ids") or []
+            print(f"Received {len(backend_sos_data)} changed SOS events")
+
             backend_sos_list = []
             for sos_data in backend_sos_data:
                 try:
-                    status_str = sos_data.get("status", "active")
-
-                    try:
-                        status = SOSStatus[status_str.upper()]
-                    except (KeyError, AttributeError):
-                        print(f"Unknown SOS status '{status_str}', using ACTIVE")
-                        status = SOSStatus.ACTIVE
-
-                    sos = SOS(
-                        sos_id=sos_data["sos_id"],
-                        user_id=str(sos_data["user_id"]),
-                        status=status,
-                    )
-
-                    if "start_time" in sos_data and sos_data["start_time"]:
-                        try:
-                            sos.start_time = datetime.fromisoformat(
-                                sos_data["start_time"].replace("Z", "+00:00")
-                            )
-                        except:
-                            sos.start_time = datetime.now()
-
-                    if "end_time" in sos_data and sos_data["end_time"]:
-                        try:
-                            sos.end_time = datetime.fromisoformat(
-                                sos_data["end_time"].replace("Z", "+00:00")
-                            )
-                        except:
-                            pass
-
+                    sos = self._parse_backend_sos(sos_data)
                     backend_sos_list.append(sos)
                     print(f"Parsed SOS: {sos.sos_id} - Status: {sos.status.value}")
 
@@ -127,18 +270,25 @@ class SOSService:
                     traceback.print_exc()
                     continue
 
-            if backend_sos_list:
-                history_data = [sos.to_dict() for sos in backend_sos_list]
-                saved = self._storage.save(AppConfig.SOS_HISTORY_FILE, history_data)
-                if saved:
-                    print(f"Saved {len(backend_sos_list)} SOS events locally")
-                    return True
-                else:
+            if backend_sos_data and not backend_sos_list:
+                print("No valid SOS events parsed")
+                self._api_client.clear_conditional_cache("/api/sos/history")
+                return False
+
+            if backend_sos_list or deleted_ids:
+                if not self._merge_history(backend_sos_list, deleted_ids):
                     print("Failed to save SOS events locally")
+                    self._api_client.clear_conditional_cache("/api/sos/history")
                     return False
+                print(f"Merged {len(backend_sos_list)} SOS events locally")
             else:
-                print("No valid SOS events parsed")
-                return False
+                print("No SOS changes from backend")
+
+            self._storage.set_sync_cursor(
+                self.SYNC_COLLECTION,
+                SyncHelper.next_cursor(response, backend_sos_data, since),
+            )
+            return True
 
         except Exception as e:
             print(f"SOS sync failed with exception: {e}")
@@ -148,6 +298,27 @@ class SOSService:
             return False
 
     def trigger_sos(self, user_id: str) -> tuple[bool, str, Optional[SOS]]:
+        with self._lock:
+            return self._trigger_sos(user_id)
+
+    def trigger_sos_async(
+        self,
+        user_id: str,
+        callback: Optional[Callable[[tuple], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.trigger_sos,
+            user_id,
+            on_result=callback,
+            on_error=on_error
+            or RequestExecutor.report_failure(
+                callback, lambda e: (False, f"SOS trigger failed: {e}", None)
+            ),
+            urgent=True,
+        )
+
+    def _trigger_sos(self, user_id: str) -> tuple[bool, str, Optional[SOS]]:
         if self._active_sos:
             return False, "An SOS is already active", self._active_sos
 
@@ -157,9 +328,12 @@ class SOSService:
 
         new_sos.activate()
 
+        self._location_filter.reset()
         current_location = self._location_service.get_current_location()
-        if current_location:
+        if current_location and self._location_filter.accept(current_location):
             new_sos.add_location(current_location)
+        else:
+            current_location = None
 
         initial_location = None
         if current_location:
@@ -183,10 +357,24 @@ class SOSService:
                     else "No response"
                 )
                 print(f"Backend SOS trigger failed: {error_msg}")
+                self._queue_for_sync(
+                    "sos_trigger",
+                    {"sos_id": new_sos.sos_id, "location": initial_location},
+                    owner=new_sos.user_id,
+                )
         except Exception as e:
             print(f"Error triggering SOS on backend: {e}")
+            self._queue_for_sync(
+                "sos_trigger",
+                {"sos_id": new_sos.sos_id, "location": initial_location},
+                owner=new_sos.user_id,
+            )
 
         self._active_sos = new_sos
+        self._pending_locations = []
+        self._last_flush = None
+        # The initial fix travelled with the trigger
+        self._uploaded_seq = len(new_sos.location_history)
 
         if self._save_active_sos():
             self._location_service.start_tracking()
@@ -196,58 +384,174 @@ class SOSService:
             return False, "Failed to activate SOS", None
 
     def update_location(self, location: Location) -> bool:
+        with self._lock:
+            return self._update_location(location)
+
+    def update_location_async(
+        self, location: Location, callback: Optional[Callable[[bool], None]] = None
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.update_location,
+            location,
+            on_result=callback,
+            on_error=RequestExecutor.report_failure(callback, lambda e: False),
+        )
+
+    def get_filter_stats(self) -> dict:
+        return self._location_filter.get_stats()
+
+    def _update_location(self, location: Location) -> bool:
         if self._active_sos and location:
+            if not self._location_filter.accept(location):
+                # Nothing new to store or send; not a failure. Earlier fixes
+                # may still be due, though.
+                self._flush_if_due()
+                return True
+
             self._active_sos.add_location(location)
+            saved = self._journal_location(location)
+
+            self._pending_locations.append(
+                {
+                    "latitude": location.latitude,
+                    "longitude": location.longitude,
+                    "accuracy": location.accuracy,
+                    "timestamp": location.timestamp.isoformat(),
+                }
+            )
+
+            self._flush_if_due()
+            return saved
+        return False
 
-            location_data = {
-                "latitude": location.latitude,
-                "longitude": location.longitude,
-                "accuracy": location.accuracy,
-                "timestamp": location.timestamp.isoformat(),
-            }
+    def flush_if_due(self) -> bool:
+        """Upload batched fixes that are old enough; called on a timer."""
+        with self._lock:
+            return self._flush_if_due()
 
-            try:
-                response = self._api_client.update_sos_location(
-                    self._active_sos.sos_id, location_data
+    def _flush_if_due(self) -> bool:
+        if self._pending_locations and self._should_flush():
+            return self._flush_locations()
+        return False
+
+    def _should_flush(self) -> bool:
+        if self._last_flush is None:
+            # First fix of this SOS goes out straight away
+            return True
+        if len(self._pending_locations) >= AppConfig.SOS_LOCATION_BATCH_SIZE:
+            return True
+        age = time.monotonic() - self._last_flush
+        return age >= AppConfig.SOS_LOCATION_UPDATE_INTERVAL
+
+    def flush_locations(self) -> bool:
+        with self._lock:
+            return self._flush_locations()
+
+    def _flush_locations(self) -> bool:
+        if not self._active_sos:
+            self._pending_locations = []
+            return False
+
+        self._last_flush = time.monotonic()
+        batch = self._pending_locations
+        self._pending_locations = []
+
+        if batch:
+            sos_id = self._active_sos.sos_id
+            if self._storage.has_outbox_entries(sos_id):
+                # The trigger is still queued; fixes must not overtake it
+                self._queue_for_sync(
+                    "sos_locations", {"sos_id": sos_id, "locations": batch}
                 )
+            else:
+                try:
+                    response = self._api_client.update_sos_locations(sos_id, batch)
+
+                    if response and response.get("success"):
+                        print(f"Uploaded {len(batch)} location(s) to backend")
+                    else:
+                        print("Location batch upload failed, queued for replay")
+                        self._queue_for_sync(
+                            "sos_locations", {"sos_id": sos_id, "locations": batch}
+                        )
+                except Exception as e:
+                    print(f"Error updating location on backend: {e}")
+                    self._queue_for_sync(
+                        "sos_locations", {"sos_id": sos_id, "locations": batch}
+                    )
+            # Sent or durably queued; either way recovery must not resend it
+            self._mark_uploaded()
 
-                if response and response.get("success"):
-                    print(f"Location updated on backend")
-                else:
-                    print(f"Location update failed on backend")
-            except Exception as e:
-                print(f"Error updating location on backend: {e}")
+        return True
 
-            return self._save_active_sos()
-        return False
+    def _queue_for_sync(
+        self, kind: str, payload: dict, owner: Optional[str] = None
+    ) -> None:
+        if owner is None and self._active_sos:
+            owner = self._active_sos.user_id
+        self._storage.enqueue_outbox(kind, payload["sos_id"], payload, owner=owner)
 
     def resolve_sos(self) -> tuple[bool, str]:
+        with self._lock:
+            return self._resolve_sos()
+
+    def resolve_sos_async(
+        self, callback: Optional[Callable[[tuple], None]] = None
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.resolve_sos,
+            on_result=callback,
+            on_error=RequestExecutor.report_failure(
+                callback, lambda e: (False, f"SOS resolve failed: {e}")
+            ),
+            urgent=True,
+        )
+
+    def _resolve_sos(self) -> tuple[bool, str]:
         if not self._active_sos:
             return False, "No active SOS to resolve"
 
+        # Last fixes must reach the backend before it marks the SOS resolved
+        self._flush_locations()
+
+        stats = self._location_filter.get_stats()
+        print(
+            f"Location filter dropped {stats['dropped']} of {stats['seen']} fixes "
+            f"({stats['drop_rate']:.0%})"
+        )
+
         self._active_sos.resolve()
         self._location_service.stop_tracking()
 
+        sos_id = self._active_sos.sos_id
         try:
-            print(f"Resolving SOS on backend: {self._active_sos.sos_id}")
-            response = self._api_client.resolve_sos(self._active_sos.sos_id)
-
-            if response and response.get("success"):
-                print("SOS resolved on backend successfully")
+            if self._storage.has_outbox_entries(sos_id):
+                print("Earlier SOS updates still queued, queueing resolve")
+                self._queue_for_sync("sos_resolve", {"sos_id": sos_id})
             else:
-                error_msg = (
-                    response.get("message", "Unknown error")
-                    if response
-                    else "No response"
-                )
-                print(f"Backend SOS resolve failed: {error_msg}")
+                print(f"Resolving SOS on backend: {sos_id}")
+                response = self._api_client.resolve_sos(sos_id)
+
+                if response and response.get("success"):
+                    print("SOS resolved on backend successfully")
+                else:
+                    error_msg = (
+                        response.get("message", "Unknown error")
+                        if response
+                        else "No response"
+                    )
+                    print(f"Backend SOS resolve failed: {error_msg}")
+                    self._queue_for_sync("sos_resolve", {"sos_id": sos_id})
         except Exception as e:
             print(f"Error resolving SOS on backend: {e}")
+            self._queue_for_sync("sos_resolve", {"sos_id": sos_id})
 
         if self._save_to_history(self._active_sos):
             resolved_sos = self._active_sos
             self._active_sos = None
-            self._storage.delete(AppConfig.ACTIVE_SOS_FILE)
+            self._save_active_sos()
+            # A resolved SOS must survive the app being killed right after
+            self._storage.flush()
             return True, "SOS resolved successfully"
         else:
             return False, "Failed to save SOS to history"
@@ -262,11 +566,7 @@ class SOSService:
             print("Sync failed, using cached data")
 
         try:
-            history_data = self._storage.load(AppConfig.SOS_HISTORY_FILE) or []
-            all_sos = [SOS.from_dict(data) for data in history_data]
-            user_sos = [sos for sos in all_sos if sos.user_id == user_id]
-
-            sorted_sos = sorted(user_sos, key=lambda x: x.start_time, reverse=True)
+            sorted_sos = self.query_user_sos(user_id)
             print(f"Found {len(sorted_sos)} SOS events for user")
 
             for sos in sorted_sos:
@@ -277,6 +577,36 @@ class SOSService:
             print(f"Error loading SOS history: {e}")
             return []
 
+    def query_user_sos(
+        self, user_id: str, status: Optional[SOSStatus] = None
+    ) -> List[SOS]:
+        """Local SOS history for a user, newest first, without syncing."""
+        store = self._storage.get_record_store()
+        if store:
+            history_data = store.sos_for_user(
+                user_id, status.value if status else None
+            )
+            return [SOS.from_dict(data) for data in history_data]
+
+        history_data = self._storage.load(AppConfig.SOS_HISTORY_FILE) or []
+        all_sos = [SOS.from_dict(data) for data in history_data]
+        user_sos = [
+            sos
+            for sos in all_sos
+            if sos.user_id == user_id and (status is None or sos.status == status)
+        ]
+        return sorted(user_sos, key=lambda x: x.start_time, reverse=True)
+
+    def get_user_sos_history_async(
+        self, user_id: str, callback: Optional[Callable[[List[SOS]], None]] = None
+    ) -> Future:
+        return RequestExecutor.get_instance().submit(
+            self.get_user_sos_history,
+            user_id,
+            on_result=callback,
+            on_error=RequestExecutor.report_failure(callback, lambda e: []),
+        )
+
     def get_active_sos_by_user(self, user_id: str) -> Optional[SOS]:
         if self._active_sos and self._active_sos.user_id == user_id:
             return self._active_sos
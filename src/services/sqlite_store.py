@@ -0,0 +1,211 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable
+from src.config.app_config import AppConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    user_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_user_id ON users (user_id);
+
+CREATE TABLE IF NOT EXISTS complaints (
+    complaint_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    timestamp TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_complaints_user_time
+    ON complaints (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints (status);
+
+CREATE TABLE IF NOT EXISTS sos_events (
+    sos_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    start_time TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sos_user_time ON sos_events (user_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_sos_status ON sos_events (status);
+"""
+
+# table -> (primary key field, indexed fields pulled out of the record dict)
+_TABLES = {
+    "users": ("email", ("user_id",)),
+    "complaints": ("complaint_id", ("user_id", "timestamp", "status")),
+    "sos_events": ("sos_id", ("user_id", "start_time", "status")),
+}
+
+
+class SQLiteStore:
+    """Indexed record storage for users, complaints and SOS events."""
+
+    _instance: Optional["SQLiteStore"] = None
+
+    def __init__(self, db_path: Optional[Path] = None):
+        AppConfig.ensure_storage_dir()
+        self._db_path = db_path or AppConfig.STORAGE_DIR / AppConfig.SQLITE_DB_FILE
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def get_instance(cls) -> "SQLiteStore":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row_values(table: str, record: Dict[str, Any]) -> tuple:
+        key_field, indexed = _TABLES[table]
+        key = record.get(key_field)
+        if table == "users":
+            key = (key or "").lower()
+        values = [key]
+        values.extend(
+            None if record.get(name) is None else str(record.get(name))
+            for name in indexed
+        )
+        values.append(json.dumps(record, ensure_ascii=False))
+        return tuple(values)
+
+    def _upsert_sql(self, table: str) -> str:
+        key_field, indexed = _TABLES[table]
+        columns = (key_field,) + indexed + ("data",)
+        placeholders = ", ".join("?" for _ in columns)
+        return (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+    def upsert(self, table: str, records: Iterable[Dict[str, Any]]) -> bool:
+        rows = [self._row_values(table, record) for record in records]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(self._upsert_sql(table), rows)
+            return True
+        except sqlite3.Error as e:
+            print(f"SQLite upsert error: {e}")
+            return False
+
+    def replace_all(self, table: str, records: Iterable[Dict[str, Any]]) -> bool:
+        rows = [self._row_values(table, record) for record in records]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(f"DELETE FROM {table}")
+                self._conn.executemany(self._upsert_sql(table), rows)
+            return True
+        except sqlite3.Error as e:
+            print(f"SQLite replace error: {e}")
+            return False
+
+    def delete(self, table: str, keys: Iterable[str]) -> bool:
+        key_field = _TABLES[table][0]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    f"DELETE FROM {table} WHERE {key_field} = ?",
+                    [(key,) for key in keys],
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"SQLite delete error: {e}")
+            return False
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def load_all(self, table: str) -> List[Dict[str, Any]]:
+        return self._query(f"SELECT data FROM {table} ORDER BY rowid")
+
+    def find_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT data FROM users WHERE email = ?", (email.lower(),))
+        return rows[0] if rows else None
+
+    def get_complaint(self, complaint_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query(
+            "SELECT data FROM complaints WHERE complaint_id = ?", (complaint_id,)
+        )
+        return rows[0] if rows else None
+
+    def get_sos(self, sos_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT data FROM sos_events WHERE sos_id = ?", (sos_id,))
+        return rows[0] if rows else None
+
+    def complaints_for_user(
+        self, user_id: str, status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        if status:
+            return self._query(
+                "SELECT data FROM complaints WHERE user_id = ? AND status = ? "
+                "ORDER BY timestamp DESC",
+                (user_id, status),
+            )
+        return self._query(
+            "SELECT data FROM complaints WHERE user_id = ? ORDER BY timestamp DESC",
+            (user_id,),
+        )
+
+    def sos_for_user(
+        self, user_id: str, status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        if status:
+            return self._query(
+                "SELECT data FROM sos_events WHERE user_id = ? AND status = ? "
+                "ORDER BY start_time DESC",
+                (user_id, status),
+            )
+        return self._query(
+            "SELECT data FROM sos_events WHERE user_id = ? ORDER BY start_time DESC",
+            (user_id,),
+        )
+
+    def is_migrated(self) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+        return row is not None
+
+    def migrate_from_json(self, storage) -> bool:
+        """Copy the legacy JSON files into the database once."""
+        if self.is_migrated():
+            return True
+
+        sources = (
+            ("users", AppConfig.USERS_FILE),
+            ("complaints", AppConfig.COMPLAINTS_FILE),
+            ("sos_events", AppConfig.SOS_HISTORY_FILE),
+        )
+        try:
+            with self._lock, self._conn:
+                for table, filename in sources:
+                    records = storage.load(filename) or []
+                    rows = [self._row_values(table, record) for record in records]
+                    self._conn.executemany(self._upsert_sql(table), rows)
+                    print(f"Migrated {len(rows)} {table} records to SQLite")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) "
+                    "VALUES ('json_migrated', '1')"
+                )
+            return True
+        except Exception as e:
+            print(f"SQLite migration failed: {e}")
+            return False
@@ -1,7 +1,17 @@
 import json
-from typing import Any, Optional
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, List, Dict, Tuple
 from pathlib import Path
 from src.config.app_config import AppConfig
+from src.services.sqlite_store import SQLiteStore
+
+# Markers in the write-behind queue: no data change queued / file to be deleted
+_UNSET = object()
+_DELETE = object()
 
 
 class StorageService:
@@ -10,6 +20,21 @@ class StorageService:
     def __init__(self):
         AppConfig.ensure_storage_dir()
         self._storage_dir = AppConfig.STORAGE_DIR
+        # Services call in from worker threads as well as the UI thread
+        self._lock = threading.RLock()
+        self._record_store: Optional[SQLiteStore] = None
+        # filename -> (mtime_ns, size, parsed data), least recently used first
+        self._cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # Write-behind queue: filename -> [data or a marker, lines to append].
+        # _writing holds the batch the writer thread is working through.
+        self._pending: Dict[str, list] = {}
+        self._writing: Dict[str, list] = {}
+        self._write_cond = threading.Condition(self._lock)
+        self._flush_requested = False
+        self._writer: Optional[threading.Thread] = None
+        self._write_stats = {"queued": 0, "coalesced": 0, "written": 0, "failed": 0}
 
     @classmethod
     def get_instance(cls) -> "StorageService":
@@ -17,40 +42,410 @@ class StorageService:
             cls._instance = cls()
         return cls._instance
 
+    def get_record_store(self) -> Optional[SQLiteStore]:
+        """The SQLite engine when enabled, else None (records live in JSON files)."""
+        if AppConfig.STORAGE_ENGINE != "sqlite":
+            return None
+
+        with self._lock:
+            if self._record_store is None:
+                store = SQLiteStore.get_instance()
+                store.migrate_from_json(self)
+                self._record_store = store
+        return self._record_store
+
     def _get_file_path(self, filename: str) -> Path:
         return self._storage_dir / filename
 
-    def save(self, filename: str, data: Any) -> bool:
+    @classmethod
+    def _clone(cls, value: Any) -> Any:
+        # JSON data only holds dicts, lists and immutable scalars, so this is
+        # a much cheaper deep copy than copy.deepcopy
+        if isinstance(value, dict):
+            return {key: cls._clone(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._clone(item) for item in value]
+        return value
+
+    def _cache_put(self, filename: str, stat: os.stat_result, data: Any) -> None:
+        self._cache_evict(filename)
+        if stat.st_size > AppConfig.STORAGE_CACHE_MAX_BYTES:
+            return
+
+        self._cache[filename] = (stat.st_mtime_ns, stat.st_size, data)
+        self._cache_bytes += stat.st_size
+
+        while (
+            len(self._cache) > AppConfig.STORAGE_CACHE_MAX_ENTRIES
+            or self._cache_bytes > AppConfig.STORAGE_CACHE_MAX_BYTES
+        ):
+            _, (_, size, _) = self._cache.popitem(last=False)
+            self._cache_bytes -= size
+            self._cache_stats["evictions"] += 1
+
+    def _cache_evict(self, filename: str) -> None:
+        entry = self._cache.pop(filename, None)
+        if entry:
+            self._cache_bytes -= entry[1]
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._cache_stats)
+            stats["entries"] = len(self._cache)
+            stats["bytes"] = self._cache_bytes
+        return stats
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def _write_file(self, filename: str, data: Any) -> os.stat_result:
+        """Replace ``filename`` atomically so a crash never leaves it torn."""
+        file_path = self._get_file_path(filename)
+        tmp_path = file_path.with_name(f".{filename}.{threading.get_ident()}.tmp")
         try:
-            file_path = self._get_file_path(filename)
-            with open(file_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        return file_path.stat()
+
+    def _append_lines(self, filename: str, lines: List[str]) -> None:
+        with open(self._get_file_path(filename), "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+            f.flush()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="pyraksha-storage", daemon=True
+            )
+            self._writer.start()
+
+    def _queue_write(
+        self, filename: str, data: Any = _UNSET, line: Optional[str] = None
+    ) -> None:
+        # Caller holds self._lock
+        entry = self._pending.get(filename)
+        if entry is None:
+            entry = self._pending[filename] = [_UNSET, []]
+        elif data is not _UNSET:
+            self._write_stats["coalesced"] += 1
+
+        if data is not _UNSET:
+            # A full replace or delete supersedes anything queued before it
+            entry[0] = data
+            entry[1] = []
+        if line is not None:
+            entry[1].append(line)
+
+        self._write_stats["queued"] += 1
+        self._ensure_writer()
+        self._write_cond.notify_all()
+
+    def _queued_data(self, filename: str) -> Any:
+        """Newest data not yet on disk, _DELETE, or _UNSET if there is none."""
+        for queue in (self._pending, self._writing):
+            entry = queue.get(filename)
+            if entry is not None and entry[0] is not _UNSET:
+                return entry[0]
+        return _UNSET
+
+    def _queued_lines(self, filename: str) -> Tuple[bool, List[str]]:
+        """Lines not yet on disk, and whether the file itself is being replaced."""
+        lines: List[str] = []
+        for queue in (self._pending, self._writing):
+            entry = queue.get(filename)
+            if entry is None:
+                continue
+            lines[:0] = entry[1]
+            if entry[0] is not _UNSET:
+                return True, lines
+        return False, lines
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._write_cond.wait()
+
+                # Let further saves of the same files pile up into one write
+                deadline = time.monotonic() + AppConfig.STORAGE_WRITE_DELAY
+                while not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._write_cond.wait(remaining)
+
+                batch, self._pending = self._pending, {}
+                self._writing = batch
+                self._flush_requested = False
+
+            self._write_batch(batch)
+
+            with self._lock:
+                self._writing = {}
+                self._write_cond.notify_all()
+
+    def _write_batch(self, batch: Dict[str, list]) -> None:
+        # Saves before deletes: the SOS snapshot must land before its journal
+        # is dropped, whatever order the two were queued in
+        ordered = sorted(batch.items(), key=lambda item: item[1][0] is _DELETE)
+
+        for filename, (data, lines) in ordered:
+            try:
+                stat = None
+                if data is _DELETE:
+                    file_path = self._get_file_path(filename)
+                    if file_path.exists():
+                        file_path.unlink()
+                elif data is not _UNSET:
+                    stat = self._write_file(filename, data)
+
+                # Appends and the hand-over happen under the lock, so readers
+                # never see a line both on disk and still queued
+                with self._lock:
+                    if lines:
+                        self._append_lines(filename, lines)
+                    del batch[filename]
+                    if stat is not None and filename not in self._pending:
+                        self._cache_put(filename, stat, data)
+                    self._write_stats["written"] += 1
+            except Exception as e:
+                print(f"Storage write error for {filename}: {e}")
+                with self._lock:
+                    entry = batch.pop(filename, None)
+                    if entry is not None:
+                        self._requeue(filename, entry)
+
+    def _requeue(self, filename: str, entry: list) -> None:
+        newer = self._pending.get(filename)
+        if newer is None:
+            self._pending[filename] = entry
+        elif newer[0] is _UNSET:
+            newer[0] = entry[0]
+            newer[1][:0] = entry[1]
+        self._write_stats["failed"] += 1
+
+    def flush(self, timeout: Optional[float] = AppConfig.STORAGE_FLUSH_TIMEOUT) -> bool:
+        """Block until every queued write is on disk; False if it timed out."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._pending or self._writing:
+                self._flush_requested = True
+                self._write_cond.notify_all()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    print("Storage flush timed out")
+                    return False
+                self._write_cond.wait(remaining)
+        return True
+
+    def get_write_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._write_stats)
+            stats["pending"] = len(self._pending) + len(self._writing)
+        return stats
+
+    def save(self, filename: str, data: Any) -> bool:
+        if AppConfig.STORAGE_WRITE_BEHIND:
+            with self._lock:
+                self._cache_evict(filename)
+                self._queue_write(filename, self._clone(data))
+            return True
+
+        try:
+            with self._lock:
+                stat = self._write_file(filename, data)
+                self._cache_put(filename, stat, self._clone(data))
             return True
         except Exception as e:
             print(f"Storage save error: {e}")
+            with self._lock:
+                self._cache_evict(filename)
             return False
 
     def load(self, filename: str) -> Optional[Any]:
         try:
             file_path = self._get_file_path(filename)
-            if not file_path.exists():
-                return None
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with self._lock:
+                queued = self._queued_data(filename)
+                if queued is not _UNSET:
+                    return None if queued is _DELETE else self._clone(queued)
+
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    self._cache_evict(filename)
+                    return None
+
+                entry = self._cache.get(filename)
+                if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    self._cache.move_to_end(filename)
+                    self._cache_stats["hits"] += 1
+                    return self._clone(entry[2])
+
+                self._cache_stats["misses"] += 1
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._cache_put(filename, stat, data)
+                return self._clone(data)
         except Exception as e:
             print(f"Storage load error: {e}")
             return None
 
     def delete(self, filename: str) -> bool:
+        if AppConfig.STORAGE_WRITE_BEHIND:
+            with self._lock:
+                self._cache_evict(filename)
+                self._queue_write(filename, _DELETE)
+            return True
+
         try:
             file_path = self._get_file_path(filename)
-            if file_path.exists():
-                file_path.unlink()
+            with self._lock:
+                self._cache_evict(filename)
+                if file_path.exists():
+                    file_path.unlink()
             return True
         except Exception as e:
             print(f"Storage delete error: {e}")
             return False
 
+    def append_record(self, filename: str, record: Any) -> bool:
+        """Append one JSON line; cost does not depend on the file's size."""
+        try:
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+            with self._lock:
+                if AppConfig.STORAGE_WRITE_BEHIND:
+                    self._queue_write(filename, line=line + "\n")
+                else:
+                    self._append_lines(filename, [line + "\n"])
+            return True
+        except Exception as e:
+            print(f"Storage append error: {e}")
+            return False
+
+    def load_records(self, filename: str) -> List[Any]:
+        records = []
+        try:
+            file_path = self._get_file_path(filename)
+            with self._lock:
+                replaced, lines = self._queued_lines(filename)
+                if not replaced and file_path.exists():
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        lines[:0] = f.readlines()
+
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A crash mid-append leaves a torn last line
+                    print(f"Skipping corrupt record in {filename}")
+        except Exception as e:
+            print(f"Storage load error: {e}")
+        return records
+
     def exists(self, filename: str) -> bool:
+        with self._lock:
+            queued = self._queued_data(filename)
+            _, lines = self._queued_lines(filename)
+        if lines:
+            return True
+        if queued is not _UNSET:
+            return queued is not _DELETE
         file_path = self._get_file_path(filename)
         return file_path.exists()
+
+    def get_sync_cursor(self, collection: str) -> Optional[str]:
+        cursors = self.load(AppConfig.SYNC_CURSORS_FILE) or {}
+        return cursors.get(collection)
+
+    def set_sync_cursor(self, collection: str, cursor: Optional[str]) -> bool:
+        with self._lock:
+            cursors = self.load(AppConfig.SYNC_CURSORS_FILE) or {}
+            if cursor:
+                cursors[collection] = cursor
+            else:
+                cursors.pop(collection, None)
+            return self.save(AppConfig.SYNC_CURSORS_FILE, cursors)
+
+    def clear_sync_cursors(self) -> bool:
+        return self.delete(AppConfig.SYNC_CURSORS_FILE)
+
+    def enqueue_outbox(
+        self, kind: str, key: str, payload: dict, owner: Optional[str] = None
+    ) -> bool:
+        """Persist a pending backend mutation to be replayed in order later.
+
+        ``owner`` is the user the mutation belongs to; it is only replayed
+        while that user is signed in.
+        """
+        with self._lock:
+            outbox = self.load(AppConfig.OUTBOX_FILE) or []
+
+            last = outbox[-1] if outbox else None
+            if (
+                kind == "sos_locations"
+                and last
+                and last["kind"] == kind
+                and last["key"] == key
+                and last.get("owner") == owner
+            ):
+                # Consecutive fixes of one SOS travel as a single batch
+                last["payload"]["locations"].extend(payload["locations"])
+            else:
+                outbox.append(
+                    {
+                        "id": uuid.uuid4().hex,
+                        "kind": kind,
+                        "key": key,
+                        "payload": payload,
+                        "owner": owner,
+                        "created_at": time.time(),
+                    }
+                )
+
+            return self.save(AppConfig.OUTBOX_FILE, outbox)
+
+    def peek_outbox(
+        self, limit: Optional[int] = None, owner: Optional[str] = None
+    ) -> List[dict]:
+        outbox = self.load(AppConfig.OUTBOX_FILE) or []
+        if owner is not None:
+            # Entries queued before owners were recorded go to whoever signs in
+            outbox = [
+                entry for entry in outbox if entry.get("owner") in (None, owner)
+            ]
+        return outbox[:limit] if limit else outbox
+
+    def complete_outbox(self, entry: dict) -> bool:
+        """Drop a replayed entry, keeping any fixes appended to it meanwhile."""
+        with self._lock:
+            outbox = self.load(AppConfig.OUTBOX_FILE) or []
+            for index, stored in enumerate(outbox):
+                if stored["id"] != entry["id"]:
+                    continue
+
+                sent = entry["payload"].get("locations")
+                queued = stored["payload"].get("locations")
+                if sent is not None and len(queued) > len(sent):
+                    stored["payload"]["locations"] = queued[len(sent) :]
+                else:
+                    del outbox[index]
+                break
+            else:
+                return True
+
+            if not outbox:
+                return self.delete(AppConfig.OUTBOX_FILE)
+            return self.save(AppConfig.OUTBOX_FILE, outbox)
+
+    def has_outbox_entries(self, key: str) -> bool:
+        return any(entry["key"] == key for entry in self.peek_outbox())
@@ -1,4 +1,8 @@
 from kivy.utils import platform
+from src.utils.lazy_import import lazy_import
+
+jnius = lazy_import("jnius")
+plyer = lazy_import("plyer")
 
 
 class WidgetManager:
@@ -19,16 +23,13 @@ class WidgetManager:
         """
         if platform == "android":
             try:
-                from plyer import notification
-                from jnius import autoclass
-
                 # Create ongoing notification with action button
-                PythonActivity = autoclass("org.kivy.android.PythonActivity")
-                Intent = autoclass("android.content.Intent")
-                PendingIntent = autoclass("android.app.PendingIntent")
+                PythonActivity = jnius.autoclass("org.kivy.android.PythonActivity")
+                Intent = jnius.autoclass("android.content.Intent")
+                PendingIntent = jnius.autoclass("android.app.PendingIntent")
 
                 # This creates a persistent notification users can tap
-                notification.notify(
+                plyer.notification.notify(
                     title="PyRaksha SOS Ready",
                     message="Tap to trigger emergency SOS",
                     app_name="PyRaksha",
@@ -18,7 +18,11 @@ class SessionManager:
         return cls._instance
 
     def save_session(self, user: User) -> bool:
-        session_data = {"user": user.to_dict(), "timestamp": datetime.now().isoformat()}
+        session_data = {
+            "user": user.to_dict(),
+            "token": getattr(user, "token", None),
+            "timestamp": datetime.now().isoformat(),
+        }
         return self._storage.save(AppConfig.SESSION_FILE, session_data)
 
     def load_session(self) -> Optional[User]:
@@ -36,6 +40,7 @@ class SessionManager:
                 return None
 
             user = User.from_dict(session_data["user"])
+            user.token = session_data.get("token")
             return user
         except Exception as e:
             print(f"Failed to load session: {e}")
@@ -43,6 +48,8 @@ class SessionManager:
             return None
 
     def clear_session(self) -> bool:
+        # Delta-sync cursors are only valid for the user who synced them
+        self._storage.clear_sync_cursors()
         return self._storage.delete(AppConfig.SESSION_FILE)
 
     def is_session_valid(self) -> bool:
@@ -0,0 +1,49 @@
+from typing import Optional, Sequence
+from kivy.graphics import Color, RoundedRectangle, Ellipse, Line
+
+
+class CanvasReuseMixin:
+    """Background and border instructions created once and updated in place.
+
+    Clearing ``canvas.before`` and re-adding instructions on every pos/size
+    change allocates new graphics objects each layout pass; here only their
+    ``pos``/``size``/``rgba`` change.
+    """
+
+    def _init_background(
+        self, rgba: Sequence[float], radius: Optional[float] = None, ellipse=False
+    ) -> None:
+        with self.canvas.before:
+            self._bg_color = Color(*rgba)
+            if ellipse:
+                self._bg_shape = Ellipse(pos=self.pos, size=self.size)
+            else:
+                self._bg_shape = RoundedRectangle(
+                    pos=self.pos, size=self.size, radius=[radius or 0]
+                )
+        self._border = None
+        self.bind(pos=self._sync_canvas, size=self._sync_canvas)
+
+    def _init_border(self, rgba: Sequence[float], radius: float, width: float) -> None:
+        """Add an outline drawn above the background, hidden until shown."""
+        self._border_rgba = list(rgba)
+        self._border_radius = radius
+        with self.canvas.before:
+            self._border_color = Color(*self._border_rgba[:3], 0)
+            self._border = Line(rounded_rectangle=self._border_rect(), width=width)
+
+    def _border_rect(self) -> tuple:
+        return (self.x, self.y, self.width, self.height, self._border_radius)
+
+    def _sync_canvas(self, *args) -> None:
+        self._bg_shape.pos = self.pos
+        self._bg_shape.size = self.size
+        if self._border is not None:
+            self._border.rounded_rectangle = self._border_rect()
+
+    def _set_background_rgba(self, rgba: Sequence[float]) -> None:
+        self._bg_color.rgba = rgba
+
+    def _set_border_visible(self, visible: bool) -> None:
+        alpha = self._border_rgba[3] if visible else 0
+        self._border_color.rgba = self._border_rgba[:3] + [alpha]
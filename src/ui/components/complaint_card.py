@@ -1,16 +1,34 @@
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.graphics import Color, RoundedRectangle
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from src.core.theme import Theme
 from src.models.complaint import Complaint
+from src.ui.components.canvas_mixin import CanvasReuseMixin
 
+CARD_HEIGHT = 150
 
-class ComplaintCard(BoxLayout):
-    def __init__(self, complaint: Complaint, **kwargs):
+
+def complaint_card_data(complaint: Complaint) -> dict:
+    """RecycleView data entry rendered by ComplaintCardView."""
+    return {
+        "title": complaint.title,
+        "description": complaint.description[:100]
+        + ("..." if len(complaint.description) > 100 else ""),
+        "date": complaint.get_formatted_date(),
+        "status": complaint.get_status_display(),
+    }
+
+
+class ComplaintCardView(RecycleDataViewBehavior, CanvasReuseMixin, BoxLayout):
+    """Complaint card for a RecycleView; one instance is rebound per visible row."""
+
+    index = None
+
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = "vertical"
         self.size_hint_y = None
-        self.height = 150
+        self.height = CARD_HEIGHT
         self.padding = [
             Theme.spacing_lg,
             Theme.spacing_lg,
@@ -19,13 +37,9 @@ class ComplaintCard(BoxLayout):
         ]  # [left, top, right, bottom]
         self.spacing = Theme.spacing_sm
 
-        self._complaint = complaint
-
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        self._update_canvas()
+        self._init_background(Theme.surface_elevated, radius=Theme.card_radius)
 
-        title_label = Label(
-            text=complaint.title,
+        self.title_label = Label(
             font_size=Theme.font_size_lg,
             bold=True,
             color=Theme.text_primary,
@@ -34,11 +48,9 @@ class ComplaintCard(BoxLayout):
             halign="left",
             valign="bottom",  # Changed from middle to bottom
         )
-        title_label.bind(size=title_label.setter("text_size"))
+        self.title_label.bind(size=self.title_label.setter("text_size"))
 
-        description_label = Label(
-            text=complaint.description[:100]
-            + ("..." if len(complaint.description) > 100 else ""),
+        self.description_label = Label(
             font_size=Theme.font_size_sm,
             color=Theme.text_secondary,
             size_hint_y=None,
@@ -46,37 +58,37 @@ class ComplaintCard(BoxLayout):
             halign="left",
             valign="top",
         )
-        description_label.bind(size=description_label.setter("text_size"))
+        self.description_label.bind(size=self.description_label.setter("text_size"))
 
         footer_layout = BoxLayout(orientation="horizontal", size_hint_y=None, height=24)
 
-        date_label = Label(
-            text=complaint.get_formatted_date(),
+        self.date_label = Label(
             font_size=Theme.font_size_sm,
             color=Theme.text_disabled,
             halign="left",
             valign="middle",
         )
-        date_label.bind(size=date_label.setter("text_size"))
+        self.date_label.bind(size=self.date_label.setter("text_size"))
 
-        status_label = Label(
-            text=complaint.get_status_display(),
+        self.status_label = Label(
             font_size=Theme.font_size_sm,
             color=Theme.accent,
             halign="right",
             valign="middle",
         )
-        status_label.bind(size=status_label.setter("text_size"))
+        self.status_label.bind(size=self.status_label.setter("text_size"))
 
-        footer_layout.add_widget(date_label)
-        footer_layout.add_widget(status_label)
+        footer_layout.add_widget(self.date_label)
+        footer_layout.add_widget(self.status_label)
 
-        self.add_widget(title_label)
-        self.add_widget(description_label)
+        self.add_widget(self.title_label)
+        self.add_widget(self.description_label)
         self.add_widget(footer_layout)
 
-    def _update_canvas(self, *args):
-        self.canvas.before.clear()
-        with self.canvas.before:
-            Color(*Theme.surface_elevated)
-            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self.title_label.text = data["title"]
+        self.description_label.text = data["description"]
+        self.date_label.text = data["date"]
+        self.status_label.text = data["status"]
+
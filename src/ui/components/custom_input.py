@@ -1,10 +1,11 @@
 from kivy.uix.textinput import TextInput
-from kivy.graphics import Color, RoundedRectangle, Line, Rectangle
+from kivy.graphics import Color, Rectangle
 from kivy.core.text import Label as CoreLabel
 from src.core.theme import Theme
+from src.ui.components.canvas_mixin import CanvasReuseMixin
 
 
-class CustomInput(TextInput):
+class CustomInput(CanvasReuseMixin, TextInput):
     def __init__(self, hint_text: str = "", password: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.hint_text = hint_text
@@ -27,67 +28,51 @@ class CustomInput(TextInput):
         self.selection_color = Theme.accent[:3] + [0.3]
         self.cursor_width = 2
 
-        # Bind to updates
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        self.bind(text=self._update_canvas)
-        self.bind(focus=self._update_canvas)
+        self._init_background(Theme.surface_elevated, radius=Theme.card_radius)
+        self._init_border(Theme.accent, radius=Theme.card_radius, width=2)
 
-        self._update_canvas()
+        # Text shown while defocused; the label is only re-rendered when the
+        # text, hint or focus changes, never on a plain move or resize
+        with self.canvas.after:
+            self._overlay_color = Color(*Theme.text_primary)
+            self._overlay = Rectangle(size=(0, 0))
 
-    def _update_canvas(self, *args):
-        self.canvas.before.clear()
-        self.canvas.after.clear()
+        self.bind(pos=self._place_overlay, size=self._place_overlay)
+        self.bind(
+            text=self._render_overlay,
+            hint_text=self._render_overlay,
+            password=self._render_overlay,
+        )
+        self.bind(focus=self._on_focus_changed)
 
-        with self.canvas.before:
-            # Background
-            Color(*Theme.surface_elevated)
-            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
+        self._render_overlay()
 
-            # Border when focused
-            if self.focus:
-                Color(*Theme.accent)
-                Line(
-                    rounded_rectangle=(
-                        self.x,
-                        self.y,
-                        self.width,
-                        self.height,
-                        Theme.card_radius,
-                    ),
-                    width=2,
-                )
+    def _on_focus_changed(self, *args):
+        self._set_border_visible(self.focus)
+        self._render_overlay()
+
+    def _render_overlay(self, *args):
+        if self.focus:
+            self._overlay.texture = None
+            self._overlay.size = (0, 0)
+            return
 
-        # Handle text display
         if self.text:
-            # When there's text but not focused, manually render it
-            if not self.focus:
-                with self.canvas.after:
-                    Color(*Theme.text_primary)
-                    display_text = "*" * len(self.text) if self.password else self.text
-                    label = CoreLabel(text=display_text, font_size=self.font_size)
-                    label.refresh()
-                    texture = label.texture
-                    Rectangle(
-                        texture=texture,
-                        size=texture.size,
-                        pos=(
-                            self.x + Theme.spacing_md,
-                            self.y + (self.height - texture.height) / 2,
-                        ),
-                    )
+            self._overlay_color.rgba = Theme.text_primary
+            display_text = "*" * len(self.text) if self.password else self.text
         else:
             # Show placeholder when empty and not focused
-            if not self.focus:
-                with self.canvas.after:
-                    Color(*Theme.text_secondary)
-                    label = CoreLabel(text=self.hint_text, font_size=self.font_size)
-                    label.refresh()
-                    texture = label.texture
-                    Rectangle(
-                        texture=texture,
-                        size=texture.size,
-                        pos=(
-                            self.x + Theme.spacing_md,
-                            self.y + (self.height - texture.height) / 2,
-                        ),
-                    )
+            self._overlay_color.rgba = Theme.text_secondary
+            display_text = self.hint_text
+
+        label = CoreLabel(text=display_text, font_size=self.font_size)
+        label.refresh()
+        self._overlay.texture = label.texture
+        self._overlay.size = label.texture.size
+        self._place_overlay()
+
+    def _place_overlay(self, *args):
+        self._overlay.pos = (
+            self.x + Theme.spacing_md,
+            self.y + (self.height - self._overlay.size[1]) / 2,
+        )
@@ -1,10 +1,15 @@
+from collections import OrderedDict
 from kivy.uix.textinput import TextInput
-from kivy.graphics import Color, RoundedRectangle, Line, Rectangle
+from kivy.graphics import Color, Rectangle
 from kivy.core.text import Label as CoreLabel
 from src.core.theme import Theme
+from src.ui.components.canvas_mixin import CanvasReuseMixin
 
+# Rendered previews kept per text area; covers hint + text at a few widths
+_TEXTURE_CACHE_SIZE = 4
 
-class CustomTextArea(TextInput):
+
+class CustomTextArea(CanvasReuseMixin, TextInput):
     def __init__(self, hint_text: str = "", **kwargs):
         super().__init__(**kwargs)
         self.hint_text = hint_text
@@ -24,75 +29,74 @@ class CustomTextArea(TextInput):
         self.selection_color = Theme.accent[:3] + [0.3]
         self.cursor_width = 2
 
-        # Bind to updates
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        self.bind(text=self._update_canvas)
-        self.bind(focus=self._update_canvas)
-
-        self._update_canvas()
-
-    def _update_canvas(self, *args):
-        self.canvas.before.clear()
-        self.canvas.after.clear()
-
-        with self.canvas.before:
-            # Background
-            Color(*Theme.surface_elevated)
-            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
-
-            # Border when focused
-            if self.focus:
-                Color(*Theme.accent)
-                Line(
-                    rounded_rectangle=(
-                        self.x,
-                        self.y,
-                        self.width,
-                        self.height,
-                        Theme.card_radius,
-                    ),
-                    width=2,
-                )
-
-        # Handle text display when defocused
-        if self.text and not self.focus:
-            with self.canvas.after:
-                Color(*Theme.text_primary)
-                # For multiline, we need to handle text wrapping
-                label = CoreLabel(
-                    text=self.text,
-                    font_size=self.font_size,
-                    text_size=(
-                        self.width - 2 * Theme.spacing_md,
-                        None,
-                    ),  # Enable wrapping
-                )
-                label.refresh()
-                texture = label.texture
-                Rectangle(
-                    texture=texture,
-                    size=texture.size,
-                    pos=(
-                        self.x + Theme.spacing_md,
-                        self.y + self.height - texture.height - Theme.spacing_md,
-                    ),
-                )
-        elif not self.text and not self.focus:
+        self._init_background(Theme.surface_elevated, radius=Theme.card_radius)
+        self._init_border(Theme.accent, radius=Theme.card_radius, width=2)
+
+        # (text, wrap width, font size) -> rendered texture, most recent last
+        self._texture_cache: "OrderedDict[tuple, object]" = OrderedDict()
+
+        # Persistent overlay showing the wrapped text while defocused
+        with self.canvas.after:
+            self._overlay_color = Color(*Theme.text_primary)
+            self._overlay = Rectangle(size=(0, 0))
+
+        self.bind(pos=self._place_overlay, size=self._on_size_changed)
+        self.bind(text=self._render_overlay, hint_text=self._render_overlay)
+        self.bind(focus=self._on_focus_changed)
+
+        self._render_overlay()
+
+    def _on_focus_changed(self, *args):
+        self._set_border_visible(self.focus)
+        self._render_overlay()
+
+    def _on_size_changed(self, *args):
+        # Only a new wrapping width needs new text; height just moves it
+        if self._overlay.texture is not None:
+            self._render_overlay()
+        else:
+            self._place_overlay()
+
+    def _wrapped_texture(self, text: str):
+        width = max(self.width - 2 * Theme.spacing_md, 1)
+        key = (text, width, self.font_size)
+        texture = self._texture_cache.get(key)
+        if texture is not None:
+            self._texture_cache.move_to_end(key)
+            return texture
+
+        label = CoreLabel(
+            text=text, font_size=self.font_size, text_size=(width, None)
+        )  # Enable wrapping
+        label.refresh()
+        texture = label.texture
+
+        self._texture_cache[key] = texture
+        if len(self._texture_cache) > _TEXTURE_CACHE_SIZE:
+            self._texture_cache.popitem(last=False)
+        return texture
+
+    def _render_overlay(self, *args):
+        # Typing happens while focused, so keystrokes never rasterize here
+        if self.focus or not (self.text or self.hint_text):
+            self._overlay.texture = None
+            self._overlay.size = (0, 0)
+            return
+
+        if self.text:
+            self._overlay_color.rgba = Theme.text_primary
+            texture = self._wrapped_texture(self.text)
+        else:
             # Show placeholder
-            with self.canvas.after:
-                Color(*Theme.text_secondary)
-                label = CoreLabel(
-                    text=self.hint_text,
-                    font_size=self.font_size,
-                    text_size=(self.width - 2 * Theme.spacing_md, None),
-                )
-                label.refresh()
-                texture = label.texture
-                Rectangle(
-                    texture=texture,
-                    size=texture.size,
-                    pos=(
-                        self.x + Theme.spacing_md,
-                        self.y + self.height - texture.height - Theme.spacing_md,
-                    ),
-                )
+            self._overlay_color.rgba = Theme.text_secondary
+            texture = self._wrapped_texture(self.hint_text)
+
+        self._overlay.texture = texture
+        self._overlay.size = texture.size
+        self._place_overlay()
+
+    def _place_overlay(self, *args):
+        self._overlay.pos = (
+            self.x + Theme.spacing_md,
+            self.y + self.height - self._overlay.size[1] - Theme.spacing_md,
+        )
@@ -1,11 +1,11 @@
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.graphics import Color, RoundedRectangle
 from src.core.theme import Theme
 from src.models.location import Location
+from src.ui.components.canvas_mixin import CanvasReuseMixin
 
 
-class LocationDisplay(BoxLayout):
+class LocationDisplay(CanvasReuseMixin, BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = "vertical"
@@ -14,8 +14,7 @@ class LocationDisplay(BoxLayout):
         self.padding = Theme.spacing_md
         self.spacing = Theme.spacing_sm
 
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        self._update_canvas()
+        self._init_background(Theme.surface_elevated, radius=Theme.card_radius)
 
         self._location_label = Label(
             text="Location: Not available",
@@ -48,9 +47,3 @@ class LocationDisplay(BoxLayout):
         else:
             self._location_label.text = "Location: Not available"
             self._accuracy_label.text = "Accuracy: --"
-
-    def _update_canvas(self, *args):
-        self.canvas.before.clear()
-        with self.canvas.before:
-            Color(*Theme.surface_elevated)
-            RoundedRectangle(pos=self.pos, size=self.size, radius=[Theme.card_radius])
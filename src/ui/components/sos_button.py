@@ -1,10 +1,10 @@
 from kivy.uix.button import Button
-from kivy.graphics import Color, Ellipse
 from kivy.animation import Animation
 from src.core.theme import Theme
+from src.ui.components.canvas_mixin import CanvasReuseMixin
 
 
-class SOSButton(Button):
+class SOSButton(CanvasReuseMixin, Button):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -22,14 +22,7 @@ class SOSButton(Button):
         self._is_pulsing = False
         self._pulse_anim = None
 
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        self._update_canvas()
-
-    def _update_canvas(self, *args):
-        self.canvas.before.clear()
-        with self.canvas.before:
-            Color(*Theme.danger)
-            Ellipse(pos=self.pos, size=self.size)
+        self._init_background(Theme.danger, ellipse=True)
 
     def start_pulse(self):
         if self._is_pulsing:
@@ -51,11 +44,8 @@ class SOSButton(Button):
         self.opacity = 1.0
 
     def on_press(self):
-        self.canvas.before.clear()
-        with self.canvas.before:
-            darker = [c * 0.7 for c in Theme.danger[:3]] + [Theme.danger[3]]
-            Color(*darker)
-            Ellipse(pos=self.pos, size=self.size)
+        darker = [c * 0.7 for c in Theme.danger[:3]] + [Theme.danger[3]]
+        self._set_background_rgba(darker)
 
     def on_release(self):
-        self._update_canvas()
+        self._set_background_rgba(Theme.danger)
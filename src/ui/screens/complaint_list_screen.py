@@ -1,12 +1,17 @@
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.graphics import Color, Rectangle
 from src.core.theme import Theme
 from src.core.navigation import NavigationManager
 from src.ui.components.custom_button import CustomButton
-from src.ui.components.complaint_card import ComplaintCard
+from src.ui.components.complaint_card import (
+    CARD_HEIGHT,
+    ComplaintCardView,
+    complaint_card_data,
+)
 from src.state.app_state import AppState
 from src.services.complaint_service import ComplaintService
 from src.config.constants import ScreenNames
@@ -56,22 +61,31 @@ class ComplaintListScreen(Screen):
         header_layout.add_widget(title_label)
         header_layout.add_widget(back_button)
 
-        self.scroll_view = ScrollView()
+        self.message_label = Label(
+            font_size=Theme.font_size_md,
+            color=Theme.text_secondary,
+            size_hint_y=None,
+            height=0,
+        )
 
-        self.complaints_layout = BoxLayout(
+        # Only the visible cards exist; they are rebound as the list scrolls
+        self.recycle_view = RecycleView(viewclass=ComplaintCardView)
+        self.complaints_layout = RecycleBoxLayout(
             orientation="vertical",
             padding=[Theme.spacing_xl, 0, Theme.spacing_xl, Theme.spacing_xl],
             spacing=Theme.spacing_md,
+            default_size=(None, CARD_HEIGHT),
+            default_size_hint=(1, None),
             size_hint_y=None,
         )
         self.complaints_layout.bind(
             minimum_height=self.complaints_layout.setter("height")
         )
-
-        self.scroll_view.add_widget(self.complaints_layout)
+        self.recycle_view.add_widget(self.complaints_layout)
 
         main_container.add_widget(header_layout)
-        main_container.add_widget(self.scroll_view)
+        main_container.add_widget(self.message_label)
+        main_container.add_widget(self.recycle_view)
 
         self.add_widget(main_container)
 
@@ -79,45 +93,42 @@ class ComplaintListScreen(Screen):
         self.rect.pos = self.pos
         self.rect.size = self.size
 
-    def _load_complaints(self):
-        self.complaints_layout.clear_widgets()
+    def _show_message(self, text: str) -> None:
+        self.message_label.text = text
+        self.message_label.height = 100 if text else 0
 
+    def _load_complaints(self):
         app_state = AppState.get_instance()
         if not app_state.current_user:
-            no_user_label = Label(
-                text="User not authenticated",
-                font_size=Theme.font_size_md,
-                color=Theme.text_secondary,
-                size_hint_y=None,
-                height=100,
-            )
-            self.complaints_layout.add_widget(no_user_label)
+            self.recycle_view.data = []
+            self._show_message("User not authenticated")
             return
 
         complaint_service = ComplaintService.get_instance()
-        complaints = complaint_service.get_user_complaints(
-            app_state.current_user.user_id
+        complaint_service.get_user_complaints_async(
+            app_state.current_user.user_id, callback=self._show_complaints
         )
 
-        if not complaints:
-            no_complaints_label = Label(
-                text="No complaints filed yet",
-                font_size=Theme.font_size_md,
-                color=Theme.text_secondary,
-                size_hint_y=None,
-                height=100,
-            )
-            self.complaints_layout.add_widget(no_complaints_label)
-        else:
-            complaints.sort(key=lambda c: c.timestamp, reverse=True)
-
-            for complaint in complaints:
-                card = ComplaintCard(complaint=complaint)
-                self.complaints_layout.add_widget(card)
+    def _show_complaints(self, complaints):
+        complaints.sort(key=lambda c: c.timestamp, reverse=True)
+        self._show_message("" if complaints else "No complaints filed yet")
+        self.recycle_view.data = [complaint_card_data(c) for c in complaints]
 
     def _on_back(self, instance):
         nav_manager = NavigationManager.get_instance()
         nav_manager.go_back()
 
+    def _on_complaints_refreshed(self):
+        # Fresh data arrived from the backend while the list was showing
+        self._load_complaints()
+
     def on_enter(self, *args):
+        ComplaintService.get_instance().add_refresh_listener(
+            self._on_complaints_refreshed
+        )
         self._load_complaints()
+
+    def on_leave(self, *args):
+        ComplaintService.get_instance().remove_refresh_listener(
+            self._on_complaints_refreshed
+        )
@@ -88,8 +88,10 @@ class ComplaintScreen(Screen):
             height=30,
         )
 
-        submit_button = CustomButton(text="Submit Complaint", bg_color=Theme.primary)
-        submit_button.bind(on_release=self._on_submit)
+        self.submit_button = CustomButton(
+            text="Submit Complaint", bg_color=Theme.primary
+        )
+        self.submit_button.bind(on_release=self._on_submit)
 
         back_button = CustomButton(
             text="Back", bg_color=Theme.surface_elevated, text_color=Theme.text_primary
@@ -103,7 +105,7 @@ class ComplaintScreen(Screen):
         main_layout.add_widget(self.title_input)
         main_layout.add_widget(description_container)
         main_layout.add_widget(self.error_label)
-        main_layout.add_widget(submit_button)
+        main_layout.add_widget(self.submit_button)
         main_layout.add_widget(back_button)
         main_layout.add_widget(Label(size_hint_y=None, height=50))
 
@@ -115,6 +117,9 @@ class ComplaintScreen(Screen):
         self.rect.size = self.size
 
     def _on_submit(self, instance):
+        if self.submit_button.disabled:
+            return
+
         self.error_label.text = ""
 
         title = self.title_input.text.strip()
@@ -125,12 +130,26 @@ class ComplaintScreen(Screen):
             self.error_label.text = "User not authenticated"
             return
 
+        self.submit_button.disabled = True
         complaint_service = ComplaintService.get_instance()
-        success, message, complaint = complaint_service.file_complaint(
-            app_state.current_user.user_id, title, description
+        complaint_service.file_complaint_async(
+            app_state.current_user.user_id,
+            title,
+            description,
+            callback=self._on_submit_result,
+            on_error=self._on_submit_error,
         )
 
+    def _on_submit_error(self, error):
+        self.submit_button.disabled = False
+        self.error_label.text = "Could not file complaint, please try again"
+
+    def _on_submit_result(self, result):
+        self.submit_button.disabled = False
+        success, message, complaint = result
+
         if success and complaint:
+            app_state = AppState.get_instance()
             app_state.add_complaint(complaint)
             nav_manager = NavigationManager.get_instance()
             nav_manager.navigate_to(ScreenNames.COMPLAINT_LIST)
@@ -61,8 +61,8 @@ class LoginScreen(Screen):
             height=30,
         )
 
-        login_button = CustomButton(text="Login", bg_color=Theme.primary)
-        login_button.bind(on_release=self._on_login)
+        self.login_button = CustomButton(text="Login", bg_color=Theme.primary)
+        self.login_button.bind(on_release=self._on_login)
 
         register_layout = BoxLayout(
             orientation="horizontal",
@@ -94,7 +94,7 @@ class LoginScreen(Screen):
         main_layout.add_widget(self.email_input)
         main_layout.add_widget(self.password_input)
         main_layout.add_widget(self.error_label)
-        main_layout.add_widget(login_button)
+        main_layout.add_widget(self.login_button)
         main_layout.add_widget(Label(size_hint_y=None, height=20))
         main_layout.add_widget(register_layout)
         main_layout.add_widget(Label(size_hint_y=None, height=50))
@@ -107,13 +107,30 @@ class LoginScreen(Screen):
         self.rect.size = self.size
 
     def _on_login(self, instance):
+        if self.login_button.disabled:
+            return
+
         self.error_label.text = ""
 
         email = self.email_input.text.strip()
         password = self.password_input.text
 
+        self.login_button.disabled = True
         auth_service = AuthService.get_instance()
-        success, message, user = auth_service.login(email, password)
+        auth_service.login_async(
+            email,
+            password,
+            callback=self._on_login_result,
+            on_error=self._on_login_error,
+        )
+
+    def _on_login_error(self, error):
+        self.login_button.disabled = False
+        self.error_label.text = "Login failed, please try again"
+
+    def _on_login_result(self, result):
+        self.login_button.disabled = False
+        success, message, user = result
 
         if success and user:
             session_manager = SessionManager.get_instance()
@@ -9,6 +9,7 @@ from src.ui.components.custom_button import CustomButton
 from src.state.app_state import AppState
 from src.state.session_manager import SessionManager
 from src.services.auth_service import AuthService
+from src.services.complaint_service import ComplaintService
 from src.config.constants import ScreenNames
 
 
@@ -132,6 +133,8 @@ class ProfileScreen(Screen):
     def _on_logout(self, instance):
         session_manager = SessionManager.get_instance()
         session_manager.clear_session()
+        AuthService.get_instance().end_session()
+        ComplaintService.get_instance().invalidate_cache()
 
         app_state = AppState.get_instance()
         app_state.clear_all()
@@ -64,8 +64,8 @@ class RegisterScreen(Screen):
             height=30,
         )
 
-        register_button = CustomButton(text="Register", bg_color=Theme.primary)
-        register_button.bind(on_release=self._on_register)
+        self.register_button = CustomButton(text="Register", bg_color=Theme.primary)
+        self.register_button.bind(on_release=self._on_register)
 
         login_layout = BoxLayout(
             orientation="horizontal",
@@ -100,7 +100,7 @@ class RegisterScreen(Screen):
         main_layout.add_widget(self.password_input)
         main_layout.add_widget(self.confirm_password_input)
         main_layout.add_widget(self.error_label)
-        main_layout.add_widget(register_button)
+        main_layout.add_widget(self.register_button)
         main_layout.add_widget(Label(size_hint_y=None, height=20))
         main_layout.add_widget(login_layout)
         main_layout.add_widget(Label(size_hint_y=None, height=30))
@@ -113,6 +113,9 @@ class RegisterScreen(Screen):
         self.rect.size = self.size
 
     def _on_register(self, instance):
+        if self.register_button.disabled:
+            return
+
         self.error_label.text = ""
 
         name = self.name_input.text.strip()
@@ -125,8 +128,24 @@ class RegisterScreen(Screen):
             self.error_label.text = "Passwords do not match"
             return
 
+        self.register_button.disabled = True
         auth_service = AuthService.get_instance()
-        success, message, user = auth_service.register(name, email, phone, password)
+        auth_service.register_async(
+            name,
+            email,
+            phone,
+            password,
+            callback=self._on_register_result,
+            on_error=self._on_register_error,
+        )
+
+    def _on_register_error(self, error):
+        self.register_button.disabled = False
+        self.error_label.text = "Registration failed, please try again"
+
+    def _on_register_result(self, result):
+        self.register_button.disabled = False
+        success, message, user = result
 
         if success:
             nav_manager = NavigationManager.get_instance()
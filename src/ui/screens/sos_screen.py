@@ -11,6 +11,7 @@ from src.ui.components.location_display import LocationDisplay
 from src.state.app_state import AppState
 from src.services.sos_service import SOSService
 from src.services.location_service import LocationService
+from src.services.sos_pipeline import SOSPipeline
 from src.config.constants import ScreenNames
 
 
@@ -19,6 +20,7 @@ class SOSScreen(Screen):
         super().__init__(**kwargs)
         self.name = ScreenNames.SOS
         self._update_event = None
+        self._resolving = False
 
         with self.canvas.before:
             Color(*Theme.background)
@@ -35,7 +37,7 @@ class SOSScreen(Screen):
         )
         main_layout.bind(minimum_height=main_layout.setter("height"))
 
-        status_label = Label(
+        self.status_label = Label(
             text="SOS ACTIVE",
             font_size=Theme.font_size_xxl,
             bold=True,
@@ -44,7 +46,7 @@ class SOSScreen(Screen):
             height=60,
         )
 
-        info_label = Label(
+        self.info_label = Label(
             text="Emergency services have been notified",
             font_size=Theme.font_size_md,
             color=Theme.text_secondary,
@@ -83,8 +85,8 @@ class SOSScreen(Screen):
         )
 
         main_layout.add_widget(Label(size_hint_y=None, height=50))
-        main_layout.add_widget(status_label)
-        main_layout.add_widget(info_label)
+        main_layout.add_widget(self.status_label)
+        main_layout.add_widget(self.info_label)
         main_layout.add_widget(Label(size_hint_y=None, height=30))
         main_layout.add_widget(self.timer_label)
         main_layout.add_widget(Label(size_hint_y=None, height=20))
@@ -109,26 +111,30 @@ class SOSScreen(Screen):
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     def _update_sos_info(self, dt):
-        sos_service = SOSService.get_instance()
-        active_sos = sos_service.get_active_sos()
+        # Memory reads only: uploads and file writes run on the SOS pipeline
+        active_sos = SOSService.get_instance().get_active_sos()
 
         if active_sos:
             duration = active_sos.get_duration_seconds()
             self.timer_label.text = f"Duration: {self._format_duration(duration)}"
 
-            location_service = LocationService.get_instance()
-            current_location = location_service.get_current_location()
-
-            if current_location:
-                self.location_display.update_location(current_location)
-                sos_service.update_location(current_location)
+            latest = SOSPipeline.get_instance().get_snapshot()["latest_location"]
+            if latest:
+                self.location_display.update_location(latest)
         else:
             nav_manager = NavigationManager.get_instance()
             nav_manager.reset_to_home()
 
     def _on_resolve(self, instance):
-        sos_service = SOSService.get_instance()
-        success, message = sos_service.resolve_sos()
+        if self._resolving:
+            return
+
+        self._resolving = True
+        SOSPipeline.get_instance().resolve(callback=self._on_resolve_result)
+
+    def _on_resolve_result(self, result):
+        self._resolving = False
+        success, message = result or (False, "Resolve failed")
 
         if success:
             app_state = AppState.get_instance()
@@ -140,18 +146,56 @@ class SOSScreen(Screen):
     def on_enter(self, *args):
         app_state = AppState.get_instance()
         sos_service = SOSService.get_instance()
-        location_service = LocationService.get_instance()
 
         if not sos_service.get_active_sos():
             if app_state.current_user:
-                success, message, sos = sos_service.trigger_sos(
-                    app_state.current_user.user_id
+                self._show_status("ACTIVATING SOS...", "Contacting emergency services")
+                sos_service.trigger_sos_async(
+                    app_state.current_user.user_id,
+                    callback=self._on_trigger_result,
+                    on_error=self._on_trigger_error,
                 )
-                if success and sos:
-                    app_state.set_sos(sos)
-                    location_service.start_tracking()
-
-        self._update_event = Clock.schedule_interval(self._update_sos_info, 1)
+                # The tick would bounce back home before the SOS exists
+                return
+
+        self._show_status("SOS ACTIVE", "Emergency services have been notified")
+        self._start_updates()
+
+    def _show_status(self, status: str, info: str) -> None:
+        self.status_label.text = status
+        self.info_label.text = info
+
+    def _on_trigger_result(self, result):
+        success, message, sos = result
+        # An SOS that was already active comes back with success False
+        if not sos:
+            self._on_trigger_failed(message)
+            return
+
+        AppState.get_instance().set_sos(sos)
+        LocationService.get_instance().start_tracking()
+        self._show_status("SOS ACTIVE", "Emergency services have been notified")
+
+        if self.manager and self.manager.current == self.name:
+            self._start_updates()
+
+    def _on_trigger_error(self, error):
+        self._on_trigger_failed(f"SOS trigger failed: {error}")
+
+    def _on_trigger_failed(self, message: str) -> None:
+        print(message)
+        self._show_status("SOS NOT SENT", message)
+        if self.manager and self.manager.current == self.name:
+            # Long enough to read, then back to the SOS button to retry
+            Clock.schedule_once(
+                lambda dt: NavigationManager.get_instance().reset_to_home(), 3
+            )
+
+    def _start_updates(self):
+        # The pipeline receives fixes from LocationService until the SOS ends
+        SOSPipeline.get_instance().attach()
+        if self._update_event is None:
+            self._update_event = Clock.schedule_interval(self._update_sos_info, 1)
 
     def on_leave(self, *args):
         if self._update_event:
@@ -1,12 +1,8 @@
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from src.core.theme import Theme
-from src.core.navigation import NavigationManager
-from src.state.session_manager import SessionManager
-from src.state.app_state import AppState
 from src.config.constants import ScreenNames
 
 
@@ -51,19 +47,3 @@ class SplashScreen(Screen):
     def _update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-
-    def on_enter(self, *args):
-        Clock.schedule_once(self._check_session, 2)
-
-    def _check_session(self, dt):
-        session_manager = SessionManager.get_instance()
-        user = session_manager.load_session()
-
-        app_state = AppState.get_instance()
-        nav_manager = NavigationManager.get_instance()
-
-        if user:
-            app_state.set_user(user)
-            nav_manager.navigate_to(ScreenNames.HOME)
-        else:
-            nav_manager.navigate_to(ScreenNames.LOGIN)
@@ -0,0 +1,44 @@
+from types import ModuleType
+from typing import Optional
+from src.utils.startup_tracer import StartupTracer
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._error: Optional[ImportError] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is not None:
+            return self._module
+        if self._error is not None:
+            raise self._error
+
+        try:
+            self._module = StartupTracer.get_instance().import_module(self._name)
+        except ImportError as e:
+            self._error = e
+            raise
+        return self._module
+
+    def is_available(self) -> bool:
+        try:
+            self._load()
+            return True
+        except ImportError:
+            return False
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Defer importing ``name`` (e.g. jnius, plyer) until it is first used."""
+    return LazyModule(name)
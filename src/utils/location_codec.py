@@ -0,0 +1,174 @@
+import base64
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+_VERSION = 1
+_FLAG_NAIVE = 0x01
+_COORD_SCALE = 1_000_000  # fixed point, 1e-6 degrees (~0.11 m)
+_ACCURACY_SCALE = 10  # decimetres
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+class LocationCodecError(ValueError):
+    pass
+
+
+class LocationCodec:
+    """Compact binary encoding for batches of location dicts.
+
+    Layout: version byte, flags byte, varint fix count, then per fix the
+    zigzag varint deltas of latitude, longitude (1e-6 degrees) and timestamp
+    (ms) from the previous fix, followed by the accuracy in decimetres plus
+    one (0 = unknown). The first fix is a delta from zero.
+
+    Lossy by design: coordinates round to 1e-6 degrees, timestamps to the
+    millisecond and accuracy to 0.1 m; keys other than the four fields of
+    ``Location.to_dict`` are dropped. Naive timestamps are sent as wall-clock
+    time and decoded naive, so the receiver's time zone does not matter.
+    """
+
+    ENCODING = "delta-varint-v1"
+
+    @staticmethod
+    def _write_varint(out: bytearray, value: int) -> None:
+        if value < 0:
+            raise LocationCodecError(f"Cannot encode negative varint {value}")
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    @staticmethod
+    def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+        value = 0
+        shift = 0
+        while True:
+            if pos >= len(data):
+                raise LocationCodecError("Truncated location batch")
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, pos
+            shift += 7
+
+    @staticmethod
+    def _zigzag(value: int) -> int:
+        return value * 2 if value >= 0 else -value * 2 - 1
+
+    @staticmethod
+    def _unzigzag(value: int) -> int:
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    @staticmethod
+    def _to_ms(timestamp: datetime, naive: bool) -> int:
+        if naive:
+            return (timestamp - _EPOCH) // _MILLISECOND
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.astimezone()
+        return (timestamp - _EPOCH_UTC) // _MILLISECOND
+
+    @staticmethod
+    def _coordinate(location: Dict[str, Any], key: str, limit: float) -> int:
+        value = location.get(key)
+        if (
+            not isinstance(value, (int, float))
+            or not math.isfinite(value)
+            or abs(value) > limit
+        ):
+            raise LocationCodecError(f"Invalid {key}: {value!r}")
+        return round(value * _COORD_SCALE)
+
+    @staticmethod
+    def _accuracy(location: Dict[str, Any]) -> int:
+        """Accuracy in decimetres plus one; 0 means unknown."""
+        value: Optional[float] = location.get("accuracy")
+        if value is None:
+            return 0
+        if not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+            raise LocationCodecError(f"Invalid accuracy: {value!r}")
+        return round(value * _ACCURACY_SCALE) + 1
+
+    @staticmethod
+    def _timestamp(location: Dict[str, Any]) -> datetime:
+        timestamp = location.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp)
+            except ValueError as e:
+                raise LocationCodecError(f"Invalid timestamp: {e}") from e
+        if not isinstance(timestamp, datetime):
+            raise LocationCodecError("Every fix needs a timestamp")
+        return timestamp
+
+    @classmethod
+    def encode(cls, locations: List[Dict[str, Any]]) -> bytes:
+        """Raises ``LocationCodecError`` for any fix the format cannot carry."""
+        timestamps = [cls._timestamp(location) for location in locations]
+        naive = all(timestamp.tzinfo is None for timestamp in timestamps)
+
+        out = bytearray((_VERSION, _FLAG_NAIVE if naive else 0))
+        cls._write_varint(out, len(locations))
+
+        prev_lat = prev_lon = prev_ms = 0
+        for location, timestamp in zip(locations, timestamps):
+            lat = cls._coordinate(location, "latitude", 90)
+            lon = cls._coordinate(location, "longitude", 180)
+            ms = cls._to_ms(timestamp, naive)
+
+            cls._write_varint(out, cls._zigzag(lat - prev_lat))
+            cls._write_varint(out, cls._zigzag(lon - prev_lon))
+            cls._write_varint(out, cls._zigzag(ms - prev_ms))
+            cls._write_varint(out, cls._accuracy(location))
+            prev_lat, prev_lon, prev_ms = lat, lon, ms
+
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> List[Dict[str, Any]]:
+        if len(data) < 2 or data[0] != _VERSION:
+            raise LocationCodecError("Unsupported location batch")
+        naive = bool(data[1] & _FLAG_NAIVE)
+        epoch = _EPOCH if naive else _EPOCH_UTC
+        count, pos = cls._read_varint(data, 2)
+
+        locations = []
+        lat = lon = ms = 0
+        for _ in range(count):
+            delta, pos = cls._read_varint(data, pos)
+            lat += cls._unzigzag(delta)
+            delta, pos = cls._read_varint(data, pos)
+            lon += cls._unzigzag(delta)
+            delta, pos = cls._read_varint(data, pos)
+            ms += cls._unzigzag(delta)
+            accuracy, pos = cls._read_varint(data, pos)
+
+            locations.append(
+                {
+                    "latitude": lat / _COORD_SCALE,
+                    "longitude": lon / _COORD_SCALE,
+                    "timestamp": (epoch + ms * _MILLISECOND).isoformat(),
+                    "accuracy": (
+                        None if accuracy == 0 else (accuracy - 1) / _ACCURACY_SCALE
+                    ),
+                }
+            )
+
+        if pos != len(data):
+            raise LocationCodecError("Trailing bytes after location batch")
+        return locations
+
+    @classmethod
+    def encode_b64(cls, locations: List[Dict[str, Any]]) -> str:
+        return base64.b64encode(cls.encode(locations)).decode("ascii")
+
+    @classmethod
+    def decode_b64(cls, text: str) -> List[Dict[str, Any]]:
+        try:
+            data = base64.b64decode(text, validate=True)
+        except ValueError as e:
+            raise LocationCodecError(f"Invalid base64: {e}") from e
+        return cls.decode(data)
@@ -0,0 +1,157 @@
+import builtins
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Optional, Dict, List, Any
+from src.config.app_config import AppConfig
+
+
+class StartupTracer:
+    """Records import and service construction times during startup.
+
+    Off unless PYRAKSHA_TRACE_STARTUP is set (or AppConfig.TRACE_STARTUP is
+    True); when off, ``span`` is a no-op and imports are not intercepted.
+    """
+
+    ENV_VAR = "PYRAKSHA_TRACE_STARTUP"
+
+    _instance: Optional["StartupTracer"] = None
+
+    def __init__(self):
+        self.enabled = False
+        self._started_at = time.perf_counter()
+        self._original_import = None
+        # Per-thread stack of child-time accumulators for imports in progress;
+        # startup stages import on worker threads at the same time
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._imports: Dict[str, Dict[str, float]] = {}
+        self._spans: Dict[str, float] = {}
+
+    @classmethod
+    def get_instance(cls) -> "StartupTracer":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def install_from_env(cls) -> "StartupTracer":
+        tracer = cls.get_instance()
+        if os.environ.get(cls.ENV_VAR) or AppConfig.TRACE_STARTUP:
+            tracer.enable()
+        return tracer
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._traced_import
+
+    def disable(self) -> None:
+        if self.enabled and builtins.__import__ == self._traced_import:
+            builtins.__import__ = self._original_import
+        self.enabled = False
+
+    def _traced_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        return self._timed(
+            name, self._original_import, name, globals, locals, fromlist, level
+        )
+
+    def import_module(self, name: str) -> ModuleType:
+        """``importlib.import_module`` that shows up in the report.
+
+        ``importlib`` does not go through ``builtins.__import__``, so lazily
+        loaded modules (screens, platform bindings) must come through here.
+        """
+        if not self.enabled or name in sys.modules:
+            return importlib.import_module(name)
+        return self._timed(name, importlib.import_module, name)
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _timed(self, name: str, load, *args):
+        stack = self._stack()
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return load(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.record_import(name, elapsed, elapsed - children)
+
+    def record_import(self, name: str, total: float, self_time: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._imports.setdefault(name, {"total_ms": 0.0, "self_ms": 0.0})
+            entry["total_ms"] += total * 1000
+            entry["self_ms"] += self_time * 1000
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block, e.g. constructing a service singleton."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._spans[name] = elapsed_ms
+
+    def get_report(self) -> Dict[str, Any]:
+        with self._lock:
+            recorded = {name: dict(times) for name, times in self._imports.items()}
+            spans = dict(self._spans)
+        imports = sorted(
+            ({"module": name, **times} for name, times in recorded.items()),
+            key=lambda entry: entry["self_ms"],
+            reverse=True,
+        )
+        return {
+            "elapsed_ms": (time.perf_counter() - self._started_at) * 1000,
+            "import_ms": sum(entry["self_ms"] for entry in imports),
+            "imports": imports,
+            "spans": spans,
+        }
+
+    def write_report(self) -> Optional[str]:
+        """Stop tracing and write the report to the storage directory."""
+        if not self.enabled:
+            return None
+        self.disable()
+
+        report = self.get_report()
+        path = AppConfig.STORAGE_DIR / AppConfig.STARTUP_TRACE_FILE
+        try:
+            AppConfig.ensure_storage_dir()
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except Exception as e:
+            print(f"Failed to write startup trace: {e}")
+            return None
+
+        print(f"Startup trace written to {path}")
+        for entry in report["imports"][:10]:
+            print(f"  {entry['self_ms']:8.1f} ms  {entry['module']}")
+        for name, elapsed in report["spans"].items():
+            print(f"  {elapsed:8.1f} ms  {name}")
+        return str(path)
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SyncHelper:
+    @staticmethod
+    def merge_by_id(
+        local: List[T],
+        incoming: Iterable[T],
+        key: Callable[[T], str],
+        deleted_ids: Iterable[str] = (),
+    ) -> List[T]:
+        """Overlay backend records onto the local list, keeping local-only ones."""
+        deleted = set(deleted_ids)
+        positions: Dict[str, int] = {}
+        merged: List[T] = []
+
+        for item in local:
+            item_id = key(item)
+            if item_id in deleted:
+                continue
+            positions[item_id] = len(merged)
+            merged.append(item)
+
+        for item in incoming:
+            item_id = key(item)
+            if item_id in deleted:
+                continue
+            if item_id in positions:
+                merged[positions[item_id]] = item
+            else:
+                positions[item_id] = len(merged)
+                merged.append(item)
+
+        return merged
+
+    @staticmethod
+    def next_cursor(
+        response: Dict[str, Any],
+        records: Iterable[Dict[str, Any]],
+        previous: Optional[str] = None,
+    ) -> Optional[str]:
+        """Pick the cursor for the next delta request.
+
+        The backend's own ``cursor`` wins. Otherwise fall back to the highest
+        ``updated_at`` seen, which only moves forward. Without either there is
+        nothing safe to resume from, so the previous cursor is kept.
+        """
+        cursor = response.get("cursor") or response.get("next_cursor")
+        if cursor:
+            return str(cursor)
+
+        high_water = previous
+        for record in records:
+            updated_at = record.get("updated_at")
+            if updated_at and (high_water is None or str(updated_at) > high_water):
+                high_water = str(updated_at)
+        return high_water
@@ -0,0 +1,90 @@
+from typing import List, Sequence
+from src.models.location import Location
+from src.models.location_track import LocationTrack
+
+
+class TrajectorySimplifier:
+    """Time-aware Douglas–Peucker simplification of location tracks.
+
+    A point's error is its synchronized distance: how far it lies from where
+    the simplified track says the user was at that same moment (linear
+    interpolation between the kept neighbours by timestamp). Keeping that
+    under the tolerance preserves both the path and when it was travelled,
+    so stops and speed changes survive.
+    """
+
+    @staticmethod
+    def _interpolate(a: Location, b: Location, point: Location) -> Location:
+        span = (b.timestamp - a.timestamp).total_seconds()
+        if span <= 0:
+            ratio = 0.0
+        else:
+            ratio = (point.timestamp - a.timestamp).total_seconds() / span
+        return Location(
+            latitude=a.latitude + (b.latitude - a.latitude) * ratio,
+            longitude=a.longitude + (b.longitude - a.longitude) * ratio,
+            timestamp=point.timestamp,
+        )
+
+    @classmethod
+    def synchronized_distance(
+        cls, a: Location, b: Location, point: Location
+    ) -> float:
+        return point.distance_to(cls._interpolate(a, b, point))
+
+    @classmethod
+    def simplify(
+        cls, track: Sequence[Location], tolerance_m: float
+    ) -> List[Location]:
+        """Subset of ``track`` whose synchronized error stays within tolerance."""
+        if len(track) <= 2 or tolerance_m <= 0:
+            return list(track)
+        if isinstance(track, LocationTrack):
+            # Materialize once; the inner loop reads every point repeatedly
+            track = track.to_locations()
+
+        keep = [False] * len(track)
+        keep[0] = keep[-1] = True
+        # Explicit stack: multi-hour tracks would exceed the recursion limit
+        stack = [(0, len(track) - 1)]
+
+        while stack:
+            first, last = stack.pop()
+            worst_index, worst_distance = -1, tolerance_m
+            for index in range(first + 1, last):
+                distance = cls.synchronized_distance(
+                    track[first], track[last], track[index]
+                )
+                if distance > worst_distance:
+                    worst_index, worst_distance = index, distance
+
+            if worst_index != -1:
+                keep[worst_index] = True
+                stack.append((first, worst_index))
+                stack.append((worst_index, last))
+
+        return [point for point, kept in zip(track, keep) if kept]
+
+    @classmethod
+    def max_deviation(
+        cls, original: Sequence[Location], simplified: Sequence[Location]
+    ) -> float:
+        """Largest synchronized distance of an original point, in metres."""
+        if len(simplified) < 2:
+            return 0.0
+
+        worst = 0.0
+        segment = 0
+        for point in original:
+            while (
+                segment < len(simplified) - 2
+                and point.timestamp > simplified[segment + 1].timestamp
+            ):
+                segment += 1
+            worst = max(
+                worst,
+                cls.synchronized_distance(
+                    simplified[segment], simplified[segment + 1], point
+                ),
+            )
+        return worst
@@ -0,0 +1,130 @@
+import math
+import random
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from src.models.location import Location
+from src.services.gps_sampling import AdaptiveSamplingController, simulate
+
+_START = datetime(2026, 1, 1, 12, 0, 0)
+_METRES_PER_DEGREE = 111_320.0
+
+
+def _trace(
+    segments: List[Tuple[int, float]], accuracy: float = 8.0, seed: int = 7
+) -> List[Location]:
+    """1 Hz trace of ``(seconds, speed m/s)`` segments heading north-east.
+
+    Each fix gets Gaussian noise with sigma accuracy / 2 on both axes.
+    """
+    rng = random.Random(seed)
+    north = east = 0.0
+    trace = []
+    t = 0
+    for seconds, speed in segments:
+        for _ in range(seconds):
+            north += speed * math.cos(math.radians(45))
+            east += speed * math.sin(math.radians(45))
+            noisy_north = north + rng.gauss(0, accuracy / 2)
+            noisy_east = east + rng.gauss(0, accuracy / 2)
+            trace.append(
+                Location(
+                    latitude=19.0 + noisy_north / _METRES_PER_DEGREE,
+                    longitude=72.8
+                    + noisy_east / (_METRES_PER_DEGREE * math.cos(math.radians(19))),
+                    timestamp=_START + timedelta(seconds=t),
+                    accuracy=accuracy,
+                )
+            )
+            t += 1
+    return trace
+
+
+def _controller() -> AdaptiveSamplingController:
+    return AdaptiveSamplingController(
+        min_interval=1,
+        max_interval=30,
+        burst_seconds=60,
+        motion_window=30,
+        min_dwell=20,
+        bad_accuracy=50,
+    )
+
+
+def test_steady_walk_stays_at_full_rate():
+    result = simulate(_trace([(3600, 1.3)]), _controller())
+
+    assert result["reconfigurations"] == 0
+    assert result["final_interval"] == 1
+
+
+def test_stationary_backs_off_to_max_interval():
+    result = simulate(_trace([(3600, 0.0)]), _controller())
+
+    assert result["final_interval"] == 30
+    # 1 -> 2 -> 4 -> 8 -> 16 -> 30, and no noise-driven resets afterwards
+    assert result["reconfigurations"] == 5
+    assert result["estimated_energy_ratio"] < 0.1
+
+
+def test_mixed_trace_follows_motion_without_flapping():
+    trace = _trace([(600, 0.0), (600, 1.3), (600, 0.0), (600, 8.0), (600, 0.0)])
+    controller = _controller()
+    result = simulate(trace, controller)
+
+    # Backoff during each of the three stops, one reset for each movement
+    assert result["reconfigurations"] <= 3 * 5 + 2
+    assert result["final_interval"] == 30
+    assert result["estimated_energy_ratio"] < 0.5
+
+
+def test_interval_changes_respect_min_dwell():
+    controller = _controller()
+    controller.reset(now=0.0)
+    changes = []
+    for location in _trace([(300, 0.0), (300, 1.3), (300, 0.0)]):
+        now = (location.timestamp - _START).total_seconds()
+        if controller.on_fix(location, now=now) is not None:
+            changes.append(now)
+
+    gaps = [later - earlier for earlier, later in zip(changes, changes[1:])]
+    assert changes
+    assert all(gap >= 20 for gap in gaps)
+
+
+def test_movement_returns_to_full_rate():
+    controller = _controller()
+    simulate(_trace([(600, 0.0)]), controller)
+    assert controller.interval == 30
+
+    result = simulate(_trace([(600, 0.0), (300, 1.3)]), controller)
+    assert result["final_interval"] == 1
+
+
+def test_poor_accuracy_returns_to_full_rate():
+    controller = _controller()
+    simulate(_trace([(600, 0.0)]), controller)
+    assert controller.interval == 30
+
+    # Indoors: the device is still, but every fix is worse than bad_accuracy
+    poor_run = _trace([(300, 0.0)], accuracy=120, seed=3)
+    changes = []
+    for offset, location in enumerate(poor_run):
+        now = 10_000 + offset
+        if offset % controller.interval:
+            continue
+        if controller.on_fix(location, now=now) is not None:
+            changes.append(controller.interval)
+
+    assert changes == [1]
+    assert controller.interval == 1
+    assert not controller.moving
+
+
+def test_poor_accuracy_fixes_do_not_count_as_motion():
+    controller = _controller()
+    simulate(_trace([(600, 0.0)]), controller)
+
+    far_off = Location(latitude=19.5, longitude=73.2, accuracy=200)
+    controller.on_fix(far_off, now=10_000)
+    assert not controller.moving
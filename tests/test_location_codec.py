@@ -0,0 +1,117 @@
+import json
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.location import Location
+from src.utils.location_codec import LocationCodec, LocationCodecError
+
+_START = datetime(2026, 1, 1, 8, 30)
+
+
+def _walk(count: int, start: datetime = _START) -> list:
+    """A fix every 5 s, drifting a few metres north-east each time."""
+    return [
+        Location(
+            latitude=19.076 + index * 3.7e-5,
+            longitude=72.8777 + index * 2.9e-5,
+            timestamp=start + timedelta(seconds=5 * index),
+            accuracy=8.0 + index % 4,
+        ).to_dict()
+        for index in range(count)
+    ]
+
+
+def _assert_same_fixes(decoded: list, original: list) -> None:
+    assert len(decoded) == len(original)
+    for got, expected in zip(decoded, original):
+        assert got["latitude"] == pytest.approx(expected["latitude"], abs=1e-6)
+        assert got["longitude"] == pytest.approx(expected["longitude"], abs=1e-6)
+        assert got["timestamp"] == expected["timestamp"]
+        if expected["accuracy"] is None:
+            assert got["accuracy"] is None
+        else:
+            assert got["accuracy"] == pytest.approx(expected["accuracy"], abs=0.05)
+
+
+def test_round_trips_naive_timestamps():
+    fixes = _walk(20)
+    _assert_same_fixes(LocationCodec.decode_b64(LocationCodec.encode_b64(fixes)), fixes)
+
+
+def test_round_trips_aware_timestamps():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    fixes = _walk(20, start=_START.replace(tzinfo=ist))
+    decoded = LocationCodec.decode(LocationCodec.encode(fixes))
+
+    assert len(decoded) == len(fixes)
+    for got, expected in zip(decoded, fixes):
+        assert datetime.fromisoformat(got["timestamp"]) == datetime.fromisoformat(
+            expected["timestamp"]
+        )
+
+
+def test_missing_accuracy_decodes_as_none():
+    fixes = _walk(5)
+    fixes[2]["accuracy"] = None
+    fixes[3]["accuracy"] = 0.0
+
+    decoded = LocationCodec.decode(LocationCodec.encode(fixes))
+
+    assert decoded[2]["accuracy"] is None
+    assert decoded[3]["accuracy"] == 0.0
+    _assert_same_fixes(decoded, fixes)
+
+
+def test_truncated_batch_is_rejected():
+    data = LocationCodec.encode(_walk(5))
+    with pytest.raises(LocationCodecError):
+        LocationCodec.decode(data[:-2])
+
+
+def test_trailing_bytes_are_rejected():
+    data = LocationCodec.encode(_walk(5))
+    with pytest.raises(LocationCodecError):
+        LocationCodec.decode(data + b"\x00")
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("accuracy", -3.0),
+        ("accuracy", -0.05),
+        ("accuracy", math.nan),
+        ("latitude", math.nan),
+        ("longitude", math.inf),
+        ("latitude", 91.0),
+        ("latitude", None),
+        ("timestamp", "not-a-timestamp"),
+        ("timestamp", None),
+    ],
+)
+def test_bad_fixes_raise_codec_error(field, value):
+    fixes = _walk(3)
+    fixes[1][field] = value
+    with pytest.raises(LocationCodecError):
+        LocationCodec.encode(fixes)
+
+
+@pytest.mark.parametrize("batch_size", [5, 20])
+def test_compact_batch_is_ten_times_smaller_than_json(batch_size):
+    fixes = _walk(batch_size)
+    json_body = json.dumps({"sos_id": "sos-1", "locations": fixes})
+    compact_body = json.dumps(
+        {
+            "sos_id": "sos-1",
+            "encoding": LocationCodec.ENCODING,
+            "count": len(fixes),
+            "data": LocationCodec.encode_b64(fixes),
+        }
+    )
+    json_per_fix = len(json_body) / batch_size
+    compact_per_fix = len(LocationCodec.encode_b64(fixes)) / batch_size
+
+    assert json_per_fix / compact_per_fix >= 10
+    # Envelope included, the compact body still wins by a wide margin
+    assert len(json_body) / len(compact_body) >= 3
@@ -0,0 +1,96 @@
+import dataclasses
+
+import pytest
+
+from src.config.constants import SOSStatus
+from src.models.location import Location
+from src.models.location_track import LocationTrack, LocationView
+from src.models.sos import SOS
+
+from tests.tracks import make_fix
+
+
+def _fixes(count: int = 20):
+    return [make_fix(index) for index in range(count)]
+
+
+def test_indexing_round_trips_locations():
+    fixes = _fixes()
+    track = LocationTrack(fixes)
+
+    assert len(track) == len(fixes)
+    assert track[0] == fixes[0]
+    assert track[-1] == fixes[-1]
+    assert isinstance(track[3], Location)
+    assert track[7].accuracy is None
+
+
+def test_out_of_range_index_raises():
+    track = LocationTrack(_fixes(3))
+
+    with pytest.raises(IndexError):
+        track[3]
+    with pytest.raises(IndexError):
+        track[-4]
+
+
+def test_slices_are_tracks():
+    fixes = _fixes()
+    sliced = LocationTrack(fixes)[5:10]
+
+    assert isinstance(sliced, LocationTrack)
+    assert len(sliced) == 5
+    assert sliced[0] == fixes[5]
+
+
+def test_iteration_yields_views():
+    fixes = _fixes()
+    views = list(LocationTrack(fixes))
+
+    assert all(isinstance(view, LocationView) for view in views)
+    assert views[4].to_location() == fixes[4]
+    assert views[4].to_dict() == fixes[4].to_dict()
+    assert views[4].get_coordinates_string() == fixes[4].get_coordinates_string()
+
+
+def test_tracks_extend_from_views_and_tracks():
+    track = LocationTrack(_fixes())
+    copy = LocationTrack(iter(track))
+    joined = LocationTrack()
+    joined.extend(track)
+
+    assert copy == track
+    assert joined == track
+
+
+def test_columns_are_zero_copy_and_block_growth():
+    fixes = _fixes()
+    track = LocationTrack(fixes)
+    columns = track.columns()
+
+    assert columns["latitude"][2] == fixes[2].latitude
+    assert columns["epoch_ms"].format == "q"
+    with pytest.raises(BufferError):
+        track.append(fixes[0])
+
+    del columns
+    track.append(fixes[0])
+    assert len(track) == len(fixes) + 1
+
+
+def test_nbytes_counts_column_data():
+    assert LocationTrack(_fixes(100)).nbytes == 100 * 4 * 8
+
+
+def test_sos_uses_a_track_and_keeps_its_json_format():
+    fixes = _fixes()
+    sos = SOS(sos_id="s", user_id="u", status=SOSStatus.ACTIVE, location_history=fixes)
+
+    assert isinstance(sos.location_history, LocationTrack)
+    data = sos.to_dict()
+    assert data["location_history"] == [fix.to_dict() for fix in fixes]
+    assert SOS.from_dict(data) == sos
+
+    replaced = dataclasses.replace(sos, location_history=fixes[:2])
+    assert isinstance(replaced.location_history, LocationTrack)
+    assert replaced.get_latest_location() == fixes[1]
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from src.models.location import Location
+from src.models.location_track import LocationTrack
+from src.utils.trajectory import TrajectorySimplifier
+
+from tests.tracks import synthetic_track
+
+_START = datetime(2026, 1, 1)
+
+
+def _point(second: int, latitude: float, longitude: float = 72.8) -> Location:
+    return Location(
+        latitude=latitude,
+        longitude=longitude,
+        timestamp=_START + timedelta(seconds=second),
+        accuracy=5,
+    )
+
+
+def test_error_stays_within_tolerance():
+    track = synthetic_track()
+    for tolerance in (5, 10, 25):
+        simplified = TrajectorySimplifier.simplify(track, tolerance)
+        assert TrajectorySimplifier.max_deviation(track, simplified) <= tolerance
+
+
+def test_compresses_the_synthetic_hour():
+    track = synthetic_track()
+    simplified = TrajectorySimplifier.simplify(track, 10)
+
+    assert simplified[0] is track[0]
+    assert simplified[-1] is track[-1]
+    assert len(simplified) <= len(track) // 20
+
+
+def test_stop_on_a_straight_line_is_kept():
+    # Same path either way; only the timing reveals the stop
+    moving = [_point(second, 19.0 + second * 1e-5) for second in range(100)]
+    stopped = [_point(100 + second, moving[-1].latitude) for second in range(100)]
+    resumed = [
+        _point(200 + second, moving[-1].latitude + second * 1e-5)
+        for second in range(1, 100)
+    ]
+    track = moving + stopped + resumed
+
+    simplified = TrajectorySimplifier.simplify(track, 10)
+
+    assert len(simplified) > 2
+    assert TrajectorySimplifier.max_deviation(track, simplified) <= 10
+
+
+def test_short_tracks_and_zero_tolerance_are_untouched():
+    track = synthetic_track()[:50]
+
+    assert TrajectorySimplifier.simplify(track[:2], 10) == track[:2]
+    assert TrajectorySimplifier.simplify(track, 0) == track
+
+
+def test_accepts_a_location_track():
+    track = synthetic_track()
+    simplified = TrajectorySimplifier.simplify(LocationTrack(track), 10)
+
+    assert TrajectorySimplifier.max_deviation(track, simplified) <= 10
@@ -0,0 +1,47 @@
+"""Location tracks shared by the tests and the scripts/ benchmarks."""
+
+import math
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from src.models.location import Location
+
+
+_FIX_START = datetime(2026, 1, 1, 12)
+
+
+def make_fix(index: int) -> Location:
+    """The ``index``-th fix of a straight 1 Hz walk; every 7th has no accuracy."""
+    return Location(
+        latitude=19.0 + index * 1e-5,
+        longitude=72.8 + index * 1e-5,
+        timestamp=_FIX_START + timedelta(seconds=index),
+        accuracy=5.0 if index % 7 else None,
+    )
+
+
+def synthetic_track(seed: int = 1) -> List[Location]:
+    """One hour at 1 Hz along a slow curve, with a five-minute stop.
+
+    Each fix carries ~2 m of Gaussian jitter. This stands in for a recorded
+    SOS track; none ships with the repo.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    latitude, longitude = 19.0, 72.8
+    track = []
+    for second in range(3600):
+        # Stopped between minute 10 and minute 15
+        if not 600 < second < 900:
+            latitude += 1.2e-5 * math.cos(second / 400)
+            longitude += 1.2e-5 * math.sin(second / 400)
+        track.append(
+            Location(
+                latitude=latitude + rng.gauss(0, 2e-5),
+                longitude=longitude + rng.gauss(0, 2e-5),
+                timestamp=start + timedelta(seconds=second),
+                accuracy=5,
+            )
+        )
+    return track